@@ -146,3 +146,51 @@ def test_pycocotools():
     validator.is_coco = True
     download(f"{url}person_keypoints_val2017.json", dir=DATASETS_DIR / "coco8-pose/annotations")
     _ = validator.eval_json(validator.stats)
+
+
+@pytest.mark.skipif(not check_requirements("pycocotools", install=False), reason="pycocotools not installed")
+def test_coco_evaluator():
+    """Test the in-package COCO bbox evaluator against pycocotools on random annotations and predictions."""
+    import json
+
+    import numpy as np
+    from pycocotools.coco import COCO
+    from pycocotools.cocoeval import COCOeval
+
+    from ultralytics.utils.cocoeval import COCOEvaluator
+
+    rng = np.random.default_rng(0)
+    images, annotations, predictions = [{"id": i} for i in range(1, 41)], [], []
+    for image in images:
+        for _ in range(rng.integers(0, 10)):
+            xy, wh = rng.random(2) * 400, rng.random(2) * rng.choice([30, 90, 300]) + 2  # small, medium and large
+            c = int(rng.integers(1, 5))
+            annotations.append(
+                {
+                    "id": len(annotations) + 1,
+                    "image_id": image["id"],
+                    "category_id": c,
+                    "bbox": [*xy, *wh],
+                    "area": float(wh.prod() * rng.uniform(0.5, 1)),
+                    "iscrowd": int(rng.random() < 0.05),
+                }
+            )
+            for _ in range(rng.integers(0, 4)):  # duplicates and some wrong classes
+                box = np.r_[xy + rng.normal(0, 4, 2), wh * rng.uniform(0.7, 1.3, 2)]
+                cls = c if rng.random() < 0.8 else int(rng.integers(1, 5))
+                predictions.append(
+                    {"image_id": image["id"], "category_id": cls, "bbox": list(box), "score": rng.random()}
+                )
+    anno = {"images": images, "categories": [{"id": c} for c in range(1, 5)], "annotations": annotations}
+    with open(TMP / "coco_anno.json", "w") as f:
+        json.dump(anno, f)
+
+    coco = COCO(str(TMP / "coco_anno.json"))
+    val = COCOeval(coco, coco.loadRes(predictions), "bbox")
+    val.params.imgIds = list(range(1, 36))
+    val.evaluate()
+    val.accumulate()
+    val.summarize()
+    for workers in 0, 2:
+        stats = COCOEvaluator(anno, img_ids=list(range(1, 36))).evaluate(predictions, workers=workers)
+        assert np.allclose(stats, val.stats)
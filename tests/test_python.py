@@ -2,7 +2,7 @@
 
 import contextlib
 import urllib
-from copy import copy
+from copy import copy, deepcopy
 from pathlib import Path
 
 import cv2
@@ -14,8 +14,9 @@ from PIL import Image
 
 from tests import CFG, IS_TMP_WRITEABLE, MODEL, SOURCE, TMP
 from ultralytics import RTDETR, YOLO
-from ultralytics.cfg import MODELS, TASK2DATA, TASKS
+from ultralytics.cfg import MODELS, TASK2DATA, TASKS, check_cfg, get_cfg
 from ultralytics.data.build import load_inference_source
+from ultralytics.engine.results import Results
 from ultralytics.utils import (
     ASSETS,
     DEFAULT_CFG,
@@ -26,9 +27,10 @@ from ultralytics.utils import (
     WEIGHTS_DIR,
     WINDOWS,
     checks,
+    ops,
 )
 from ultralytics.utils.downloads import download
-from ultralytics.utils.torch_utils import TORCH_1_9
+from ultralytics.utils.torch_utils import TORCH_1_9, EarlyStopping
 
 
 def test_model_forward():
@@ -165,11 +167,240 @@ def test_track_stream():
         model.track(video_url, imgsz=160, tracker=tracker)
 
 
+def test_track_store():
+    """Test that BYTETracker keeps track IDs of moving boxes and reuses store slots of removed tracks."""
+    from types import SimpleNamespace
+
+    from ultralytics.trackers import BYTETracker
+    from ultralytics.utils import IterableSimpleNamespace
+
+    with open(ROOT / "cfg/trackers/bytetrack.yaml", encoding="utf-8") as f:
+        tracker = BYTETracker(IterableSimpleNamespace(**yaml.safe_load(f)), frame_rate=30)
+    xywh = np.array([[50.0, 50, 20, 20], [200, 100, 30, 40], [400, 300, 50, 20]])
+    for _ in range(5):
+        xywh[:, 0] += 5
+        out = tracker.update(SimpleNamespace(xywh=xywh, conf=np.full(3, 0.9), cls=np.zeros(3)))
+        assert out.shape == (3, 8) and out[:, 4].tolist() == [1, 2, 3]
+        np.testing.assert_allclose((out[:, :2] + out[:, 2:4]) / 2, xywh[:, :2], atol=2)
+    for _ in range(tracker.max_time_lost + 2):
+        tracker.update(SimpleNamespace(xywh=np.zeros((0, 4)), conf=np.zeros(0), cls=np.zeros(0)))
+    assert not tracker.tracked_stracks and not tracker.lost_stracks
+    assert len(tracker.store.free) == tracker.store.capacity
+
+    tracker.reset()  # a timed-out lost track can still be re-found on the next frame
+    box = np.array([[50.0, 50, 20, 20]])
+    empty = SimpleNamespace(xywh=np.zeros((0, 4)), conf=np.zeros(0), cls=np.zeros(0))
+    for _ in range(5):
+        tracker.update(SimpleNamespace(xywh=box, conf=np.full(1, 0.9), cls=np.zeros(1)))
+    for _ in range(tracker.max_time_lost + 1):
+        tracker.update(empty)
+    assert tracker.update(SimpleNamespace(xywh=box, conf=np.full(1, 0.9), cls=np.zeros(1)))[:, 4].tolist() == [1]
+
+    from ultralytics.trackers.bot_sort import BOTrack  # deprecated standalone tracks
+
+    track = BOTrack(np.array([50.0, 50, 20, 20, 0]), 0.9, 0, feat=np.ones(4))
+    track.activate(BOTrack.shared_kalman, frame_id=1)
+    track.predict()
+    track.update(BOTrack(np.array([55.0, 50, 20, 20, 0]), 0.8, 0, feat=np.ones(4)), frame_id=2)
+    assert track.is_activated and track.score == 0.8 and 50 < track.xywh[0] <= 55
+
+
+def test_tracker_manager():
+    """Test that TrackerManager tracks streams on worker threads with the same results as serial trackers."""
+    from types import SimpleNamespace
+
+    from ultralytics.trackers import BYTETracker, TrackerManager
+    from ultralytics.utils import IterableSimpleNamespace
+
+    with open(ROOT / "cfg/trackers/bytetrack.yaml", encoding="utf-8") as f:
+        cfg = IterableSimpleNamespace(**yaml.safe_load(f))
+    rng = np.random.default_rng(0)
+    xywh = rng.uniform(20, 600, (4, 10, 4))  # 4 streams of 10 boxes
+    frames = [
+        [SimpleNamespace(xywh=x + 3 * f, conf=np.full(10, 0.9), cls=np.zeros(10)) for x in xywh] for f in range(5)
+    ]
+    serial = [BYTETracker(cfg) for _ in range(4)]
+    manager = TrackerManager([BYTETracker(cfg) for _ in range(4)], workers=2)
+    for dets in frames:
+        for tracker, det, tracks in zip(serial, dets, manager.update(dets)):
+            np.testing.assert_array_equal(tracker.update(det), tracks)  # including IDs, counted per tracker
+    assert (manager.frames == 5).all() and "4 streams on 2 threads" in manager.summary()
+    manager.close()
+
+
+def test_botsort_reid_batch():
+    """Test that BOTSORT embeds detections in one batch per frame, skipping unambiguous IoU matches."""
+    from types import SimpleNamespace
+
+    from scipy.spatial.distance import cdist
+
+    from ultralytics.trackers import BOTSORT
+    from ultralytics.trackers.bot_sort import ReID
+    from ultralytics.trackers.utils.matching import embedding_distance
+    from ultralytics.utils import IterableSimpleNamespace
+
+    with open(ROOT / "cfg/trackers/botsort.yaml", encoding="utf-8") as f:
+        cfg = IterableSimpleNamespace(**{**yaml.safe_load(f), "gmc_method": "none"})
+    batches = []
+    tracker = BOTSORT(cfg)
+    tracker.encoder = ReID(lambda x: batches.append(len(x)) or x.mean((2, 3)) + 0.1, imgsz=(16, 8), device="cpu")
+    im = (np.random.default_rng(0).random((480, 640, 3)) * 255).astype(np.uint8)
+    xywh = np.array([[50, 50, 40, 80], [300, 100, 40, 80], [500, 300, 40, 80], [520, 320, 40, 80]], dtype=float)
+    for f in range(3):
+        tracker.update(SimpleNamespace(xywh=xywh + 2 * f, conf=np.full(4, 0.9), cls=np.zeros(4)), im)
+    assert batches == [4, 2, 2]  # two isolated boxes are only embedded on the first frame
+    assert tracker.store.smooth_feat[[t.slot for t in tracker.tracked_stracks]].any(1).all()
+
+    a, b = np.random.default_rng(1).random((2, 5, 8))
+    np.testing.assert_allclose(embedding_distance(a, b), cdist(a, b, "cosine"), atol=1e-6)
+
+
+def test_gmc_sparse_optflow():
+    """Test that sparse optical flow GMC tracks keypoints across frames and skips static frames."""
+    from ultralytics.trackers.utils.gmc import GMC
+
+    im = cv2.GaussianBlur((np.random.default_rng(0).random((400, 600)) * 255).astype(np.uint8), (0, 0), 2)
+    im = cv2.cvtColor(cv2.normalize(im, None, 0, 255, cv2.NORM_MINMAX), cv2.COLOR_GRAY2BGR)
+    gmc = GMC("sparseOptFlow", skip_thresh=0.5)
+    for i in range(5):
+        H = gmc.apply(im[:, 4 * i : 4 * i + 500])
+        np.testing.assert_allclose(H[:, 2], [-4, 0] if i else [0, 0], atol=0.5)
+    gmc.apply(im[:, 16:516])  # static frame
+    assert gmc.frames == 6 and gmc.skipped == 1 and gmc.detections == 1
+    assert "ms per frame" in gmc.summary()
+
+    gmc = GMC("sparseOptFlow", skip_thresh=10)  # 1px shifts are skipped and accumulate against the reference frame
+    H = [gmc.apply(im[:, i : i + 500])[0, 2] for i in range(5)]
+    assert gmc.skipped == 2 and H[1] == H[3] == 0
+    np.testing.assert_allclose([H[2], H[4]], [-2, -2], atol=0.5)
+
+
+def test_kalman_multi_update():
+    """Test that the batched Kalman filter correction step matches the per-track update."""
+    from ultralytics.trackers.utils.kalman_filter import KalmanFilterXYAH, KalmanFilterXYWH, profile_kalman
+
+    rng = np.random.default_rng(0)
+    for kf in KalmanFilterXYAH(), KalmanFilterXYWH():
+        xyah = np.c_[rng.uniform(0, 640, (16, 2)), rng.uniform(0.5, 2, 16), rng.uniform(10, 100, 16)]
+        mean, cov = kf.multi_predict(*map(np.asarray, zip(*[kf.initiate(x) for x in xyah])))
+        measurement = xyah + rng.normal(0, 1, xyah.shape)
+        batched = kf.multi_update(mean, cov, measurement)
+        for i, x in enumerate(zip(mean, cov, measurement)):
+            np.testing.assert_allclose(kf.update(*x)[0], batched[0][i], atol=1e-8)
+            np.testing.assert_allclose(kf.update(*x)[1], batched[1][i], atol=1e-8)
+    profile_kalman(n=(8,), steps=1)
+
+
+def test_gated_assignment():
+    """Test that sparse IoU and gated assignment equal the dense IoU matrix and dense LAPJV solution."""
+    import lap
+
+    from ultralytics.trackers.utils import matching
+    from ultralytics.utils.metrics import bbox_ioa
+
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 1000, (300, 2))
+    a = np.c_[xy, xy + rng.uniform(10, 80, (300, 2))].astype(np.float32)
+    b = a + rng.normal(0, 4, a.shape).astype(np.float32)
+    ious = matching.sparse_iou(a, b)
+    assert (ious == bbox_ioa(a, b, iou=True)).all()
+    cost = matching.fuse_score(1 - ious, rng.uniform(0.3, 1, len(b)))
+    for thresh in 0.5, 0.8:
+        _, x, y = lap.lapjv(cost, extend_cost=True, cost_limit=thresh)
+        assert all((i == j).all() for i, j in zip((x, y), matching.gated_lapjv(cost, thresh)))
+
+
 def test_val():
     """Test the validation mode of the YOLO model."""
     YOLO(MODEL).val(data="coco8.yaml", imgsz=32, save_hybrid=True)
 
 
+def test_val_batched_metrics():
+    """Test batched DetectionValidator metrics against the per-image path on random predictions."""
+    from types import SimpleNamespace
+
+    from ultralytics.models.yolo.detect import DetectionValidator
+
+    validators = []
+    for _ in range(2):
+        v = DetectionValidator(args=dict(plots=False))
+        v.data, v.device = {}, torch.device("cpu")
+        v.init_metrics(SimpleNamespace(names={0: "a", 1: "b", 2: "c"}))
+        validators.append(v)
+    torch.manual_seed(0)
+    for _ in range(4):
+        nl = torch.randint(0, 6, (4,))
+        bboxes = torch.cat([torch.rand(int(nl.sum()), 2) * 0.6 + 0.2, torch.rand(int(nl.sum()), 2) * 0.3 + 0.1], 1)
+        cls = torch.randint(0, 3, (len(bboxes), 1)).float()
+        batch = dict(
+            img=torch.zeros(4, 3, 64, 64),
+            batch_idx=torch.arange(4).repeat_interleave(nl).float(),
+            cls=cls,
+            bboxes=bboxes,
+            ratio_pad=[((0.5, 0.5), (0, 16))] * 4,
+            ori_shape=[(64, 128)] * 4,
+            im_file=[f"{i}.jpg" for i in range(4)],
+        )
+        boxes = ops.xywh2xyxy(bboxes) * 64
+        preds = [  # several noisy predictions per label
+            torch.cat([x.repeat(3, 1) + torch.randn(3 * len(x), 4) * 3, torch.rand(3 * len(x), 1), c.repeat(3, 1)], 1)
+            for x, c in zip(boxes.split(nl.tolist()), cls.split(nl.tolist()))
+        ]
+        validators[0].update_metrics([p.clone() for p in preds], batch)
+        validators[1].update_metrics_per_image([p.clone() for p in preds], batch)
+    for k, v in validators[0].stats.items():
+        assert torch.allclose(v.tensor().float(), validators[1].stats[k].tensor().float(), atol=1e-4)
+        assert v.offsets == validators[1].stats[k].offsets
+    assert validators[0].stats["tp"].tensor().any()
+    assert validators[0].get_stats() == validators[1].get_stats()
+
+
+def test_val_match_predictions():
+    """Test the torch-native greedy matcher against a per-threshold NumPy reference of the same matching."""
+    from ultralytics.models.yolo.detect import DetectionValidator
+
+    def reference(pred_classes, true_classes, iou, iouv):
+        """Per-threshold greedy matching: highest IoU per prediction, then first prediction per ground truth."""
+        correct = np.zeros((len(pred_classes), len(iouv)), dtype=bool)
+        iou = (iou * (true_classes[:, None] == pred_classes)).numpy()
+        for i, threshold in enumerate(iouv.tolist()):
+            matches = np.array(np.nonzero(iou >= threshold)).T
+            if matches.shape[0] > 1:
+                matches = matches[iou[matches[:, 0], matches[:, 1]].argsort()[::-1]]
+                matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
+                matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
+            correct[matches[:, 1].astype(int), i] = True
+        return correct
+
+    validator = DetectionValidator()
+    torch.manual_seed(0)
+    for m, n in (0, 5), (5, 0), (1, 1), (3, 20), (20, 3), (30, 100):
+        pred_classes, true_classes = torch.randint(0, 3, (n,)), torch.randint(0, 3, (m,))
+        iou = torch.rand(m, n) ** 0.5 * (torch.rand(m, n) < 0.5)  # sparse, many candidates above 0.5
+        correct = validator.match_predictions(pred_classes, true_classes, iou)
+        assert correct.shape == (n, 10) and correct.dtype == torch.bool
+        assert (correct.numpy() == reference(pred_classes, true_classes, iou, validator.iouv)).all()
+
+
+def test_utils_metrics_ap_histogram():
+    """Test streaming histogram AP against exact ap_per_class()."""
+    from ultralytics.utils.metrics import APHistogram, ap_per_class
+
+    rng = np.random.default_rng(0)
+    conf = (rng.permutation(2000) + 0.5) / 2000  # distinct bins of a 2000-bin histogram
+    tp = rng.random((2000, 10)) < conf[:, None] * np.linspace(1, 0.2, 10)  # confident predictions are more often right
+    pred_cls, target_cls = rng.integers(0, 3, 2000).astype(float), rng.integers(0, 3, 900).astype(float)
+    names = {0: "a", 1: "b", 2: "c"}
+    ap = ap_per_class(tp, conf, pred_cls, target_cls, names=names)[5]
+    for bins, atol in (2000, 1e-9), (100, 1e-2):  # exact with at most one prediction per bin
+        hist = APHistogram(nc=3, bins=bins)
+        for i in np.array_split(np.arange(2000), 7):  # streamed batches
+            hist.update(torch.from_numpy(tp[i]), torch.from_numpy(conf[i]), torch.from_numpy(pred_cls[i]))
+        stats = hist.stats()
+        assert stats["n"].sum() == 2000 and len(stats["n"]) <= 3 * bins
+        assert np.allclose(ap_per_class(target_cls=target_cls, names=names, **stats)[5], ap, atol=atol)
+
+
 def test_train_scratch():
     """Test training the YOLO model from scratch using the provided configuration."""
     model = YOLO(CFG)
@@ -184,6 +415,70 @@ def test_train_pretrained():
     model(SOURCE)
 
 
+def test_train_val_subset():
+    """Test training with validation on a stratified val subset and periodic full validation."""
+    from ultralytics.data.utils import stratified_subset
+
+    labels = [dict(cls=np.array([[c]])) for c in [0] * 20 + [1] * 3] + [dict(cls=np.zeros((0, 1)))] * 5
+    indices = stratified_subset(labels, fraction=0.2)
+    assert any(i in indices for i in range(20, 23)) and any(i >= 23 for i in indices)  # rare class and background
+    model = YOLO("yolov8n.yaml")
+    model.train(data="coco8.yaml", epochs=2, imgsz=32, val_subset=0.5, val_period=2, val_tolerance=0.01, name="sub")
+    trainer = model.trainer
+    assert len(trainer.val_subset_loader.dataset) < len(trainer.test_loader.dataset)
+    assert trainer.validator.dataloader is trainer.test_loader
+
+
+def test_val_subset_best_fitness():
+    """Test that val subset fitness is only used for early stopping and never becomes the best fitness."""
+    from types import SimpleNamespace
+
+    from ultralytics.engine.trainer import BaseTrainer
+
+    class Validator:
+        dataloader, scores = None, iter([0.5, 0.9, 0.6])  # full, subset and full epoch fitness
+
+        def __call__(self, trainer):
+            return {"fitness": next(self.scores)}
+
+        def fitness_interval(self):
+            return None
+
+    trainer = object.__new__(BaseTrainer)
+    trainer.validator, trainer.best_fitness, trainer.loss = Validator(), None, torch.zeros(1)
+    trainer.val_subset_loader, trainer.test_loader = SimpleNamespace(dataset=[0] * 2), SimpleNamespace(dataset=[0] * 4)
+    assert trainer.validate()[1] == 0.5 and trainer.best_fitness == 0.5
+    assert trainer.validate_subset()[1] == 0.9 and trainer.best_fitness == 0.5  # subset score above the next epoch
+    assert trainer.validate()[1] == 0.6 and trainer.best_fitness == 0.6
+    assert trainer.validator.dataloader is trainer.test_loader
+
+    stopper = EarlyStopping(patience=2)  # subset epochs are compared against subset epochs only
+    for epoch, (fitness, subset) in enumerate([(0.5, False), (0.9, True), (0.6, False), (0.85, True)], 1):
+        stopper(epoch, fitness, tolerance=0.1 if subset else 0.0, subset=subset)
+    assert stopper.best_fitness == 0.6 and stopper.best_subset == 0.9 and stopper.best_epoch == 4
+
+
+def test_train_progressive():
+    """Test progressive resizing training, growing the image size in stages towards imgsz."""
+    model = YOLO("yolov8n.yaml")
+    model.train(data="coco8.yaml", epochs=4, imgsz=128, progressive=0.75, progressive_min=0.5, name="progressive")
+    trainer = model.trainer
+    assert [trainer.progressive_imgsz(epoch) for epoch in range(4)] == [64, 64, 96, 128]
+    assert trainer.train_loader.dataset.imgsz == 128
+
+
+def test_progressive_imgsz():
+    """Test that progressive resizing stages are floored to distinct stride multiples."""
+    from types import SimpleNamespace
+
+    from ultralytics.engine.trainer import BaseTrainer
+
+    trainer = object.__new__(BaseTrainer)
+    trainer.args = SimpleNamespace(progressive=0.5, progressive_min=0.5, imgsz=640)
+    trainer.epochs, trainer.stride = 8, 32
+    assert [trainer.progressive_imgsz(epoch) for epoch in range(8)] == [320, 384, 480, 544, 640, 640, 640, 640]
+
+
 def test_all_model_yamls():
     """Test YOLO model creation for all available YAML configurations in the `cfg/models` directory."""
     for m in (ROOT / "cfg" / "models").rglob("*.yaml"):
@@ -242,6 +537,57 @@ def test_results(model):
         print(r, len(r), r.path)  # print after methods
 
 
+def test_results_batch():
+    """Test that columnar BatchResults match per-image Results and export all detections at once."""
+    model = YOLO(MODEL)
+    imgs = [SOURCE, ASSETS / "zidane.jpg"]
+    results = model(imgs, imgsz=160, batch=2)
+    batch = model(imgs, imgsz=160, batch=2, batch_results=True)[0]
+    assert len(batch) == len(results)
+    for r, v in zip(results, batch):
+        assert r.path == v.path and r.orig_shape == v.orig_shape
+        assert torch.allclose(r.boxes.data, v.boxes.data)
+    assert torch.allclose(torch.cat([r.boxes.xywhn for r in results]), batch.xywhn)
+    columns = batch.to_dict(normalize=True)
+    assert len(columns["image"]) == sum(len(r) for r in results)
+    assert batch.drop_imgs()[0].orig_img is None
+
+
+def test_results_serialize():
+    """Test that column-wise Results serializers agree with each other and export to a binary NPZ archive."""
+    boxes = torch.tensor([[10.0, 20.0, 110.0, 220.0, 0.9, 0.0], [48.0, 60.0, 72.0, 80.0, 0.25, 5.0]])
+    names = {i: str(i) for i in range(80)}
+    r = Results(np.zeros((320, 640, 3), dtype=np.uint8), path="im.jpg", names=names, boxes=boxes)
+    r.save_txt(TMP / "runs/tests/serialize.txt", save_conf=True)
+    lines = (TMP / "runs/tests/serialize.txt").read_text().splitlines()
+    assert lines[0] == "0 0.09375 0.375 0.15625 0.625 0.9" and len(lines) == 2
+    summary = r.summary(normalize=True)
+    assert summary[1] == {
+        "name": "5",
+        "class": 5,
+        "confidence": 0.25,
+        "box": {"x1": 0.075, "y1": 0.1875, "x2": 0.1125, "y2": 0.25},
+    }
+    data = np.load(r.save_npz(TMP / "runs/tests/serialize.npz"))
+    assert np.allclose(data["x2"], [110, 72]) and data["class"].tolist() == [0, 5]
+
+
+def test_predict_tiled():
+    """Test sliced inference on a large image, with tiles covering the image and boxes in image coordinates."""
+    offsets = ops.tile_offsets((1000, 1500), tile=640, overlap=0.2)
+    assert offsets == [(0, 0), (512, 0), (860, 0), (0, 360), (512, 360), (860, 360)]
+    with pytest.raises(ValueError):  # overlap 1.0 would step 1 pixel at a time
+        check_cfg({"tile_overlap": 1.0})
+    im = cv2.resize(cv2.imread(str(SOURCE)), (2400, 1800))
+    for r in YOLO(MODEL).predict([im, im[:320, :480]], imgsz=640, tile=640, tile_overlap=0.25, conf=0.1):
+        assert r.orig_shape in {(1800, 2400), (320, 480)}
+        xyxy = r.boxes.xyxy
+        assert (xyxy[:, 2] <= r.orig_shape[1]).all() and (xyxy[:, 3] <= r.orig_shape[0]).all()
+    model = YOLO(MODEL)  # tiles run in chunks of at most 'batch' tiles match a single forward pass
+    r1, r16 = (model.predict(im, imgsz=640, tile=640, conf=0.1, batch=b)[0].boxes.data for b in (1, 16))
+    assert torch.allclose(r1, r16, atol=1e-3)
+
+
 def test_labels_and_crops():
     """Test output from prediction args for saving YOLO detection labels and crops; ensures accurate saving."""
     imgs = [SOURCE, ASSETS / "zidane.jpg"]
@@ -264,6 +610,56 @@ def test_labels_and_crops():
         assert len([f for f in crop_files if im_name in f.name]) == len(r.boxes.data)
 
 
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_data_loaders_parallel_video():
+    """Test that parallel video decoding returns the same frames in per-video order as the serial loader."""
+    from ultralytics.data.loaders import LoadImagesAndVideos, LoadVideosParallel
+
+    path = TMP / "videos"
+    path.mkdir(parents=True, exist_ok=True)
+    for i, n in enumerate((23, 17, 31)):
+        writer = cv2.VideoWriter(str(path / f"video{i}.avi"), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+        for j in range(n):
+            writer.write(np.full((48, 64, 3), (j * 8) % 256, dtype=np.uint8))
+        writer.release()
+
+    for vid_stride, seek_stride in ((1, 16), (3, 16), (3, 2)):
+        expected, frames = {}, {}
+        for paths, imgs, _ in LoadImagesAndVideos(str(path), batch=2, vid_stride=vid_stride):
+            for p, im in zip(paths, imgs):
+                expected.setdefault(p, []).append(int(im.mean()))
+        dataset = LoadVideosParallel(str(path), batch=2, vid_stride=vid_stride, workers=2, seek_stride=seek_stride)
+        for paths, imgs, _ in dataset:
+            assert len(set(paths)) == 1, "batch mixes frames of different videos"
+            for p, im in zip(paths, imgs):
+                frames.setdefault(p, []).append(int(im.mean()))
+        assert frames == expected
+        assert dataset.stats()["frames"] == sum(len(x) for x in expected.values())
+
+    dataset = LoadVideosParallel(str(path), batch=2, workers=2)  # stopped early, only consumed frames count
+    next(iter(dataset))
+    while dataset._receive(timeout=1):  # workers fill their ring buffers ahead of the consumer
+        pass
+    dataset.close()
+    assert dataset.stats()["frames"] == 2 and dataset.decoded > 2
+
+
+@pytest.mark.skipif(not IS_TMP_WRITEABLE, reason="directory is not writeable")
+def test_predict_save_workers():
+    """Test that saving results on background writer threads produces the same files as saving inline."""
+    model = YOLO(MODEL)
+    dirs = []
+    for save_workers in (0, 2):
+        results = model.predict(
+            ASSETS, imgsz=160, save=True, save_txt=True, save_crop=True, save_workers=save_workers, project=TMP
+        )
+        dirs.append(Path(results[0].save_dir))
+    files = [sorted(str(f.relative_to(d)) for f in d.rglob("*") if f.is_file()) for d in dirs]
+    assert files[0] == files[1]
+    for f in dirs[0].glob("labels/*.txt"):
+        assert f.read_text() == (dirs[1] / "labels" / f.name).read_text()
+
+
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_data_utils():
     """Test utility functions in ultralytics/data/utils.py, including dataset stats and auto-splitting."""
@@ -361,16 +757,88 @@ def test_utils_benchmarks():
 def test_utils_torchutils():
     """Test Torch utility functions including profiling and FLOP calculations."""
     from ultralytics.nn.modules.conv import Conv
-    from ultralytics.utils.torch_utils import get_flops_with_torch_profiler, profile, time_sync
+    from ultralytics.utils.torch_utils import get_flops_with_torch_profiler, profile, profile_ema, time_sync
 
     x = torch.randn(1, 64, 20, 20)
     m = Conv(64, 64, k=1, s=2)
 
     profile(x, [m], n=3)
+    profile_ema(m, n=3)
     get_flops_with_torch_profiler(m)
     time_sync()
 
 
+def test_utils_model_ema():
+    """Test that foreach ModelEMA updates match per-tensor updates, including compensated updates every N steps."""
+    from ultralytics.nn.tasks import DetectionModel
+    from ultralytics.utils.torch_utils import ModelEMA
+
+    model = DetectionModel("yolov8n.yaml", verbose=False)
+    ema1, ema4 = ModelEMA(model, tau=5), ModelEMA(model, tau=5, every=4)
+    ref = deepcopy(ema1.ema)  # reference per-tensor EMA
+    for i in range(8):
+        if i % 4 == 0:  # model changes only at the start of each window, compensated decay is exact then
+            with torch.no_grad():
+                for p in model.parameters():
+                    p.add_(0.01 * torch.randn_like(p))
+        ema1.update(model)
+        ema4.update(model)
+        d = ema1.decay(i + 1)
+        msd = model.state_dict()
+        for k, v in ref.state_dict().items():
+            if v.dtype.is_floating_point:
+                v.mul_(d).add_((1 - d) * msd[k])
+    for ema in ema1, ema4:
+        for a, b in zip(ema.ema.state_dict().values(), ref.state_dict().values()):
+            assert torch.allclose(a, b, atol=1e-6)
+
+
+def test_utils_train_meter():
+    """Test that TrainMeter reports the epoch mean loss and throughput while syncing only every few steps."""
+    from ultralytics.utils.torch_utils import TrainMeter
+
+    meter, losses = TrainMeter(sync_every=4), torch.rand(10, 3)
+    for loss in losses:
+        meter.data_ready()
+        meter.update(loss, images=8)
+        meter.step()
+        if meter.due():
+            meter.sync()
+    assert torch.allclose(meter.sync(), losses.mean(0)) and meter.syncs == 3  # steps 4, 8 and epoch end
+    assert meter.metrics["train/images_per_s"] > 0 and meter.metrics["train/syncs"] == 3
+
+
+def test_utils_train_timeline():
+    """Test TrainTimeline stage timing, per-epoch timeline files and bottleneck suggestions."""
+    from ultralytics.utils.torch_utils import TrainTimeline
+
+    timeline = TrainTimeline(TMP / "runs/tests")
+    timeline.start()
+    for _ in range(3):
+        for stage in TrainTimeline.stages:
+            timeline.mark(stage)
+    assert set(timeline.report(epoch=0)) == set(TrainTimeline.stages)
+    assert len((TMP / "runs/tests/timeline/epoch1.csv").read_text().splitlines()) == 4  # header and 3 iterations
+    args = get_cfg(DEFAULT_CFG)
+    slow_data = dict(data=50.0, preprocess=1.0, forward=10.0, backward=20.0, optimizer=5.0, other=1.0)
+    bottleneck, tips = TrainTimeline.suggest(slow_data, args)
+    assert bottleneck == "dataloader" and any("cache" in x for x in tips)
+
+
+def test_utils_checkpoint_writer():
+    """Test background checkpoint writes, with best.pt hardlinked to last.pt and kept when last.pt is replaced."""
+    from ultralytics.utils.torch_utils import CheckpointWriter
+
+    writer, last, best = CheckpointWriter(), TMP / "runs/tests/last.pt", TMP / "runs/tests/best.pt"
+    last.parent.mkdir(parents=True, exist_ok=True)
+    writer.save({"epoch": 0, "model": torch.nn.Linear(2, 2).state_dict()}, [last, best])
+    writer.wait()
+    assert last.stat().st_ino == best.stat().st_ino or last.read_bytes() == best.read_bytes()
+    writer.save({"epoch": 1, "model": torch.nn.Linear(2, 2).state_dict()}, [last])
+    writer.wait()
+    assert torch.load(last)["epoch"] == 1 and torch.load(best)["epoch"] == 0
+
+
 @pytest.mark.slow
 @pytest.mark.skipif(not ONLINE, reason="environment is offline")
 def test_utils_downloads():
@@ -88,3 +88,127 @@ def test_streamlit_predict():
     """Test streamlit predict live inference solution."""
 
     solutions.inference()
+
+
+def test_counting_region():
+    """Test that the vectorized counting region counts like per-track shapely tests."""
+    import numpy as np
+    from shapely.geometry import LineString, Point, Polygon
+
+    from ultralytics.solutions.region import CountingRegion, TrackHistory
+
+    rng = np.random.default_rng(0)
+    ids = rng.permutation(300)[:200] + 1
+    xy = rng.uniform(0, 1000, (200, 2)) + np.cumsum(rng.normal(0, 15, (30, 200, 2)), 0)  # 30 frames of 200 tracks
+    for pts in [(100, 500), (900, 520)], [(200, 200), (800, 250), (700, 800), (250, 700)]:
+        region, shape = CountingRegion(pts), (LineString if len(pts) == 2 else Polygon)(pts)
+        history, counted = {}, set()
+        for c in xy:
+            xyxy = np.concatenate([c - 10, c + 10], 1)
+            counted_in, counted_out = region.update(ids, xyxy)
+            counts = [0, 0]
+            for i, (track_id, p) in enumerate(zip(ids, c.astype(np.float32))):
+                prev = history.get(track_id)
+                history[track_id] = p
+                hit = shape.distance(Point(p)) < 15 if len(pts) == 2 else shape.contains(Point(p))
+                if prev is not None and track_id not in counted and hit:
+                    counted.add(track_id)
+                    counts[int((xyxy[i, 0] - prev[0]) * (shape.centroid.x - prev[0]) <= 0)] += 1
+            assert counts == [counted_in.sum(), counted_out.sum()]
+        assert len(counted) > 0 and region.counted.sum() == len(counted)
+        np.testing.assert_allclose(region.history[ids[0]], xy[:, 0].astype(np.float32), rtol=1e-6)
+
+    history = TrackHistory(maxlen=4, max_age=10)  # slots of stale tracks are reused for ever-growing track IDs
+    for f in range(1000):
+        history.append(np.arange(5) + 5 * f, rng.uniform(0, 100, (5, 2)))
+    assert len(history) == 50 and len(history.ids) == 80 and len(history[0]) == 0 and len(history[4999]) == 1
+
+
+def test_heatmap_lazy_decay():
+    """Test that the lazily decayed heatmap matches a heatmap decayed every frame and renders at image size."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    import torch
+
+    from ultralytics.solutions.heatmap import blob_kernel
+
+    rng = np.random.default_rng(0)
+    heatmap = solutions.Heatmap(names={0: "person"}, shape="rect", decay_factor=0.9, heatmap_scale=1.0)
+    expected = np.zeros((240, 320), dtype=np.float32)
+    im0 = np.zeros((240, 320, 3), dtype=np.uint8)
+    for _ in range(100):  # the gain is renormalized after 66 frames
+        xy = rng.uniform(-20, 340, (5, 2))
+        xyxy = torch.tensor(np.concatenate([xy, xy + rng.uniform(5, 60, (5, 2))], 1), dtype=torch.float32)
+        boxes = SimpleNamespace(xyxy=xyxy, cls=torch.zeros(5), id=torch.arange(5))
+        expected *= 0.9
+        for x1, y1, x2, y2 in xyxy.int().tolist():
+            expected[max(y1, 0) : max(y2, 0), max(x1, 0) : max(x2, 0)] += 2
+        result = heatmap.generate_heatmap(im0.copy(), [SimpleNamespace(boxes=boxes)], render=False)
+    np.testing.assert_allclose(heatmap.heatmap * heatmap.gain, expected, rtol=1e-4, atol=1e-4)
+    assert not result.any() and heatmap.render(im0).shape == im0.shape
+    assert blob_kernel.cache_info().currsize <= 256  # ~500 box sizes stamped, the kernel cache stays bounded
+
+
+def test_speed_estimation_offline():
+    """Test that speeds and distances use frame timestamps and the ground-plane homography."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    import torch
+
+    from ultralytics.solutions.region import GroundPlane
+
+    H = np.diag([0.1, 0.1, 1.0])  # 10 pixels per meter
+    speed = solutions.SpeedEstimator(names={0: "car"}, reg_pts=[(0, 400), (1000, 400)], fps=10, homography=H)
+    im0 = np.zeros((720, 1000, 3), dtype=np.uint8)
+    for f in range(8):  # two cars moving down at 20 and 25 pixels per frame
+        y = 300 + f * torch.tensor([20.0, 25.0])[:, None]
+        xyxy = torch.cat([torch.tensor([[100.0], [500.0]]), y - 10, torch.tensor([[140.0], [540.0]]), y + 10], 1)
+        boxes = SimpleNamespace(xyxy=xyxy, cls=torch.zeros(2), id=torch.tensor([1, 2]))
+        speed.estimate_speed(im0.copy(), [SimpleNamespace(boxes=boxes)])
+    assert speed.dist_data == pytest.approx({1: 72.0, 2: 90.0})  # 20 and 25 m/s
+
+    speed = solutions.SpeedEstimator(names={0: "car"}, reg_pts=[(0, 400), (1000, 400)], fps=10, speed_window=2)
+    for f in range(3):  # 10 pixels per frame, the middle frame has no track IDs
+        xyxy = torch.tensor([[100.0, 370 + 10 * f, 140, 390 + 10 * f]])
+        boxes = SimpleNamespace(xyxy=xyxy, cls=torch.zeros(1), id=None if f == 1 else torch.tensor([1]))
+        speed.estimate_speed(im0.copy(), [SimpleNamespace(boxes=boxes)])
+    assert speed.dist_data == pytest.approx({1: 36.0})  # 10 m/s
+
+    plane = GroundPlane.from_points([(0, 0), (100, 0), (100, 100), (0, 100)], [(0, 0), (10, 0), (10, 10), (0, 10)])
+    distance = solutions.DistanceCalculation(names={0: "car"}, homography=plane.homography)
+    distances = distance.calculate_distances([[0, 0, 20, 20], [60, 80, 80, 100]])
+    np.testing.assert_allclose(distances, [[0, 10], [10, 0]], atol=1e-6)
+
+
+def test_analytics_headless(tmp_path):
+    """Test that analytics store raw series without rendering and render charts at the configured interval."""
+    import json
+
+    import numpy as np
+
+    file = tmp_path / "a.csv"
+    analytics = solutions.Analytics("area", writer=None, im0_shape=(320, 240), save_img=False, output=file)
+    for f in range(5):
+        analytics.update_area(f, {"person": f, "car": 1} if f else {"person": 0})
+    assert analytics.save().read_text().splitlines() == ["x,person,car", "0.0,0.0,0.0"] + [
+        f"{f}.0,{f}.0,1.0" for f in range(1, 5)
+    ]
+    assert analytics.im0 is None  # nothing rendered
+    assert json.loads(analytics.save(tmp_path / "a.json").read_text())["series"]["car"] == [0, 1, 1, 1, 1]
+
+    frames = []
+    writer = type("Writer", (), {"write": lambda self, im: frames.append(im)})()
+    analytics = solutions.Analytics("bar", writer=writer, im0_shape=(320, 240), backend="opencv", render_interval=3)
+    for f in range(4):
+        analytics.update_bar({"person": f + 1, "car": 2})
+    assert len(frames) == 4 and frames[0] is frames[2] and frames[3] is not frames[0]
+    assert frames[0].shape == (240, 320, 3) and np.any(frames[0] != frames[3])
+    assert not len(analytics.x)  # bar and pie charts keep no history without output
+
+    analytics = solutions.Analytics("line", writer=writer, im0_shape=(320, 240), backend="opencv", max_points=3)
+    for f in range(10):
+        analytics.update_line(f, f)
+    x, ys = analytics.series()
+    assert x.tolist() == [7, 8, 9] and ys[analytics.y_label].tolist() == [7, 8, 9]
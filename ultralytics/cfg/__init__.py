@@ -139,6 +139,13 @@ CFG_FRACTION_KEYS = {  # fractional float arguments with 0.0<=values<=1.0
     "conf",
     "iou",
     "fraction",
+    "tile_overlap",
+    "val_subset",
+    "progressive",
+    "progressive_min",
+}
+CFG_FRACTION_MAX = {  # fractional arguments with a lower upper bound than 1.0
+    "tile_overlap": 0.9,  # tiles are spaced by tile * (1 - overlap), 1.0 would step 1 pixel at a time
 }
 CFG_INT_KEYS = {  # integer-only arguments
     "epochs",
@@ -148,9 +155,15 @@ CFG_INT_KEYS = {  # integer-only arguments
     "close_mosaic",
     "mask_ratio",
     "max_det",
+    "ap_bins",
     "vid_stride",
+    "vid_workers",
+    "save_workers",
+    "tile",
+    "val_period",
     "line_width",
     "nbs",
+    "ema_every",
     "save_period",
 }
 CFG_BOOL_KEYS = {  # boolean-only arguments
@@ -187,7 +200,10 @@ CFG_BOOL_KEYS = {  # boolean-only arguments
     "simplify",
     "nms",
     "profile",
+    "timeline",
+    "save_async",
     "multi_scale",
+    "batch_results",
 }
 
 
@@ -306,8 +322,9 @@ def check_cfg(cfg, hard=True):
                             f"Valid '{k}' types are int (i.e. '{k}=0') or float (i.e. '{k}=0.5')"
                         )
                     cfg[k] = v = float(v)
-                if not (0.0 <= v <= 1.0):
-                    raise ValueError(f"'{k}={v}' is an invalid value. " f"Valid '{k}' values are between 0.0 and 1.0.")
+                hi = CFG_FRACTION_MAX.get(k, 1.0)
+                if not (0.0 <= v <= hi):
+                    raise ValueError(f"'{k}={v}' is an invalid value. " f"Valid '{k}' values are between 0.0 and {hi}.")
             elif k in CFG_INT_KEYS and not isinstance(v, int):
                 if hard:
                     raise TypeError(
@@ -4,7 +4,7 @@ import glob
 import math
 import os
 import random
-from copy import deepcopy
+from copy import copy, deepcopy
 from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import Optional
@@ -78,6 +78,7 @@ class BaseDataset(Dataset):
         self.batch_size = batch_size
         self.stride = stride
         self.pad = pad
+        self.ar = None  # sorted aspect ratios of images for rect
         if self.rect:
             assert self.batch_size is not None
             self.set_rectangle()
@@ -177,7 +178,11 @@ class BaseDataset(Dataset):
 
             return im, (h0, w0), im.shape[:2]
 
-        return self.ims[i], self.im_hw0[i], self.im_hw[i]
+        (h, w), r = self.im_hw[i], self.imgsz / max(self.im_hw[i])
+        if r < 1:  # cached at a larger size than the current imgsz, i.e. during progressive resizing
+            h, w = min(math.ceil(h * r), self.imgsz), min(math.ceil(w * r), self.imgsz)
+            return cv2.resize(im, (w, h), interpolation=cv2.INTER_LINEAR), self.im_hw0[i], (h, w)
+        return im, self.im_hw0[i], self.im_hw[i]
 
     def cache_images(self):
         """Cache images to memory or disk."""
@@ -226,12 +231,14 @@ class BaseDataset(Dataset):
         bi = np.floor(np.arange(self.ni) / self.batch_size).astype(int)  # batch index
         nb = bi[-1] + 1  # number of batches
 
-        s = np.array([x.pop("shape") for x in self.labels])  # hw
-        ar = s[:, 0] / s[:, 1]  # aspect ratio
-        irect = ar.argsort()
-        self.im_files = [self.im_files[i] for i in irect]
-        self.labels = [self.labels[i] for i in irect]
-        ar = ar[irect]
+        if self.ar is None:  # sort images by aspect ratio once, shapes are removed from labels
+            s = np.array([x.pop("shape") for x in self.labels])  # hw
+            ar = s[:, 0] / s[:, 1]  # aspect ratio
+            irect = ar.argsort()
+            self.im_files = [self.im_files[i] for i in irect]
+            self.labels = [self.labels[i] for i in irect]
+            self.ar = ar[irect]
+        ar = self.ar
 
         # Set training image shapes
         shapes = [[1, 1]] * nb
@@ -246,6 +253,48 @@ class BaseDataset(Dataset):
         self.batch_shapes = np.ceil(np.array(shapes) * self.imgsz / self.stride + self.pad).astype(int) * self.stride
         self.batch = bi  # batch index of image
 
+    def set_imgsz(self, imgsz, hyp=None):
+        """
+        Change the training image size, e.g. between the stages of progressive resizing.
+
+        Buffered images are dropped and reloaded at the new size, images cached in RAM are kept and resized on load.
+
+        Args:
+            imgsz (int): The new image size.
+            hyp (dict, optional): Hyperparameters to rebuild the transforms with.
+        """
+        self.imgsz = imgsz
+        if self.cache != "ram":
+            for j in self.buffer:
+                self.ims[j], self.im_hw0[j], self.im_hw[j] = None, None, None
+        if self.rect:
+            self.set_rectangle()
+        self.transforms = self.build_transforms(hyp=hyp)
+
+    def subset(self, indices):
+        """
+        Return a shallow copy of the dataset with only the images at 'indices', sharing labels and cached images.
+
+        Args:
+            indices (list): Sorted indices of the images to keep.
+
+        Returns:
+            (BaseDataset): The dataset subset, with rect batch shapes recomputed for its own batches.
+        """
+        dataset = copy(self)
+        dataset.im_files = [self.im_files[i] for i in indices]
+        dataset.labels = [self.labels[i] for i in indices]
+        dataset.ims = [self.ims[i] for i in indices]
+        dataset.im_hw0 = [self.im_hw0[i] for i in indices]
+        dataset.im_hw = [self.im_hw[i] for i in indices]
+        dataset.npy_files = [self.npy_files[i] for i in indices]
+        dataset.ni = len(dataset.labels)
+        dataset.buffer = []
+        if self.rect:
+            dataset.ar = self.ar[indices]
+            dataset.set_rectangle()
+        return dataset
+
     def __getitem__(self, index):
         """Returns transformed label information for given index."""
         return self.transforms(self.get_image_and_label(index))
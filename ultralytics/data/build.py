@@ -13,6 +13,7 @@ from ultralytics.data.dataset import GroundingDataset, YOLODataset, YOLOMultiMod
 from ultralytics.data.loaders import (
     LOADERS,
     LoadImagesAndVideos,
+    LoadVideosParallel,
     LoadPilAndNumpy,
     LoadScreenshots,
     LoadStreams,
@@ -171,7 +172,7 @@ def check_source(source):
     return source, webcam, screenshot, from_img, in_memory, tensor
 
 
-def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
+def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False, vid_workers=0):
     """
     Loads an inference source for object detection and applies necessary transformations.
 
@@ -180,6 +181,8 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
         batch (int, optional): Batch size for dataloaders. Default is 1.
         vid_stride (int, optional): The frame interval for video sources. Default is 1.
         buffer (bool, optional): Determined whether stream frames will be buffered. Default is False.
+        vid_workers (int, optional): Number of processes decoding video files in parallel, 0 decodes in the main
+            process. Default is 0.
 
     Returns:
         dataset (Dataset): A dataset object for the specified input source.
@@ -198,6 +201,8 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
         dataset = LoadScreenshots(source)
     elif from_img:
         dataset = LoadPilAndNumpy(source)
+    elif vid_workers > 0:
+        dataset = LoadVideosParallel(source, batch=batch, vid_stride=vid_stride, workers=vid_workers)
     else:
         dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride)
 
@@ -2,9 +2,13 @@
 
 import glob
 import math
+import multiprocessing as mp
 import os
+import queue
 import time
+from collections import deque
 from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
 from threading import Thread
 from urllib.parse import urlparse
@@ -387,6 +391,272 @@ class LoadImagesAndVideos:
         return math.ceil(self.nf / self.bs)  # number of files
 
 
+def _decode_video_worker(rank, tasks, results, free, vid_stride, seek_stride, n_slots):
+    """
+    Decode videos from a task queue into per-video shared-memory ring buffers (runs in a worker process).
+
+    Each video gets its own `SharedMemory` ring of `n_slots` frame slots. Decoded frames are written into a free slot
+    and announced on `results`; the consumer hands slots back through `free` once the frame has been copied out, which
+    throttles the worker whenever the ring is full.
+
+    Args:
+        rank (int): Index of this worker, reported to the consumer so slots are returned to the right queue.
+        tasks (mp.Queue): Queue of (video_index, path) tuples, terminated by None.
+        results (mp.Queue): Queue receiving ('start' | 'frame' | 'end' | 'error', ...) messages for the consumer.
+        free (mp.Queue): Queue of (video_index, slot) tuples returned by the consumer.
+        vid_stride (int): Video frame-rate stride.
+        seek_stride (int): Seek to the target frame instead of grabbing skipped frames when vid_stride >= seek_stride.
+        n_slots (int): Number of frame slots in each ring buffer.
+    """
+    cv2.setNumThreads(1)  # one decoder per process, avoid oversubscription
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        vid, path = task
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            results.put(("error", vid, f"Failed to open video {path}"))
+            continue
+        w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fps = int(cap.get(cv2.CAP_PROP_FPS))
+        frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT) / vid_stride)
+        shape = (h, w, 3)
+        ring = shared_memory.SharedMemory(create=True, size=max(n_slots * h * w * 3, 1))
+        buf = np.ndarray((n_slots, *shape), dtype=np.uint8, buffer=ring.buf)
+        results.put(("start", vid, rank, ring.name, shape, frames, fps))
+
+        seek = vid_stride >= seek_stride
+        slots, n = deque(range(n_slots)), 0  # free slots, output frame counter
+        while True:
+            t = time.perf_counter()
+            if seek:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, (n + 1) * vid_stride - 1)
+                success = cap.grab()
+            else:
+                for _ in range(vid_stride):
+                    success = cap.grab()
+                    if not success:
+                        break
+            if success:
+                success, im = cap.retrieve()
+            if not success or im.shape != shape:
+                break
+            dt = time.perf_counter() - t
+            while not slots:  # ring full, wait for the consumer to release a slot
+                v, slot = free.get()
+                if v == vid:
+                    slots.append(slot)
+            slot = slots.popleft()
+            buf[slot] = im
+            n += 1
+            results.put(("frame", vid, slot, dt))
+        cap.release()
+        del buf
+        ring.close()  # consumer unlinks the ring once all frames are read
+        results.put(("end", vid, n))
+
+
+class LoadVideosParallel(LoadImagesAndVideos):
+    """
+    YOLOv8 image/video dataloader that decodes multiple videos in parallel worker processes.
+
+    Images are read in the main process exactly as in `LoadImagesAndVideos`. Videos are distributed over a pool of
+    decode processes which write frames into shared-memory ring buffers, so decoding of many videos overlaps with
+    inference. Each batch holds frames of a single video in order; the loader prefers the lowest-indexed video that
+    has frames ready and falls back to any other ready video instead of stalling on a slow decoder.
+
+    Attributes:
+        workers (int): Number of decode processes.
+        seek_stride (int): Minimum vid_stride at which frames are reached by seeking instead of grabbing.
+        n_slots (int): Number of frame slots in each video's ring buffer.
+        decoded (int): Number of frames the workers wrote to the ring buffers, after vid_stride.
+        delivered (int): Number of video frames returned to the consumer.
+        decode_time (float): Total worker time spent decoding, in seconds.
+        wait_time (float): Total time the consumer was blocked waiting for decoded frames, in seconds.
+
+    Methods:
+        close: Stop the workers and release shared memory.
+        stats: Return decode throughput and decode-vs-inference balance.
+
+    Example:
+        ```bash
+        yolo predict source=path/to/videos/ vid_workers=4 vid_stride=10
+        ```
+    """
+
+    def __init__(self, path, batch=1, vid_stride=1, workers=4, seek_stride=16, n_slots=8):
+        """Initialize the Dataloader and raise FileNotFoundError if file not found."""
+        super().__init__(path, batch=batch, vid_stride=vid_stride)
+        if self.cap:
+            self.cap.release()  # videos are decoded by the worker pool
+            self.cap = None
+        self.workers = max(min(workers, self.nf - self.ni), 1)
+        self.seek_stride = seek_stride
+        self.n_slots = max(n_slots, batch)
+        self.procs = []
+        self.fps = 30
+        self.frames = 0
+
+    def _start(self):
+        """Start the decode worker pool and queue all videos."""
+        resource_tracker.ensure_running()  # workers must share the parent's tracker or their rings die with them
+        self.tasks, self.results = mp.Queue(), mp.Queue()
+        self.free = [mp.Queue() for _ in range(self.workers)]
+        for i in range(self.ni, self.nf):
+            self.tasks.put((i - self.ni, self.files[i]))
+        for _ in range(self.workers):
+            self.tasks.put(None)
+        self.procs = [
+            mp.Process(
+                target=_decode_video_worker,
+                args=(i, self.tasks, self.results, f, self.vid_stride, self.seek_stride, self.n_slots),
+                daemon=True,
+            )
+            for i, f in enumerate(self.free)
+        ]
+        for p in self.procs:
+            p.start()
+        self.videos = {}  # video index -> dict(ring, buf, rank, frames, fps, pending, done, frame)
+        self.finished = 0
+        self.decoded, self.delivered, self.decode_time, self.wait_time = 0, 0, 0.0, 0.0
+        self.t0 = time.perf_counter()
+
+    def _receive(self, timeout=None):
+        """Process one worker message, return False if none arrived within timeout."""
+        try:
+            msg = self.results.get(timeout=timeout)
+        except queue.Empty:
+            if not any(p.is_alive() for p in self.procs) and self.finished < self.nf - self.ni:
+                self.close()
+                raise RuntimeError("Video decode workers exited unexpectedly")
+            return False
+        kind, vid = msg[:2]
+        if kind == "start":
+            _, _, rank, name, shape, frames, fps = msg
+            ring = shared_memory.SharedMemory(name=name)
+            buf = np.ndarray((self.n_slots, *shape), dtype=np.uint8, buffer=ring.buf)
+            self.videos[vid] = dict(
+                ring=ring, buf=buf, rank=rank, frames=frames, fps=fps, pending=deque(), done=False, frame=0
+            )
+        elif kind == "frame":
+            self.videos[vid]["pending"].append(msg[2])
+            self.decoded += 1
+            self.decode_time += msg[3]
+        elif kind == "end":
+            self.videos[vid]["done"] = True
+            self.finished += 1
+        elif kind == "error":
+            self.close()
+            raise FileNotFoundError(msg[2])
+        return True
+
+    def _release(self, vid):
+        """Detach and unlink the ring buffer of a fully consumed video."""
+        v = self.videos.pop(vid)
+        del v["buf"]
+        v["ring"].close()
+        v["ring"].unlink()
+
+    def __iter__(self):
+        """Returns an iterator object for VideoStream or ImageFolder."""
+        self.close()
+        self.count = 0
+        return self
+
+    def __next__(self):
+        """Returns the next batch of images or video frames along with their paths and metadata."""
+        if self.count < self.ni:
+            return super().__next__()  # image batches, loader stops at the end of the image list
+        if self.nf == self.ni:
+            raise StopIteration
+        if not self.procs:
+            self._start()
+        self.mode = "video"
+
+        while True:
+            while self._receive(timeout=0):  # drain messages without blocking
+                pass
+            ready = [k for k in sorted(self.videos) if self.videos[k]["pending"]]
+            if ready:
+                break
+            for k in [k for k, v in self.videos.items() if v["done"]]:
+                self._release(k)  # done and drained
+            if self.finished == self.nf - self.ni and not self.videos:
+                self.close()
+                raise StopIteration
+            t = time.perf_counter()
+            self._receive(timeout=1.0)
+            self.wait_time += time.perf_counter() - t
+
+        vid = ready[0]
+        v = self.videos[vid]
+        path = self.files[self.ni + vid]
+        self.count = self.ni + vid  # index of the file being returned
+        self.fps, self.frames = v["fps"], v["frames"]
+        paths, imgs, info = [], [], []
+        while v["pending"] and len(imgs) < self.bs:
+            slot = v["pending"].popleft()
+            imgs.append(v["buf"][slot].copy())  # frame must outlive the ring slot
+            if not v["done"]:
+                self.free[v["rank"]].put((vid, slot))  # hand the slot back to the decoding worker
+            v["frame"] += 1
+            self.delivered += 1
+            paths.append(path)
+            info.append(f"video {self.count + 1}/{self.nf} (frame {v['frame']}/{v['frames']}) {path}: ")
+        if v["done"] and not v["pending"]:
+            self._release(vid)
+        return paths, imgs, info
+
+    def stats(self):
+        """Return decode throughput (frames/s) and the fraction of consumer time spent waiting on decoding."""
+        elapsed = max(time.perf_counter() - getattr(self, "t0", time.perf_counter()), 1e-9)
+        decoded, delivered = getattr(self, "decoded", 0), getattr(self, "delivered", 0)
+        wait = getattr(self, "wait_time", 0.0)
+        return {
+            "frames": delivered,
+            "fps": delivered / elapsed,  # delivered frames per second of wall time
+            # frames written per second of worker time, which includes grabbing the vid_stride frames skipped
+            "decode_fps": decoded / max(getattr(self, "decode_time", 0.0), 1e-9) if decoded else 0.0,
+            "decode_wait": wait / elapsed,  # >0.5 means decode-bound, ~0 means inference-bound
+        }
+
+    def close(self):
+        """Stop the decode workers, log throughput and release all shared memory."""
+        if not self.procs:
+            return
+        s = self.stats()
+        LOGGER.info(
+            f"Video decode: {s['frames']} frames at {s['fps']:.1f} frames/s with {self.workers} workers "
+            f"({s['decode_fps']:.1f} frames/s per worker), "
+            f"{s['decode_wait'] * 100:.0f}% of time waiting on decode "
+            f"({'decode' if s['decode_wait'] > 0.5 else 'inference'}-bound)"
+        )
+        for p in self.procs:
+            p.terminate()
+            p.join(timeout=5)
+        self.procs = []
+        while True:  # attach to rings announced after the last read so they can be unlinked
+            try:
+                msg = self.results.get_nowait()
+            except (queue.Empty, OSError, ValueError):
+                break
+            if msg[0] == "start":
+                self.videos[msg[1]] = dict(ring=shared_memory.SharedMemory(name=msg[3]), buf=None)
+        for k in list(self.videos):
+            self._release(k)
+        for q in (self.tasks, self.results, *self.free):
+            q.close()
+
+    def __del__(self):
+        """Release workers and shared memory on garbage collection."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
 class LoadPilAndNumpy:
     """
     Load images from PIL and Numpy arrays for batch processing.
@@ -574,4 +844,4 @@ def get_best_youtube_url(url, method="pytube"):
 
 
 # Define constants
-LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadScreenshots)
+LOADERS = (LoadStreams, LoadPilAndNumpy, LoadImagesAndVideos, LoadVideosParallel, LoadScreenshots)
@@ -654,6 +654,35 @@ def autosplit(path=DATASETS_DIR / "coco8/images", weights=(0.9, 0.1, 0.0), annot
                 f.write(f"./{img.relative_to(path.parent).as_posix()}" + "\n")  # add image to txt file
 
 
+def stratified_subset(labels, fraction=0.1, seed=0):
+    """
+    Select a fixed class-stratified random subset of a dataset, i.e. for validating on a fraction of the images.
+
+    Images are grouped by their rarest class (background images form their own group) and the same fraction is drawn
+    from every group, keeping at least one image per group so that rare classes stay represented.
+
+    Args:
+        labels (list): Dataset label dictionaries with a 'cls' array each.
+        fraction (float, optional): Fraction of images to select. Defaults to 0.1.
+        seed (int, optional): Random seed, the same seed always selects the same subset. Defaults to 0.
+
+    Returns:
+        (list): Sorted indices of the selected images.
+    """
+    cls = [x["cls"].reshape(-1).astype(int) for x in labels]
+    counts = np.bincount(np.concatenate(cls), minlength=1) if len(cls) else np.zeros(1, dtype=int)
+    groups = {}
+    for i, c in enumerate(cls):
+        key = int(c[counts[c].argmin()]) if len(c) else -1  # rarest class in image, -1 for background
+        groups.setdefault(key, []).append(i)
+    rng = np.random.default_rng(seed)
+    indices = []
+    for key in sorted(groups):
+        group = groups[key]
+        indices += rng.choice(group, max(1, round(len(group) * fraction)), replace=False).tolist()
+    return sorted(indices)
+
+
 def load_dataset_cache_file(path):
     """Load an Ultralytics *.cache dictionary from path."""
     import gc
@@ -30,8 +30,11 @@ Usage - formats:
 """
 
 import platform
+import queue
 import re
 import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 
 import cv2
@@ -41,6 +44,7 @@ import torch
 from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox, classify_transforms
+from ultralytics.engine.results import BatchResults
 from ultralytics.nn.autobackend import AutoBackend
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
@@ -60,6 +64,99 @@ Example:
 """
 
 
+class AsyncResultsWriter:
+    """
+    Bounded pool of background threads that plot, encode and save prediction results off the inference thread.
+
+    Jobs are routed to a worker by key, so all frames of one output video are written in order by the same thread.
+    Label lines are buffered and written with one `write()` per label file when the buffer fills or on `flush()`.
+    Each worker queue is bounded, so `submit()` blocks the inference thread (backpressure) when saving falls behind.
+
+    Attributes:
+        workers (int): Number of writer threads.
+        queues (list): One bounded job queue per writer thread.
+        threads (list): Writer threads.
+        lines (defaultdict): Buffered label lines per label file.
+        blocked (float): Total time `submit()` was blocked on a full queue, in seconds.
+        jobs (int): Number of jobs submitted.
+
+    Methods:
+        submit: Queue a save job.
+        write_lines: Buffer label lines for a label file.
+        flush: Wait for all queued jobs and write buffered label lines.
+        close: Flush and stop the writer threads.
+    """
+
+    def __init__(self, workers=2, maxsize=32, max_lines=1024):
+        """Initialize and start the writer threads."""
+        self.workers = workers
+        self.queues = [queue.Queue(maxsize=max(maxsize // workers, 1)) for _ in range(workers)]
+        self.threads = [threading.Thread(target=self._run, args=(q,), daemon=True) for q in self.queues]
+        self.lines, self.n_lines, self.max_lines = defaultdict(list), 0, max_lines
+        self.lock = threading.Lock()  # guards the label buffer
+        self.errors = []
+        self.blocked, self.jobs = 0.0, 0
+        for t in self.threads:
+            t.start()
+
+    def _run(self, q):
+        """Run queued jobs until a None sentinel is received."""
+        while True:
+            job = q.get()
+            try:
+                if job is None:
+                    break
+                fn, args = job
+                fn(*args)
+            except Exception as e:
+                self.errors.append(e)
+            finally:
+                q.task_done()
+
+    def submit(self, key, fn, *args):
+        """Queue `fn(*args)` on the writer thread assigned to `key`, blocking while that queue is full."""
+        t = time.perf_counter()
+        self.queues[hash(key) % self.workers].put((fn, args))
+        self.blocked += time.perf_counter() - t
+        self.jobs += 1
+
+    def write_lines(self, file, lines):
+        """Buffer label `lines` for `file`, writing all buffered files once `max_lines` lines are pending."""
+        if not lines:
+            return  # match save_txt(), which creates no file for empty results
+        with self.lock:
+            self.lines[str(file)].extend(lines)
+            self.n_lines += len(lines)
+            if self.n_lines >= self.max_lines:
+                self._write_lines()
+
+    def _write_lines(self):
+        """Append buffered lines to their label files with one write per file, must be called with lock held."""
+        for file, lines in self.lines.items():
+            Path(file).parent.mkdir(parents=True, exist_ok=True)
+            with open(file, "a") as f:
+                f.write("".join(f"{x}\n" for x in lines))
+        self.lines, self.n_lines = defaultdict(list), 0
+
+    def flush(self):
+        """Wait until all queued jobs are done and write buffered label lines."""
+        for q in self.queues:
+            q.join()
+        with self.lock:
+            self._write_lines()
+        if self.errors:
+            LOGGER.warning(f"WARNING ⚠️ {len(self.errors)} results failed to save, first error: {self.errors[0]}")
+            self.errors = []
+
+    def close(self):
+        """Flush pending results and stop the writer threads."""
+        self.flush()
+        for q in self.queues:
+            q.put(None)
+        for t in self.threads:
+            t.join()
+
+
 class BasePredictor:
     """
     BasePredictor.
@@ -75,6 +172,7 @@ class BasePredictor:
         device (torch.device): Device used for prediction.
         dataset (Dataset): Dataset used for prediction.
         vid_writer (dict): Dictionary of {save_path: video_writer, ...} writer for saving video output.
+        writer (AsyncResultsWriter): Background writer for saving results when `save_workers > 0`.
     """
 
     def __init__(self, cfg=DEFAULT_CFG, overrides=None, _callbacks=None):
@@ -100,6 +198,7 @@ class BasePredictor:
         self.device = None
         self.dataset = None
         self.vid_writer = {}  # dict of {save_path: video_writer, ...}
+        self.writer = None  # AsyncResultsWriter
         self.plotted_img = None
         self.source_type = None
         self.seen = 0
@@ -200,6 +299,7 @@ class BasePredictor:
             batch=self.args.batch,
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
+            vid_workers=self.args.vid_workers,
         )
         self.source_type = self.dataset.source_type
         if not getattr(self, "stream", True) and (
@@ -228,6 +328,8 @@ class BasePredictor:
             # Check if save_dir/ label file exists
             if self.args.save or self.args.save_txt:
                 (self.save_dir / "labels" if self.args.save_txt else self.save_dir).mkdir(parents=True, exist_ok=True)
+            if self.args.save_workers > 0 and (self.args.save or self.args.save_txt or self.args.save_crop):
+                self.writer = AsyncResultsWriter(workers=self.args.save_workers)
 
             # Warmup model
             if not self.done_warmup:
@@ -263,13 +365,18 @@ class BasePredictor:
 
                 # Visualize, save, write results
                 n = len(im0s)
+                is_batch = isinstance(self.results, BatchResults)
                 for i in range(n):
                     self.seen += 1
-                    self.results[i].speed = {
+                    speed = {
                         "preprocess": profilers[0].dt * 1e3 / n,
                         "inference": profilers[1].dt * 1e3 / n,
                         "postprocess": profilers[2].dt * 1e3 / n,
                     }
+                    if is_batch:
+                        self.results.speed.update(speed)  # shared by all views, avoids creating them here
+                    else:
+                        self.results[i].speed = speed
                     if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
                         s[i] += self.write_results(i, Path(paths[i]), im, s)
 
@@ -278,9 +385,20 @@ class BasePredictor:
                     LOGGER.info("\n".join(s))
 
                 self.run_callbacks("on_predict_batch_end")
-                yield from self.results
+                if is_batch:
+                    yield self.results
+                else:
+                    yield from self.results
 
         # Release assets
+        if self.writer is not None:
+            self.writer.close()  # flush pending plots, frames and labels before releasing video writers
+            if self.args.verbose:
+                LOGGER.info(
+                    f"Results writer: {self.writer.jobs} results saved by {self.writer.workers} threads, "
+                    f"inference blocked {self.writer.blocked:.1f}s by a full queue"
+                )
+            self.writer = None
         for v in self.vid_writer.values():
             if isinstance(v, cv2.VideoWriter):
                 v.release()
@@ -334,34 +452,61 @@ class BasePredictor:
         string += f"{result.verbose()}{result.speed['inference']:.1f}ms"
 
         # Add predictions to image
-        if self.args.save or self.args.show:
-            self.plotted_img = result.plot(
-                line_width=self.args.line_width,
-                boxes=self.args.show_boxes,
-                conf=self.args.show_conf,
-                labels=self.args.show_labels,
-                im_gpu=None if self.args.retina_masks else im[i],
-            )
+        im_gpu = None if self.args.retina_masks else im[i]
+        if self.args.show or (self.args.save and self.writer is None):
+            self.plotted_img = self.plot_result(result, im_gpu)
 
         # Save results
-        if self.args.save_txt:
-            result.save_txt(f"{self.txt_path}.txt", save_conf=self.args.save_conf)
-        if self.args.save_crop:
-            result.save_crop(save_dir=self.save_dir / "crops", file_name=self.txt_path.stem)
+        plotted_img = self.plotted_img if self.args.show else None
+        if self.writer is None:
+            self.save_result(result, p, frame, self.txt_path, plotted_img, im_gpu)
+        else:  # plot, encode and write on a writer thread, keyed by output file to keep video frames in order
+            fps = self._output_fps()  # read now, the dataset may have moved on to another video when the job runs
+            key = str(self.save_dir / p.name) if fps else str(self.txt_path)
+            self.writer.submit(key, self.save_result, result, p, frame, self.txt_path, plotted_img, im_gpu, fps)
         if self.args.show:
             self.show(str(p))
-        if self.args.save:
-            self.save_predicted_images(str(self.save_dir / p.name), frame)
 
         return string
 
-    def save_predicted_images(self, save_path="", frame=0):
-        """Save video predictions as mp4 at specified path."""
-        im = self.plotted_img
+    def _output_fps(self):
+        """Return the FPS of the video being predicted, or 0 for image sources."""
+        if self.dataset.mode in {"stream", "video"}:
+            return (self.dataset.fps or 30) if self.dataset.mode == "video" else 30  # 30 FPS fallback
+        return 0
+
+    def plot_result(self, result, im_gpu=None):
+        """Plot a result with the predictor's visualization arguments."""
+        return result.plot(
+            line_width=self.args.line_width,
+            boxes=self.args.show_boxes,
+            conf=self.args.show_conf,
+            labels=self.args.show_labels,
+            im_gpu=im_gpu,
+        )
+
+    def save_result(self, result, p, frame, txt_path, plotted_img=None, im_gpu=None, fps=None):
+        """Save labels, crops and the plotted image of a single result, may run on an AsyncResultsWriter thread."""
+        if self.args.save_txt:
+            if self.writer is None:
+                result.save_txt(f"{txt_path}.txt", save_conf=self.args.save_conf)
+            else:
+                self.writer.write_lines(f"{txt_path}.txt", result._txt_lines(save_conf=self.args.save_conf))
+        if self.args.save_crop:
+            result.save_crop(save_dir=self.save_dir / "crops", file_name=txt_path.stem)
+        if self.args.save:
+            if plotted_img is None:
+                plotted_img = self.plotted_img if self.writer is None else self.plot_result(result, im_gpu)
+            self.save_predicted_images(str(self.save_dir / p.name), frame, plotted_img, fps)
+
+    def save_predicted_images(self, save_path="", frame=0, im=None, fps=None):
+        """Save video predictions as mp4 at specified path, `fps=0` saves an image and `fps=None` reads the dataset."""
+        im = self.plotted_img if im is None else im
+        if fps is None:
+            fps = self._output_fps()
 
         # Save videos and streams
-        if self.dataset.mode in {"stream", "video"}:
-            fps = self.dataset.fps if self.dataset.mode == "video" else 30
+        if fps:
             frames_path = f'{save_path.split(".", 1)[0]}_frames/'
             if save_path not in self.vid_writer:  # new video
                 if self.args.save_frames:
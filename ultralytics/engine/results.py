@@ -6,7 +6,7 @@ Usage: See https://docs.ultralytics.com/modes/predict/
 """
 
 from copy import deepcopy
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
 
 import numpy as np
@@ -14,10 +14,16 @@ import torch
 
 from ultralytics.data.augment import LetterBox
 from ultralytics.utils import LOGGER, SimpleClass, ops
+from ultralytics.utils.checks import check_requirements
 from ultralytics.utils.plotting import Annotator, colors, save_one_box
 from ultralytics.utils.torch_utils import smart_inference_mode
 
 
+def _to_numpy(x):
+    """Return a CPU numpy array for a torch.Tensor or numpy array."""
+    return x.cpu().numpy() if isinstance(x, torch.Tensor) else np.asarray(x)
+
+
 class BaseTensor(SimpleClass):
     """Base tensor class with additional methods for easy manipulation and device handling."""
 
@@ -108,7 +114,17 @@ class Results(SimpleClass):
     """
 
     def __init__(
-        self, orig_img, path, names, boxes=None, masks=None, probs=None, keypoints=None, obb=None, speed=None
+        self,
+        orig_img,
+        path,
+        names,
+        boxes=None,
+        masks=None,
+        probs=None,
+        keypoints=None,
+        obb=None,
+        speed=None,
+        orig_shape=None,
     ) -> None:
         """
         Initialize the Results class for storing and manipulating inference results.
@@ -128,6 +144,7 @@ class Results(SimpleClass):
                 13: Left Knee, 14: Right Knee, 15: Left Ankle, 16: Right Ankle
             obb (torch.tensor, optional): A 2D tensor of oriented bounding box coordinates for each detection.
             speed (dict, optional): A dictionary containing preprocess, inference, and postprocess speeds (ms/image).
+            orig_shape (tuple, optional): Original image shape (height, width), required if `orig_img` is None.
 
         Returns:
             None
@@ -138,7 +155,7 @@ class Results(SimpleClass):
             ```
         """
         self.orig_img = orig_img
-        self.orig_shape = orig_img.shape[:2]
+        self.orig_shape = orig_img.shape[:2] if orig_img is not None else tuple(orig_shape)
         self.boxes = Boxes(boxes, self.orig_shape) if boxes is not None else None  # native size boxes
         self.masks = Masks(masks, self.orig_shape) if masks is not None else None  # native size or imgsz masks
         self.probs = Probs(probs) if probs is not None else None
@@ -218,7 +235,9 @@ class Results(SimpleClass):
 
     def new(self):
         """Returns a new Results object with the same image, path, names, and speed attributes."""
-        return Results(orig_img=self.orig_img, path=self.path, names=self.names, speed=self.speed)
+        return Results(
+            orig_img=self.orig_img, path=self.path, names=self.names, speed=self.speed, orig_shape=self.orig_shape
+        )
 
     def plot(
         self,
@@ -396,33 +415,47 @@ class Results(SimpleClass):
 
             - Existing contents of the file will not be overwritten; new results will be appended.
         """
+        texts = self._txt_lines(save_conf=save_conf)
+        if texts:
+            Path(txt_file).parent.mkdir(parents=True, exist_ok=True)  # make directory
+            with open(txt_file, "a") as f:
+                f.writelines(text + "\n" for text in texts)
+
+    def _txt_lines(self, save_conf=False):
+        """Return the label file lines written by `save_txt()` as a list of strings, formatted for all rows at once."""
         is_obb = self.obb is not None
         boxes = self.obb if is_obb else self.boxes
         masks = self.masks
         probs = self.probs
         kpts = self.keypoints
-        texts = []
         if probs is not None:
             # Classify
-            [texts.append(f"{probs.data[j]:.2f} {self.names[j]}") for j in probs.top5]
-        elif boxes:
-            # Detect/segment/pose
-            for j, d in enumerate(boxes):
-                c, conf, id = int(d.cls), float(d.conf), None if d.id is None else int(d.id.item())
-                line = (c, *(d.xyxyxyxyn.view(-1) if is_obb else d.xywhn.view(-1)))
-                if masks:
-                    seg = masks[j].xyn[0].copy().reshape(-1)  # reversed mask.xyn, (n,2) to (n*2)
-                    line = (c, *seg)
-                if kpts is not None:
-                    kpt = torch.cat((kpts[j].xyn, kpts[j].conf[..., None]), 2) if kpts[j].has_visible else kpts[j].xyn
-                    line += (*kpt.reshape(-1).tolist(),)
-                line += (conf,) * save_conf + (() if id is None else (id,))
-                texts.append(("%g " * len(line)).rstrip() % line)
-
-        if texts:
-            Path(txt_file).parent.mkdir(parents=True, exist_ok=True)  # make directory
-            with open(txt_file, "a") as f:
-                f.writelines(text + "\n" for text in texts)
+            return [f"{probs.data[j]:.2f} {self.names[j]}" for j in probs.top5]
+        if not boxes:
+            return []
+
+        # Detect/segment/pose, build one float64 column block so every row is formatted by a single '%' operation
+        n = len(boxes)
+        head = [_to_numpy(boxes.cls)[:, None], _to_numpy(boxes.xyxyxyxyn if is_obb else boxes.xywhn).reshape(n, -1)]
+        tail = []
+        if kpts is not None:
+            kpt = torch.cat((kpts.xyn, kpts.conf[..., None]), 2) if kpts.has_visible else kpts.xyn
+            tail.append(_to_numpy(kpt).reshape(n, -1))
+        if save_conf:
+            tail.append(_to_numpy(boxes.conf)[:, None])
+        if boxes.is_track:
+            tail.append(_to_numpy(boxes.id)[:, None])
+
+        if masks:  # segments have a different length per object
+            tail = np.concatenate(tail, 1) if tail else np.zeros((n, 0))
+            lines = []
+            for c, seg, t in zip(head[0].tolist(), masks.xyn, tail.tolist()):
+                line = (*c, *seg.reshape(-1).tolist(), *t)
+                lines.append(("%g " * len(line)).rstrip() % line)
+            return lines
+        rows = np.concatenate(head + tail, 1)
+        fmt = ("%g " * rows.shape[1]).rstrip() + "\n"
+        return (fmt * n % tuple(rows.ravel().tolist())).splitlines()
 
     def save_crop(self, save_dir, file_name=Path("im.jpg")):
         """
@@ -477,35 +510,94 @@ class Results(SimpleClass):
             )
             return results
 
-        is_obb = self.obb is not None
-        data = self.obb if is_obb else self.boxes
+        # Round whole columns once and convert them to lists, then only assemble dictionaries per detection
+        columns = self.to_dict(normalize=normalize)
+        if not len(columns["class"]):
+            return results
+        names = [self.names[c] for c in columns["class"].tolist()]
+        conf = columns["confidence"].astype(np.float64).round(decimals).tolist()
+        keys = [k for k in columns if k[0] in "xy" and k[1:].isdigit()]
+        coords = zip(*(columns[k].round(decimals).tolist() for k in keys))
+        track = columns["track_id"].tolist() if "track_id" in columns else None
+        segments = self.masks.xy if self.masks else None
         h, w = self.orig_shape if normalize else (1, 1)
-        for i, row in enumerate(data):  # xyxy, track_id if tracking, conf, class_id
-            class_id, conf = int(row.cls), round(row.conf.item(), decimals)
-            box = (row.xyxyxyxy if is_obb else row.xyxy).squeeze().reshape(-1, 2).tolist()
-            xy = {}
-            for j, b in enumerate(box):
-                xy[f"x{j + 1}"] = round(b[0] / w, decimals)
-                xy[f"y{j + 1}"] = round(b[1] / h, decimals)
-            result = {"name": self.names[class_id], "class": class_id, "confidence": conf, "box": xy}
-            if data.is_track:
-                result["track_id"] = int(row.id.item())  # track ID
-            if self.masks:
+        if self.keypoints is not None:
+            k = _to_numpy(self.keypoints.data)
+            kx, ky = (k[..., 0] / w).round(decimals), (k[..., 1] / h).round(decimals)
+            kv = k[..., 2].round(decimals) if k.shape[-1] == 3 else None
+        for i, (name, c, p, xy) in enumerate(zip(names, columns["class"].tolist(), conf, coords)):
+            result = {"name": name, "class": c, "confidence": p, "box": dict(zip(keys, xy))}
+            if track is not None:
+                result["track_id"] = track[i]  # track ID
+            if segments is not None:
                 result["segments"] = {
-                    "x": (self.masks.xy[i][:, 0] / w).round(decimals).tolist(),
-                    "y": (self.masks.xy[i][:, 1] / h).round(decimals).tolist(),
+                    "x": (segments[i][:, 0] / w).round(decimals).tolist(),
+                    "y": (segments[i][:, 1] / h).round(decimals).tolist(),
                 }
             if self.keypoints is not None:
-                x, y, visible = self.keypoints[i].data[0].cpu().unbind(dim=1)  # torch Tensor
-                result["keypoints"] = {
-                    "x": (x / w).numpy().round(decimals).tolist(),  # decimals named argument required
-                    "y": (y / h).numpy().round(decimals).tolist(),
-                    "visible": visible.numpy().round(decimals).tolist(),
-                }
+                result["keypoints"] = {"x": kx[i].tolist(), "y": ky[i].tolist()}
+                if kv is not None:
+                    result["keypoints"]["visible"] = kv[i].tolist()
             results.append(result)
 
         return results
 
+    def to_dict(self, normalize=False):
+        """
+        Export detection results as a dictionary of numpy columns, one entry per detection.
+
+        Args:
+            normalize (bool): Whether to normalize box coordinates by the original image size.
+
+        Returns:
+            (dict): Columns with box corners 'x1', 'y1', 'x2', 'y2' (through 'x4', 'y4' for OBB), 'confidence', 'class',
+                'track_id' if tracked and 'keypoints' (n, k, 2 | 3) for pose. Coordinates are float64.
+        """
+        is_obb = self.obb is not None
+        data = self.obb if is_obb else self.boxes
+        if data is None:
+            return {"class": np.zeros(0, dtype=int), "confidence": np.zeros(0)}
+        h, w = self.orig_shape if normalize else (1, 1)
+        xy = _to_numpy(data.xyxyxyxy if is_obb else data.xyxy).astype(np.float64)
+        xy = xy.reshape(len(data), 4 if is_obb else 2, 2) / (w, h)
+        columns = {}
+        for j in range(xy.shape[1]):
+            columns[f"x{j + 1}"], columns[f"y{j + 1}"] = xy[:, j, 0], xy[:, j, 1]
+        columns["confidence"] = _to_numpy(data.conf)
+        columns["class"] = _to_numpy(data.cls).astype(int)
+        if data.is_track:
+            columns["track_id"] = _to_numpy(data.id).astype(int)
+        if self.keypoints is not None:
+            columns["keypoints"] = _to_numpy(self.keypoints.data)
+        return columns
+
+    def save_npz(self, file, normalize=False):
+        """
+        Save detection results as columns in a binary numpy `.npz` archive.
+
+        Args:
+            file (str | Path): Output file path.
+            normalize (bool): Whether to normalize box coordinates by the original image size.
+
+        Returns:
+            (str): Path to the saved file.
+
+        Example:
+            ```python
+            results = model("path/to/image.jpg")
+            results[0].save_npz("image.npz")
+            data = np.load("image.npz")  # data["class"], data["x1"], ...
+            ```
+        """
+        columns = self.to_dict(normalize=normalize)
+        if self.masks:  # variable length segments as one flat array plus per-object offsets
+            segments = self.masks.xyn if normalize else self.masks.xy
+            columns["segments"] = np.concatenate(segments) if len(segments) else np.zeros((0, 2), dtype=np.float32)
+            columns["segments_offsets"] = np.cumsum([0] + [len(x) for x in segments])
+        Path(file).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(file, orig_shape=np.asarray(self.orig_shape), **columns)
+        return str(file)
+
     def tojson(self, normalize=False, decimals=5):
         """Converts detection results to JSON format."""
         import json
@@ -513,6 +605,231 @@ class Results(SimpleClass):
         return json.dumps(self.summary(normalize=normalize, decimals=decimals), indent=2)
 
 
+class BatchResults(SimpleClass):
+    """
+    A columnar container for the detection results of a whole batch of images.
+
+    All detections of the batch live in a single `data` tensor with per-image row `offsets`, so a batch costs one
+    tensor instead of one `Results` and `Boxes` object per image. Per-image `Results` views are created lazily when
+    indexed and share memory with `data`. Derived box coordinates are computed once for the whole batch, cached, and
+    handed to views as slices.
+
+    Attributes:
+        data (torch.Tensor | numpy.ndarray): Detections of all images as rows of [x1, y1, x2, y2, (id), conf, cls].
+        offsets (list[int]): Row offset of each image in `data`, with len(self) + 1 entries.
+        orig_shapes (list[tuple]): Original image shape (height, width) of each image.
+        orig_imgs (list[numpy.ndarray] | None): Original images, or None once dropped with `drop_imgs()`.
+        paths (list[str]): Path of each image.
+        names (dict): Dictionary of class names.
+        speed (dict): Dictionary of preprocess, inference, and postprocess speeds (ms/image), shared with all views.
+
+    Methods:
+        from_preds(preds, orig_imgs, paths, names): Build a BatchResults from per-image prediction tensors.
+        cpu(): Returns a copy with the detections in CPU memory.
+        numpy(): Returns a copy with the detections as a numpy array.
+        drop_imgs(): Releases the original images, keeping only their shapes.
+        to_dict(normalize=False): Exports all detections as a dictionary of numpy columns.
+        to_arrow(normalize=False): Exports all detections as a pyarrow Table.
+
+    Example:
+        ```python
+        from ultralytics import YOLO
+
+        model = YOLO("yolov8n.pt")
+        for batch in model.predict("path/to/video.mp4", stream=True, batch_results=True, verbose=False):
+            columns = batch.to_dict(normalize=True)  # all detections of the batch, no per-box Python loop
+            first = batch[0]  # per-image Results view, created on first access
+        ```
+    """
+
+    def __init__(self, data, offsets, orig_shapes, paths, names, orig_imgs=None, speed=None) -> None:
+        """Initialize BatchResults with the stacked detections of a batch and their per-image row offsets."""
+        self.data = data
+        self.offsets = list(offsets)
+        self.orig_shapes = [tuple(x) for x in orig_shapes]
+        self.paths = paths
+        self.names = names
+        self.orig_imgs = orig_imgs
+        self.speed = speed if speed is not None else {"preprocess": None, "inference": None, "postprocess": None}
+        self.save_dir = None
+        self._views = {}  # image index -> Results view
+        self._stale = False  # a view was replaced, `data` must be rebuilt from views
+
+    @classmethod
+    def from_preds(cls, preds, orig_imgs, paths, names):
+        """Build a BatchResults from a list of per-image (n, 6) or (n, 7) prediction tensors in original image space."""
+        offsets = np.cumsum([0] + [len(x) for x in preds]).tolist()
+        return cls(torch.cat(preds), offsets, [x.shape[:2] for x in orig_imgs], paths, names, orig_imgs=orig_imgs)
+
+    def __len__(self):
+        """Return the number of images in the batch."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        """Return the Results view of image `idx`, or a list of views for a slice."""
+        if isinstance(idx, slice):
+            return [self[i] for i in range(len(self))[idx]]
+        idx = range(len(self))[idx]  # negative indices and bounds check
+        if idx not in self._views:
+            self._views[idx] = self._view(idx)
+        return self._views[idx]
+
+    def __setitem__(self, idx, result):
+        """Replace the Results of image `idx`, i.e. after tracking, so exports rebuild `data` from the views."""
+        self._views[range(len(self))[idx]] = result
+        self._stale = True
+
+    def __iter__(self):
+        """Iterate over per-image Results views."""
+        return (self[i] for i in range(len(self)))
+
+    def _view(self, i):
+        """Create the Results view of image `i`, reusing batch-level derived coordinates that are already cached."""
+        a, b = self.offsets[i], self.offsets[i + 1]
+        r = Results(
+            None if self.orig_imgs is None else self.orig_imgs[i],
+            path=self.paths[i],
+            names=self.names,
+            boxes=self.data[a:b],
+            speed=self.speed,
+            orig_shape=self.orig_shapes[i],
+        )
+        r.save_dir = self.save_dir
+        for k in ("xywh", "xyxyn", "xywhn"):
+            if k in self.__dict__:
+                r.boxes.__dict__[k] = self.__dict__[k][a:b]  # seed the view's cached_property
+        return r
+
+    def _sync(self):
+        """Rebuild `data` and `offsets` from the views if any view was replaced, invalidating cached columns."""
+        if self._stale:
+            data = [self[i].boxes.data for i in range(len(self))]
+            cols = max(x.shape[1] for x in data)  # tracked images have an extra id column
+            data = [x if x.shape[1] == cols else self._pad_id(x) for x in data]
+            self.data = torch.cat(data) if isinstance(data[0], torch.Tensor) else np.concatenate(data)
+            self.offsets = np.cumsum([0] + [len(x) for x in data]).tolist()
+            for k in ("image", "xywh", "xyxyn", "xywhn"):
+                self.__dict__.pop(k, None)
+            self._stale = False
+        return self
+
+    @staticmethod
+    def _pad_id(x):
+        """Insert a -1 track id column into (n, 6) untracked detections."""
+        if isinstance(x, torch.Tensor):
+            return torch.cat((x[:, :4], x.new_full((len(x), 1), -1), x[:, 4:]), 1)
+        return np.concatenate((x[:, :4], np.full((len(x), 1), -1, dtype=x.dtype), x[:, 4:]), 1)
+
+    @cached_property
+    def image(self):
+        """Returns the image index of each detection row."""
+        counts = np.diff(self._sync().offsets)
+        if isinstance(self.data, torch.Tensor):
+            counts = torch.as_tensor(counts, device=self.data.device)
+            return torch.repeat_interleave(torch.arange(len(counts), device=self.data.device), counts)
+        return np.repeat(np.arange(len(counts)), counts)
+
+    def _gain(self):
+        """Returns per-row [w, h, w, h] normalization gains."""
+        wh = [(w, h, w, h) for h, w in self.orig_shapes]
+        if isinstance(self.data, torch.Tensor):
+            return torch.tensor(wh, dtype=self.data.dtype, device=self.data.device).view(-1, 4)[self.image]
+        return np.asarray(wh, dtype=self.data.dtype).reshape(-1, 4)[self.image]
+
+    @property
+    def xyxy(self):
+        """Returns all boxes in [x1, y1, x2, y2] format."""
+        return self._sync().data[:, :4]
+
+    @property
+    def conf(self):
+        """Returns the confidence score of each box."""
+        return self._sync().data[:, -2]
+
+    @property
+    def cls(self):
+        """Returns the class of each box."""
+        return self._sync().data[:, -1]
+
+    @property
+    def id(self):
+        """Returns the track ID of each box if available."""
+        return self._sync().data[:, -3] if self.data.shape[1] == 7 else None
+
+    @cached_property
+    def xywh(self):
+        """Returns all boxes in [x, y, width, height] format."""
+        return ops.xyxy2xywh(self.xyxy)
+
+    @cached_property
+    def xyxyn(self):
+        """Returns all boxes in [x1, y1, x2, y2] format normalized by their image size."""
+        return self.xyxy / self._gain()
+
+    @cached_property
+    def xywhn(self):
+        """Returns all boxes in [x, y, width, height] format normalized by their image size."""
+        return self.xywh / self._gain()
+
+    def _apply(self, fn, *args, **kwargs):
+        """Returns a new BatchResults with `fn` applied to `data` through the Boxes API."""
+        data = getattr(Boxes(self._sync().data, None), fn)(*args, **kwargs).data
+        return BatchResults(data, self.offsets, self.orig_shapes, self.paths, self.names, self.orig_imgs, self.speed)
+
+    def cpu(self):
+        """Returns a copy of the BatchResults with the detections in CPU memory."""
+        return self._apply("cpu")
+
+    def numpy(self):
+        """Returns a copy of the BatchResults with the detections as a numpy array."""
+        return self._apply("numpy")
+
+    def drop_imgs(self):
+        """Release the original images, keeping only their shapes; plotting and crops are unavailable afterwards."""
+        self.orig_imgs = None
+        for r in self._views.values():
+            r.orig_img = None
+        return self
+
+    def to_dict(self, normalize=False):
+        """
+        Export all detections of the batch as a dictionary of numpy columns.
+
+        Args:
+            normalize (bool): Whether to normalize box coordinates by their image size.
+
+        Returns:
+            (dict): Columns 'image' (image index), 'x1', 'y1', 'x2', 'y2', 'confidence', 'class' and 'track_id' if
+                tracked, each a numpy array with one entry per detection. Paths are available in `self.paths`.
+        """
+        b = self.cpu().numpy()
+        xyxy = b.xyxyn if normalize else b.xyxy
+        columns = {"image": b.image, "x1": xyxy[:, 0], "y1": xyxy[:, 1], "x2": xyxy[:, 2], "y2": xyxy[:, 3]}
+        columns["confidence"] = b.conf
+        columns["class"] = b.cls.astype(int)
+        if b.id is not None:
+            columns["track_id"] = b.id.astype(int)
+        return columns
+
+    def to_arrow(self, normalize=False):
+        """Export all detections of the batch as a pyarrow Table with dictionary-encoded 'path' and 'name' columns."""
+        check_requirements("pyarrow")
+        import pyarrow as pa  # noqa
+
+        columns = self.to_dict(normalize=normalize)
+        names = [self.names[i] for i in range(max(self.names) + 1)] if self.names else []
+        table = {"path": pa.DictionaryArray.from_arrays(columns["image"].astype(np.int32), self.paths)}
+        table.update({k: pa.array(v) for k, v in columns.items()})
+        table["name"] = pa.DictionaryArray.from_arrays(columns["class"].astype(np.int32), names)
+        return pa.table(table)
+
+    def save_npz(self, file, normalize=False):
+        """Save all detections of the batch as columns in a binary numpy `.npz` archive, alongside paths and shapes."""
+        Path(file).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(file, paths=np.asarray(self.paths), orig_shapes=self.orig_shapes, **self.to_dict(normalize=normalize))
+        return str(file)
+
+
 class Boxes(BaseTensor):
     """
     Manages detection boxes, providing easy access and manipulation of box coordinates, confidence scores, class
@@ -581,14 +898,12 @@ class Boxes(BaseTensor):
         """Return the tracking IDs for each box if available."""
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)  # maxsize 1 should suffice
+    @cached_property
     def xywh(self):
         """Returns boxes in [x, y, width, height] format."""
         return ops.xyxy2xywh(self.xyxy)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyn(self):
         """Normalize box coordinates to [x1, y1, x2, y2] relative to the original image size."""
         xyxy = self.xyxy.clone() if isinstance(self.xyxy, torch.Tensor) else np.copy(self.xyxy)
@@ -596,8 +911,7 @@ class Boxes(BaseTensor):
         xyxy[..., [1, 3]] /= self.orig_shape[0]
         return xyxy
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xywhn(self):
         """Returns normalized bounding boxes in [x, y, width, height] format."""
         xywh = ops.xyxy2xywh(self.xyxy)
@@ -627,8 +941,7 @@ class Masks(BaseTensor):
             masks = masks[None, :]
         super().__init__(masks, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self):
         """Return normalized xy-coordinates of the segmentation masks."""
         return [
@@ -636,8 +949,7 @@ class Masks(BaseTensor):
             for x in ops.masks2segments(self.data)
         ]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self):
         """Returns the [x, y] normalized mask coordinates for each segment in the mask tensor."""
         return [
@@ -673,14 +985,12 @@ class Keypoints(BaseTensor):
         super().__init__(keypoints, orig_shape)
         self.has_visible = self.data.shape[-1] == 3
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xy(self):
         """Returns x, y coordinates of keypoints."""
         return self.data[..., :2]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def xyn(self):
         """Returns normalized coordinates (x, y) of keypoints relative to the original image size."""
         xy = self.xy.clone() if isinstance(self.xy, torch.Tensor) else np.copy(self.xy)
@@ -688,8 +998,7 @@ class Keypoints(BaseTensor):
         xy[..., 1] /= self.orig_shape[0]
         return xy
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def conf(self):
         """Returns confidence values for each keypoint."""
         return self.data[..., 2] if self.has_visible else None
@@ -716,26 +1025,22 @@ class Probs(BaseTensor):
         """Initialize Probs with classification probabilities and optional original image shape."""
         super().__init__(probs, orig_shape)
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1(self):
         """Return the index of the class with the highest probability."""
         return int(self.data.argmax())
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5(self):
         """Return the indices of the top 5 class probabilities."""
         return (-self.data).argsort(0)[:5].tolist()  # this way works with both torch and numpy.
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top1conf(self):
         """Retrieves the confidence score of the highest probability class."""
         return self.data[self.top1]
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def top5conf(self):
         """Returns confidence scores for the top 5 classification predictions."""
         return self.data[self.top5]
@@ -798,14 +1103,12 @@ class OBB(BaseTensor):
         """Return the tracking IDs of the oriented bounding boxes (if available)."""
         return self.data[:, -3] if self.is_track else None
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxy(self):
         """Convert OBB format to 8-point (xyxyxyxy) coordinate format of shape (N, 4, 2) for rotated bounding boxes."""
         return ops.xywhr2xyxyxyxy(self.xywhr)
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxyxyxyn(self):
         """Converts rotated bounding boxes to normalized xyxyxyxy format of shape (N, 4, 2)."""
         xyxyxyxyn = self.xyxyxyxy.clone() if isinstance(self.xyxyxyxy, torch.Tensor) else np.copy(self.xyxyxyxy)
@@ -813,8 +1116,7 @@ class OBB(BaseTensor):
         xyxyxyxyn[..., 1] /= self.orig_shape[0]
         return xyxyxyxyn
 
-    @property
-    @lru_cache(maxsize=2)
+    @cached_property
     def xyxy(self):
         """
         Convert the oriented bounding boxes (OBB) to axis-aligned bounding boxes in xyxy format (x1, y1, x2, y2).
@@ -22,7 +22,8 @@ from torch import distributed as dist
 from torch import nn, optim
 
 from ultralytics.cfg import get_cfg, get_save_dir
-from ultralytics.data.utils import check_cls_dataset, check_det_dataset
+from ultralytics.data.build import build_dataloader
+from ultralytics.data.utils import check_cls_dataset, check_det_dataset, stratified_subset
 from ultralytics.nn.tasks import attempt_load_one_weight, attempt_load_weights
 from ultralytics.utils import (
     DEFAULT_CFG,
@@ -41,8 +42,11 @@ from ultralytics.utils.checks import check_amp, check_file, check_imgsz, check_m
 from ultralytics.utils.dist import ddp_cleanup, generate_ddp_command
 from ultralytics.utils.files import get_latest_run
 from ultralytics.utils.torch_utils import (
+    CheckpointWriter,
     EarlyStopping,
     ModelEMA,
+    TrainMeter,
+    TrainTimeline,
     convert_optimizer_state_dict_to_fp16,
     init_seeds,
     one_cycle,
@@ -85,6 +89,9 @@ class BaseTrainer:
         fitness (float): Current fitness value.
         loss (float): Current loss value.
         tloss (float): Total loss value.
+        meter (TrainMeter): Accumulates loss and throughput on device, syncing with the host every few steps.
+        timeline (TrainTimeline): Per-iteration stage timer, enabled by the 'timeline' argument.
+        checkpointer (CheckpointWriter): Writes checkpoints, on a background thread if 'save_async' is set.
         loss_names (list): List of loss names.
         csv (Path): Path to results CSV file.
     """
@@ -141,6 +148,12 @@ class BaseTrainer:
         self.fitness = None
         self.loss = None
         self.tloss = None
+        self.meter = TrainMeter()
+        self.val_subset_loader = None  # fixed val subset for 'val_subset' epochs
+        self.subset_epoch = False  # last validation used the val subset, its fitness is only used for early stopping
+        self.val_interval = None  # fitness confidence interval of the last subset validation
+        self.timeline = TrainTimeline(self.save_dir, enabled=self.args.timeline)
+        self.checkpointer = CheckpointWriter(background=self.args.save_async)
         self.loss_names = ["Loss"]
         self.csv = self.save_dir / "results.csv"
         self.plot_idx = [0, 1, 2]
@@ -273,27 +286,33 @@ class BaseTrainer:
         self.args.imgsz = check_imgsz(self.args.imgsz, stride=gs, floor=gs, max_dim=1)
         self.stride = gs  # for multiscale training
 
-        # Batch size
+        # Batch size, estimated for every progressive resizing stage
+        stages = {self.progressive_imgsz(epoch) for epoch in range(self.epochs)} | {self.args.imgsz}
         if self.batch_size < 1 and RANK == -1:  # single-GPU only, estimate best batch size
-            self.args.batch = self.batch_size = check_train_batch_size(
-                model=self.model,
-                imgsz=self.args.imgsz,
-                amp=self.amp,
-                batch=self.batch_size,
-            )
+            self.stage_batch = {
+                imgsz: check_train_batch_size(model=self.model, imgsz=imgsz, amp=self.amp, batch=self.batch_size)
+                for imgsz in sorted(stages)
+            }
+            self.args.batch = self.batch_size = self.stage_batch[self.args.imgsz]
+        else:
+            self.stage_batch = dict.fromkeys(stages, self.batch_size)
 
         # Dataloaders
         batch_size = self.batch_size // max(world_size, 1)
         self.train_loader = self.get_dataloader(self.trainset, batch_size=batch_size, rank=RANK, mode="train")
+        if self.args.progressive and not hasattr(self.train_loader.dataset, "set_imgsz"):
+            LOGGER.warning("WARNING ⚠️ progressive resizing is not supported for this dataset, using 'progressive=0.0'")
+            self.args.progressive = 0.0
         if RANK in {-1, 0}:
             # Note: When training DOTA dataset, double batch size could get OOM on images with >2000 objects.
             self.test_loader = self.get_dataloader(
                 self.testset, batch_size=batch_size if self.args.task == "obb" else batch_size * 2, rank=-1, mode="val"
             )
             self.validator = self.get_validator()
+            self.val_subset_loader = self.get_val_subset_loader()
             metric_keys = self.validator.metrics.keys + self.label_loss_items(prefix="val")
             self.metrics = dict(zip(metric_keys, [0] * len(metric_keys)))
-            self.ema = ModelEMA(self.model)
+            self.ema = ModelEMA(self.model, every=self.args.ema_every)
             if self.args.plots:
                 self.plot_training_labels()
 
@@ -335,10 +354,8 @@ class BaseTrainer:
             f"Logging results to {colorstr('bold', self.save_dir)}\n"
             f'Starting training for ' + (f"{self.args.time} hours..." if self.args.time else f"{self.epochs} epochs...")
         )
-        if self.args.close_mosaic:
-            base_idx = (self.epochs - self.args.close_mosaic) * nb
-            self.plot_idx.extend([base_idx, base_idx + 1, base_idx + 2])
         epoch = self.start_epoch
+        ni = nb * epoch - 1  # cumulative iteration, counted per step as progressive stages change the batch count
         self.optimizer.zero_grad()  # zero any resumed gradients to ensure stability on train start
         while True:
             self.epoch = epoch
@@ -348,6 +365,9 @@ class BaseTrainer:
                 self.scheduler.step()
 
             self.model.train()
+            if self.args.progressive and self.progressive_imgsz(epoch) != self.train_loader.dataset.imgsz:
+                self._set_train_imgsz(self.progressive_imgsz(epoch))
+                nb = len(self.train_loader)
             if RANK != -1:
                 self.train_loader.sampler.set_epoch(epoch)
             pbar = enumerate(self.train_loader)
@@ -355,15 +375,20 @@ class BaseTrainer:
             if epoch == (self.epochs - self.args.close_mosaic):
                 self._close_dataloader_mosaic()
                 self.train_loader.reset()
+                self.plot_idx.extend([ni + 1, ni + 2, ni + 3])
 
             if RANK in {-1, 0}:
                 LOGGER.info(self.progress_string())
                 pbar = TQDM(enumerate(self.train_loader), total=nb)
             self.tloss = None
+            self.meter.reset()
+            self.timeline.start()
             for i, batch in pbar:
+                self.meter.data_ready()
+                self.timeline.mark("data")
                 self.run_callbacks("on_train_batch_start")
                 # Warmup
-                ni = i + nb * epoch
+                ni += 1
                 if ni <= nw:
                     xi = [0, nw]  # x interp
                     self.accumulate = max(1, int(np.interp(ni, xi, [1, self.args.nbs / self.batch_size]).round()))
@@ -376,22 +401,26 @@ class BaseTrainer:
                             x["momentum"] = np.interp(ni, xi, [self.args.warmup_momentum, self.args.momentum])
 
                 # Forward
+                self.timeline.mark("other")
                 with torch.cuda.amp.autocast(self.amp):
                     batch = self.preprocess_batch(batch)
+                    self.timeline.mark("preprocess")
                     self.loss, self.loss_items = self.model(batch)
                     if RANK != -1:
                         self.loss *= world_size
-                    self.tloss = (
-                        (self.tloss * i + self.loss_items) / (i + 1) if self.tloss is not None else self.loss_items
-                    )
+                    self.meter.update(self.loss_items, batch["img"].shape[0])  # running sums stay on device
+
+                self.timeline.mark("forward")
 
                 # Backward
                 self.scaler.scale(self.loss).backward()
+                self.timeline.mark("backward")
 
                 # Optimize - https://pytorch.org/docs/master/notes/amp_examples.html
                 if ni - last_opt_step >= self.accumulate:
                     self.optimizer_step()
                     last_opt_step = ni
+                    self.timeline.mark("optimizer")
 
                     # Timed stopping
                     if self.args.time:
@@ -403,32 +432,47 @@ class BaseTrainer:
                         if self.stop:  # training time exceeded
                             break
 
-                # Log
-                mem = f"{torch.cuda.memory_reserved() / 1E9 if torch.cuda.is_available() else 0:.3g}G"  # (GB)
-                loss_len = self.tloss.shape[0] if len(self.tloss.shape) else 1
-                losses = self.tloss if loss_len > 1 else torch.unsqueeze(self.tloss, 0)
+                # Log, mean losses are only copied to the host every few steps
+                self.meter.step()
                 if RANK in {-1, 0}:
-                    pbar.set_description(
-                        ("%11s" * 2 + "%11.4g" * (2 + loss_len))
-                        % (f"{epoch + 1}/{self.epochs}", mem, *losses, batch["cls"].shape[0], batch["img"].shape[-1])
-                    )
+                    if self.meter.due() or i == nb - 1:
+                        self.tloss = self.meter.sync()
+                        mem = f"{torch.cuda.memory_reserved() / 1E9 if torch.cuda.is_available() else 0:.3g}G"  # (GB)
+                        loss_len = self.tloss.shape[0] if len(self.tloss.shape) else 1
+                        losses = self.tloss if loss_len > 1 else torch.unsqueeze(self.tloss, 0)
+                        nl, imgsz = batch["cls"].shape[0], batch["img"].shape[-1]
+                        pbar.set_description(
+                            ("%11s" * 2 + "%11.4g" * (2 + loss_len))
+                            % (f"{epoch + 1}/{self.epochs}", mem, *losses, nl, imgsz)
+                        )
                     self.run_callbacks("on_batch_end")
                     if self.args.plots and ni in self.plot_idx:
                         self.plot_training_samples(batch, ni)
 
                 self.run_callbacks("on_train_batch_end")
+                self.timeline.mark("other")
 
+            self.tloss = self.meter.sync()  # epoch mean loss items
+            if RANK in {-1, 0}:
+                self.timeline.report(epoch, self.args)
             self.lr = {f"lr/pg{ir}": x["lr"] for ir, x in enumerate(self.optimizer.param_groups)}  # for loggers
             self.run_callbacks("on_train_epoch_end")
             if RANK in {-1, 0}:
                 final_epoch = epoch + 1 >= self.epochs
                 self.ema.update_attr(self.model, include=["yaml", "nc", "args", "names", "stride", "class_weights"])
 
-                # Validation
+                # Validation, on a fixed subset of the val set except every 'val_period' epochs and the final epoch
+                tolerance = 0.0
                 if self.args.val or final_epoch or self.stopper.possible_stop or self.stop:
-                    self.metrics, self.fitness = self.validate()
+                    full = final_epoch or self.stop or (epoch + 1) % max(self.args.val_period, 1) == 0
+                    self.subset_epoch = self.val_subset_loader is not None and not full
+                    if self.subset_epoch:
+                        self.metrics, self.fitness = self.validate_subset()
+                        tolerance = self.args.val_tolerance
+                    else:
+                        self.metrics, self.fitness = self.validate()
                 self.save_metrics(metrics={**self.label_loss_items(self.tloss), **self.metrics, **self.lr})
-                self.stop |= self.stopper(epoch + 1, self.fitness) or final_epoch
+                self.stop |= self.stopper(epoch + 1, self.fitness, tolerance, subset=self.subset_epoch) or final_epoch
                 if self.args.time:
                     self.stop |= (time.time() - self.train_time_start) > (self.args.time * 3600)
 
@@ -466,6 +510,7 @@ class BaseTrainer:
                 f"\n{epoch - self.start_epoch + 1} epochs completed in "
                 f"{(time.time() - self.train_time_start) / 3600:.3f} hours."
             )
+            self.checkpointer.wait()
             self.final_eval()
             if self.args.plots:
                 self.plot_metrics()
@@ -476,38 +521,35 @@ class BaseTrainer:
 
     def save_model(self):
         """Save model training checkpoints with additional metadata."""
-        import io
-
         import pandas as pd  # scope for faster 'import ultralytics'
 
-        # Serialize ckpt to a byte buffer once (faster than repeated torch.save() calls)
-        buffer = io.BytesIO()
-        torch.save(
-            {
-                "epoch": self.epoch,
-                "best_fitness": self.best_fitness,
-                "model": None,  # resume and final checkpoints derive from EMA
-                "ema": deepcopy(self.ema.ema).half(),
-                "updates": self.ema.updates,
-                "optimizer": convert_optimizer_state_dict_to_fp16(deepcopy(self.optimizer.state_dict())),
-                "train_args": vars(self.args),  # save as dict
-                "train_metrics": {**self.metrics, **{"fitness": self.fitness}},
-                "train_results": {k.strip(): v for k, v in pd.read_csv(self.csv).to_dict(orient="list").items()},
-                "date": datetime.now().isoformat(),
-                "version": __version__,
-                "license": "AGPL-3.0 (https://ultralytics.com/license)",
-                "docs": "https://docs.ultralytics.com",
-            },
-            buffer,
-        )
-        serialized_ckpt = buffer.getvalue()  # get the serialized content to save
-
-        # Save checkpoints
-        self.last.write_bytes(serialized_ckpt)  # save last.pt
-        if self.best_fitness == self.fitness:
-            self.best.write_bytes(serialized_ckpt)  # save best.pt
+        t = time.perf_counter()
+        ckpt = {
+            "epoch": self.epoch,
+            "best_fitness": self.best_fitness,
+            "model": None,  # resume and final checkpoints derive from EMA
+            "ema": deepcopy(self.ema.ema).half(),
+            "updates": self.ema.updates,
+            "optimizer": convert_optimizer_state_dict_to_fp16(deepcopy(self.optimizer.state_dict())),
+            "train_args": vars(self.args),  # save as dict
+            "train_metrics": {**self.metrics, **{"fitness": self.fitness}},
+            "train_results": {k.strip(): v for k, v in pd.read_csv(self.csv).to_dict(orient="list").items()},
+            "date": datetime.now().isoformat(),
+            "version": __version__,
+            "license": "AGPL-3.0 (https://ultralytics.com/license)",
+            "docs": "https://docs.ultralytics.com",
+        }
+
+        # Save checkpoints, serialized once and hardlinked to best.pt and 'epoch3.pt' style period checkpoints
+        files = [self.last]
+        if self.best_fitness == self.fitness and not self.subset_epoch:
+            files.append(self.best)
         if (self.save_period > 0) and (self.epoch > 0) and (self.epoch % self.save_period == 0):
-            (self.wdir / f"epoch{self.epoch}.pt").write_bytes(serialized_ckpt)  # save epoch, i.e. 'epoch3.pt'
+            files.append(self.wdir / f"epoch{self.epoch}.pt")
+        self.checkpointer.save(ckpt, files)
+        if self.args.save_async:
+            names = ", ".join(f.name for f in files)
+            LOGGER.info(f"Saving {names} in the background, training blocked {(time.perf_counter() - t) * 1e3:.1f}ms")
 
     def get_dataset(self):
         """
@@ -573,6 +615,38 @@ class BaseTrainer:
             self.best_fitness = fitness
         return metrics, fitness
 
+    def validate_subset(self):
+        """
+        Runs validation on the fixed val subset and logs its fitness with a bootstrapped confidence interval.
+
+        Subset fitness is not comparable to full val fitness, so it leaves 'best_fitness' and best.pt unchanged.
+        """
+        self.validator.dataloader = self.val_subset_loader
+        best_fitness = self.best_fitness
+        try:
+            metrics, fitness = self.validate()
+        finally:
+            self.validator.dataloader = self.test_loader
+            self.best_fitness = best_fitness
+        self.val_interval = self.validator.fitness_interval()
+        n, total = len(self.val_subset_loader.dataset), len(self.test_loader.dataset)
+        ci = f", 95% CI {self.val_interval[0]:.4f}-{self.val_interval[1]:.4f}" if self.val_interval else ""
+        LOGGER.info(f"Validated subset of {n}/{total} images, fitness {fitness:.4f}{ci}")
+        return metrics, fitness
+
+    def get_val_subset_loader(self):
+        """Returns a dataloader over a fixed class-stratified 'val_subset' fraction of the val set, or None."""
+        dataset = self.test_loader.dataset
+        if self.args.val_subset >= 1.0 or not self.args.val:
+            return None
+        if not hasattr(dataset, "subset"):
+            LOGGER.warning(f"WARNING ⚠️ 'val_subset' is not supported for {self.args.task} datasets, using full val")
+            return None
+        indices = stratified_subset(dataset.labels, self.args.val_subset, seed=self.args.seed)
+        return build_dataloader(
+            dataset.subset(indices), self.test_loader.batch_size, self.test_loader.num_workers, shuffle=False, rank=-1
+        )
+
     def get_model(self, cfg=None, weights=None, verbose=True):
         """Get model and raise NotImplementedError for loading cfg files."""
         raise NotImplementedError("This task trainer doesn't support loading cfg files")
@@ -702,6 +776,31 @@ class BaseTrainer:
         if start_epoch > (self.epochs - self.args.close_mosaic):
             self._close_dataloader_mosaic()
 
+    def progressive_imgsz(self, epoch):
+        """
+        Return the training image size of 'epoch', growing in 4 stages from 'progressive_min' * imgsz to imgsz.
+
+        Stage sizes are floored to multiples of the stride, so stages less than a stride apart share a size at small
+        imgsz, i.e. [64, 64, 96] below imgsz=128.
+        """
+        n = round(self.args.progressive * self.epochs)  # epochs trained below imgsz
+        if epoch >= n:
+            return self.args.imgsz
+        scale = self.args.progressive_min + (1 - self.args.progressive_min) * (epoch * 4 // n) / 4
+        return max(int(scale * self.args.imgsz // self.stride) * self.stride, self.stride)
+
+    def _set_train_imgsz(self, imgsz):
+        """Switch the train dataloader to a progressive resizing stage, rebuilding it for a different batch size."""
+        dataset = self.train_loader.dataset
+        dataset.set_imgsz(imgsz, hyp=self.args)
+        if self.stage_batch[imgsz] == self.batch_size:
+            self.train_loader.reset()
+        else:  # single-GPU only, batch size estimated for this stage
+            self.batch_size = self.stage_batch[imgsz]
+            self.accumulate = max(round(self.args.nbs / self.batch_size), 1)
+            self.train_loader = build_dataloader(dataset, self.batch_size, self.args.workers, not dataset.rect, RANK)
+        LOGGER.info(f"Progressive resizing to imgsz={imgsz}, batch={self.batch_size}")
+
     def _close_dataloader_mosaic(self):
         """Update dataloaders to stop using mosaic augmentation."""
         if hasattr(self.train_loader.dataset, "mosaic"):
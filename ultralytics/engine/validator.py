@@ -220,44 +220,69 @@ class BaseValidator:
         """
         Matches predictions to ground truth objects (pred_classes, true_classes) using IoU.
 
+        Greedy matching runs on the device of `iou` for all IoU thresholds at once, see `match_batch`.
+
         Args:
             pred_classes (torch.Tensor): Predicted class indices of shape(N,).
             true_classes (torch.Tensor): Target class indices of shape(M,).
-            iou (torch.Tensor): An NxM tensor containing the pairwise IoU values for predictions and ground of truth
+            iou (torch.Tensor): An MxN tensor containing the pairwise IoU values for ground truth and predictions.
             use_scipy (bool): Whether to use scipy for matching (more precise).
 
         Returns:
             (torch.Tensor): Correct tensor of shape(N,10) for 10 IoU thresholds.
         """
-        # Dx10 matrix, where D - detections, 10 - IoU thresholds
-        correct = np.zeros((pred_classes.shape[0], self.iouv.shape[0])).astype(bool)
         # LxD matrix where L - labels (rows), D - detections (columns)
         correct_class = true_classes[:, None] == pred_classes
         iou = iou * correct_class  # zero out the wrong classes
+        if not use_scipy:
+            return self.match_batch(iou[None])[0]
+
+        # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
+        import scipy  # scope import to avoid importing for all commands
+
+        # Dx10 matrix, where D - detections, 10 - IoU thresholds
+        correct = np.zeros((pred_classes.shape[0], self.iouv.shape[0])).astype(bool)
         iou = iou.cpu().numpy()
         for i, threshold in enumerate(self.iouv.cpu().tolist()):
-            if use_scipy:
-                # WARNING: known issue that reduces mAP in https://github.com/ultralytics/ultralytics/pull/4708
-                import scipy  # scope import to avoid importing for all commands
-
-                cost_matrix = iou * (iou >= threshold)
-                if cost_matrix.any():
-                    labels_idx, detections_idx = scipy.optimize.linear_sum_assignment(cost_matrix, maximize=True)
-                    valid = cost_matrix[labels_idx, detections_idx] > 0
-                    if valid.any():
-                        correct[detections_idx[valid], i] = True
-            else:
-                matches = np.nonzero(iou >= threshold)  # IoU > threshold and classes match
-                matches = np.array(matches).T
-                if matches.shape[0]:
-                    if matches.shape[0] > 1:
-                        matches = matches[iou[matches[:, 0], matches[:, 1]].argsort()[::-1]]
-                        matches = matches[np.unique(matches[:, 1], return_index=True)[1]]
-                        # matches = matches[matches[:, 2].argsort()[::-1]]
-                        matches = matches[np.unique(matches[:, 0], return_index=True)[1]]
-                    correct[matches[:, 1].astype(int), i] = True
+            cost_matrix = iou * (iou >= threshold)
+            if cost_matrix.any():
+                labels_idx, detections_idx = scipy.optimize.linear_sum_assignment(cost_matrix, maximize=True)
+                valid = cost_matrix[labels_idx, detections_idx] > 0
+                if valid.any():
+                    correct[detections_idx[valid], i] = True
         return torch.tensor(correct, dtype=torch.bool, device=pred_classes.device)
 
+    def match_batch(self, iou):
+        """
+        Matches predictions to ground truth objects of several images at all IoU thresholds in one vectorized pass.
+
+        Every prediction is assigned its highest-IoU ground truth, and at each threshold every ground truth keeps the
+        first prediction assigned to it with an IoU above the threshold. A single sort of the assigned pairs by ground
+        truth serves all thresholds, as the candidates at a higher threshold are a subset of those at a lower one.
+
+        Args:
+            iou (torch.Tensor): A BxMxN tensor of IoU values between the M ground truths and N predictions of B images,
+                zero for mismatched classes and padding.
+
+        Returns:
+            (torch.Tensor): Correct tensor of shape(B,N,10) for 10 IoU thresholds.
+        """
+        b, m, n = iou.shape
+        iouv = self.iouv.to(iou.device)
+        correct = torch.zeros((b, n, len(iouv)), dtype=torch.bool, device=iou.device)
+        best, label = iou.max(1) if m else (iou.new_zeros(b, n), None)  # best ground truth of every prediction
+        i, j = torch.nonzero(best >= iouv[0], as_tuple=True)
+        if len(i):
+            group = i * m + label[i, j]  # image and ground truth
+            order = (group * n + j).argsort()  # by ground truth, then prediction order
+            i, j, group = i[order], j[order], group[order]
+            candidate = best[i, j, None] >= iouv  # KxT
+            first = torch.ones_like(group, dtype=torch.bool)
+            first[1:] = group[1:] != group[:-1]
+            before = candidate.cumsum(0) - candidate.long()  # candidates before each row
+            correct[i, j] = candidate & (before == before[first][first.cumsum(0) - 1])  # first candidate of its group
+        return correct
+
     def add_callback(self, event: str, callback):
         """Appends the given callback."""
         self.callbacks[event].append(callback)
@@ -303,6 +328,10 @@ class BaseValidator:
         """Checks statistics."""
         pass
 
+    def fitness_interval(self, n=30, z=1.96):
+        """Returns a (low, high) confidence interval of fitness from the last validation, or None if unsupported."""
+        return None
+
     def print_results(self):
         """Prints the results of the model's predictions."""
         pass
@@ -1,7 +1,10 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
+import torch
+import torchvision
+
 from ultralytics.engine.predictor import BasePredictor
-from ultralytics.engine.results import Results
+from ultralytics.engine.results import BatchResults, Results
 from ultralytics.utils import ops
 
 
@@ -9,6 +12,10 @@ class DetectionPredictor(BasePredictor):
     """
     A class extending the BasePredictor class for prediction based on a detection model.
 
+    Set `tile` to a tile size in pixels to run sliced inference on large images: every image is split into overlapping
+    tiles of that size (see `tile_overlap`), the tiles of a batch are run in forward passes of at most `batch` tiles,
+    and their boxes are mapped back to image coordinates and merged with NMS.
+
     Example:
         ```python
         from ultralytics.utils import ASSETS
@@ -20,6 +27,56 @@ class DetectionPredictor(BasePredictor):
         ```
     """
 
+    def preprocess(self, im):
+        """Prepares input images for inference, splitting them into overlapping tiles if `tile` is set."""
+        self.tiles = None
+        if not self.args.tile or self.args.task != "detect" or isinstance(im, torch.Tensor):
+            return super().preprocess(im)
+
+        # Tiles are views into the original images, only the letterboxed tile batch is allocated
+        crops, self.tiles = [], []
+        for i, x in enumerate(im):
+            for x0, y0 in ops.tile_offsets(x.shape, self.args.tile, self.args.tile_overlap):
+                crops.append(x[y0 : y0 + self.args.tile, x0 : x0 + self.args.tile])
+                self.tiles.append((i, x0, y0))
+        return super().preprocess(crops)
+
+    def inference(self, im, *args, **kwargs):
+        """Runs inference on the tile batch in chunks of at most `batch` tiles to bound memory use."""
+        inference, n = super().inference, max(self.args.batch, 1)
+        if not self.tiles or len(im) <= n:
+            return inference(im, *args, **kwargs)
+        preds = [inference(x, *args, **kwargs) for x in im.split(n)]
+        if self.args.embed:  # per-tile embeddings
+            return [e for p in preds for e in p]
+        return torch.cat([p[0] if isinstance(p, (list, tuple)) else p for p in preds])
+
+    def merge_tiles(self, preds, img, crop_shapes, n):
+        """
+        Map per-tile predictions to image coordinates and merge duplicates across tile borders with one batched NMS.
+
+        Args:
+            preds (List[torch.Tensor]): Per-tile detections (n, 6) as xyxy, conf, cls in letterboxed tile coordinates.
+            img (torch.Tensor): The preprocessed tile batch (T, 3, h, w).
+            crop_shapes (List[tuple]): Shape of each tile crop (h, w).
+            n (int): Number of images in the batch.
+
+        Returns:
+            (List[torch.Tensor]): Detections (n, 6) of each image in original image coordinates.
+        """
+        for pred, shape, (_, x0, y0) in zip(preds, crop_shapes, self.tiles):
+            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], shape)
+            pred[:, :4] += pred.new_tensor([x0, y0, x0, y0])
+        pred = torch.cat(preds)
+        image = torch.cat([torch.full((len(p),), t[0], device=pred.device) for p, t in zip(preds, self.tiles)])
+        if self.args.agnostic_nms:
+            groups = image  # one NMS group per image
+        else:
+            groups = image * len(self.model.names) + pred[:, 5].long()  # one NMS group per image and class
+        i = torchvision.ops.batched_nms(pred[:, :4], pred[:, 4], groups, self.args.iou)  # sorted by score
+        pred, image = pred[i], image[i]
+        return [pred[image == j][: self.args.max_det] for j in range(n)]
+
     def postprocess(self, preds, img, orig_imgs):
         """Post-processes predictions and returns a list of Results objects."""
         preds = ops.non_max_suppression(
@@ -34,10 +91,17 @@ class DetectionPredictor(BasePredictor):
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
 
+        if self.tiles:  # boxes are returned in original image coordinates
+            shapes = [(min(self.args.tile, x.shape[0]), min(self.args.tile, x.shape[1])) for x in orig_imgs]
+            preds = self.merge_tiles(preds, img, [shapes[t[0]] for t in self.tiles], len(orig_imgs))
+        else:
+            for pred, orig_img in zip(preds, orig_imgs):
+                pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+
+        if self.args.batch_results:  # one columnar container per batch, per-image Results are created on demand
+            return BatchResults.from_preds(preds, orig_imgs, self.batch[0], self.model.names)
+
         results = []
-        for i, pred in enumerate(preds):
-            orig_img = orig_imgs[i]
-            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
-            img_path = self.batch[0][i]
+        for pred, orig_img, img_path in zip(preds, orig_imgs, self.batch[0]):
             results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=pred))
         return results
@@ -10,7 +10,7 @@ from ultralytics.data import build_dataloader, build_yolo_dataset, converter
 from ultralytics.engine.validator import BaseValidator
 from ultralytics.utils import LOGGER, ops
 from ultralytics.utils.checks import check_requirements
-from ultralytics.utils.metrics import ConfusionMatrix, DetMetrics, box_iou
+from ultralytics.utils.metrics import APHistogram, ConfusionMatrix, DetMetrics, StatBuffer, box_iou
 from ultralytics.utils.plotting import output_to_target, plot_images
 
 
@@ -33,6 +33,7 @@ class DetectionValidator(BaseValidator):
         super().__init__(dataloader, save_dir, pbar, args, _callbacks)
         self.nt_per_class = None
         self.nt_per_image = None
+        self.hist = None
         self.is_coco = False
         self.is_lvis = False
         self.class_map = None
@@ -83,7 +84,11 @@ class DetectionValidator(BaseValidator):
         self.confusion_matrix = ConfusionMatrix(nc=self.nc, conf=self.args.conf)
         self.seen = 0
         self.jdict = []
-        self.stats = dict(tp=[], conf=[], pred_cls=[], target_cls=[], target_img=[])
+        self.hist = None
+        if self.args.ap_bins and self.args.task in {"detect", "obb"}:  # streaming mAP, predictions are not stored
+            self.hist = APHistogram(self.nc, self.niou, self.args.ap_bins, device=self.device)
+        keys = ("target_cls", "target_img") if self.hist else ("tp", "conf", "pred_cls", "target_cls", "target_img")
+        self.stats = {k: StatBuffer() for k in keys}
 
     def get_desc(self):
         """Return a formatted string summarizing class metrics of YOLO model."""
@@ -123,7 +128,73 @@ class DetectionValidator(BaseValidator):
         return predn
 
     def update_metrics(self, preds, batch):
-        """Metrics."""
+        """
+        Metrics, evaluated for all images of the batch at once.
+
+        Labels and predictions are scaled to native space for the whole batch, their IoU is computed in padded per-image
+        blocks and matched at all IoU thresholds in one pass. Subclasses that customize the per-image
+        `_prepare_batch`, `_prepare_pred` or `_process_batch` steps are evaluated image by image instead.
+        """
+        if any(
+            getattr(type(self), k) is not getattr(DetectionValidator, k)
+            for k in ("_prepare_batch", "_prepare_pred", "_process_batch")
+        ):
+            return self.update_metrics_per_image(preds, batch)
+
+        bs, imgsz = len(preds), batch["img"].shape[2:]
+        self.seen += bs
+        if self.args.single_cls:
+            for pred in preds:
+                pred[:, 5] = 0
+        npr = [len(pred) for pred in preds]
+        li = batch["batch_idx"].long()
+        nl = li.bincount(minlength=bs).tolist()
+        pi = torch.arange(bs, device=self.device).repeat_interleave(torch.tensor(npr, device=self.device))
+        cls = batch["cls"].squeeze(-1)
+        bbox = ops.xywh2xyxy(batch["bboxes"]) * torch.tensor(imgsz, device=self.device)[[1, 0, 1, 0]]  # target boxes
+        predn = torch.cat(preds) if bs else torch.zeros((0, 6), device=self.device)
+
+        # Native-space labels and predictions, as ops.scale_boxes() with the ratio_pad of each image
+        gain = torch.tensor([x[0][0] for x in batch["ratio_pad"]], device=self.device)[:, None]
+        pad = torch.tensor([x[1] for x in batch["ratio_pad"]], device=self.device).repeat(1, 2)
+        shape = torch.tensor(batch["ori_shape"], device=self.device)[:, [1, 0, 1, 0]]
+        bbox = torch.min(((bbox - pad[li]) / gain[li]).clamp(min=0), shape[li])
+        predn[:, :4] = torch.min(((predn[:, :4] - pad[pi]) / gain[pi]).clamp(min=0), shape[pi])
+
+        # Evaluate, labels and predictions of each image are padded to (bs, max(nl), 4) and (bs, max(npr), 4)
+        tp = torch.zeros(len(predn), self.niou, dtype=torch.bool, device=self.device)
+        if len(bbox) and len(predn):
+            lj = torch.arange(len(li), device=self.device) - li.new_tensor([0] + nl[:-1]).cumsum(0)[li]  # in image
+            pj = torch.arange(len(pi), device=self.device) - pi.new_tensor([0] + npr[:-1]).cumsum(0)[pi]
+            gt, det = bbox.new_zeros(bs, max(nl), 4), predn.new_zeros(bs, max(npr), 4)
+            gt_cls, det_cls = cls.new_full((bs, max(nl)), -1), predn.new_full((bs, max(npr)), -2)
+            gt[li, lj], gt_cls[li, lj] = bbox, cls
+            det[pi, pj], det_cls[pi, pj] = predn[:, :4], predn[:, 5]
+            iou = box_iou(gt, det) * (gt_cls[:, :, None] == det_cls[:, None])  # zero out wrong classes and padding
+            tp = self.match_batch(iou)[pi, pj]
+
+        # Images without labels and predictions do not contribute statistics
+        keep = [i for i in range(bs) if nl[i] or npr[i]]
+        target_img = (li * self.nc + cls.long()).unique()  # classes present in each image
+        nt = (target_img // self.nc).bincount(minlength=bs).tolist()
+        if self.hist is not None:
+            self.hist.update(tp, predn[:, 4], predn[:, 5])
+        else:
+            self.stats["tp"].append(tp, [npr[i] for i in keep])
+            self.stats["conf"].append(predn[:, 4], [npr[i] for i in keep])
+            self.stats["pred_cls"].append(predn[:, 5], [npr[i] for i in keep])
+        self.stats["target_cls"].append(cls, [nl[i] for i in keep])
+        self.stats["target_img"].append((target_img % self.nc).to(cls.dtype), [nt[i] for i in keep])
+
+        if self.args.plots or self.args.save_json or self.args.save_txt:
+            for si, (pred, bbox_i, cls_i) in enumerate(zip(predn.split(npr), bbox.split(nl), cls.split(nl))):
+                if self.args.plots and nl[si]:
+                    self.confusion_matrix.process_batch(pred if npr[si] else None, bbox_i, cls_i)
+                if npr[si]:
+                    self.save_one(pred, batch, si)
+
+    def update_metrics_per_image(self, preds, batch):
+        """Metrics, evaluated image by image."""
         for si, pred in enumerate(preds):
             self.seen += 1
             npr = len(pred)
@@ -159,17 +230,23 @@ class DetectionValidator(BaseValidator):
                     self.confusion_matrix.process_batch(predn, bbox, cls)
             for k in self.stats.keys():
                 self.stats[k].append(stat[k])
+            if self.hist is not None:
+                self.hist.update(stat["tp"], stat["conf"], stat["pred_cls"])
 
             # Save
-            if self.args.save_json:
-                self.pred_to_json(predn, batch["im_file"][si])
-            if self.args.save_txt:
-                self.save_one_txt(
-                    predn,
-                    self.args.save_conf,
-                    pbatch["ori_shape"],
-                    self.save_dir / "labels" / f'{Path(batch["im_file"][si]).stem}.txt',
-                )
+            self.save_one(predn, batch, si)
+
+    def save_one(self, predn, batch, si):
+        """Save the native-space predictions of image `si` of the batch to JSON and txt if enabled."""
+        if self.args.save_json:
+            self.pred_to_json(predn, batch["im_file"][si])
+        if self.args.save_txt:
+            self.save_one_txt(
+                predn,
+                self.args.save_conf,
+                batch["ori_shape"][si],
+                self.save_dir / "labels" / f'{Path(batch["im_file"][si]).stem}.txt',
+            )
 
     def finalize_metrics(self, *args, **kwargs):
         """Set final values for metrics speed and confusion matrix."""
@@ -178,7 +255,9 @@ class DetectionValidator(BaseValidator):
 
     def get_stats(self):
         """Returns metrics statistics and results dictionary."""
-        stats = {k: torch.cat(v, 0).cpu().numpy() for k, v in self.stats.items()}  # to numpy
+        stats = {k: v.tensor().cpu().numpy() for k, v in self.stats.items()}  # to numpy
+        if self.hist is not None:
+            stats.update(self.hist.stats())  # binned predictions
         self.nt_per_class = np.bincount(stats["target_cls"].astype(int), minlength=self.nc)
         self.nt_per_image = np.bincount(stats["target_img"].astype(int), minlength=self.nc)
         stats.pop("target_img", None)
@@ -186,6 +265,35 @@ class DetectionValidator(BaseValidator):
             self.metrics.process(**stats)
         return self.metrics.results_dict
 
+    def fitness_interval(self, n=30, z=1.96):
+        """
+        Estimate a confidence interval of fitness from the last validation by bootstrapping over validated images.
+
+        Args:
+            n (int): Number of bootstrap resamples.
+            z (float): Normal quantile of the interval, 1.96 for 95%.
+
+        Returns:
+            (tuple | None): The (low, high) interval, or None if fewer than 2 images contributed statistics or
+                predictions were only counted in `ap_bins` histograms.
+        """
+        ni = len(self.stats["target_cls"])
+        if ni < 2 or self.hist is not None:
+            return None
+        stats = {}
+        for k, v in self.stats.items():
+            if k != "target_img":
+                stats[k] = np.split(v.tensor().cpu().numpy(), v.offsets[1:-1])  # per image
+        metrics = type(self.metrics)(names=self.names)  # no plots, leaves self.metrics untouched
+        rng = np.random.default_rng(0)
+        fitness = []
+        for _ in range(n):
+            i = rng.integers(0, ni, ni)  # resample images with replacement
+            metrics.process(**{k: np.concatenate([v[j] for j in i]) for k, v in stats.items()})
+            fitness.append(metrics.fitness)
+        std = np.std(fitness)
+        return self.metrics.fitness - z * std, self.metrics.fitness + z * std
+
     def print_results(self):
         """Prints training/validation set metrics per class."""
         pf = "%22s" + "%11i" * 2 + "%11.3g" * len(self.metrics.keys)  # print format
@@ -304,35 +412,32 @@ class DetectionValidator(BaseValidator):
                 / "annotations"
                 / ("instances_val2017.json" if self.is_coco else f"lvis_v1_{self.args.split}.json")
             )  # annotations
-            pkg = "pycocotools" if self.is_coco else "lvis"
+            pkg = "COCO" if self.is_coco else "lvis"
             LOGGER.info(f"\nEvaluating {pkg} mAP using {pred_json} and {anno_json}...")
-            try:  # https://github.com/cocodataset/cocoapi/blob/master/PythonAPI/pycocoEvalDemo.ipynb
-                for x in pred_json, anno_json:
-                    assert x.is_file(), f"{x} file not found"
-                check_requirements("pycocotools>=2.0.6" if self.is_coco else "lvis>=0.5.3")
-                if self.is_coco:
-                    from pycocotools.coco import COCO  # noqa
-                    from pycocotools.cocoeval import COCOeval  # noqa
-
-                    anno = COCO(str(anno_json))  # init annotations api
-                    pred = anno.loadRes(str(pred_json))  # init predictions api (must pass string, not Path)
-                    val = COCOeval(anno, pred, "bbox")
-                else:
+            try:
+                img_ids = [int(Path(x).stem) for x in self.dataloader.dataset.im_files]  # images to eval
+                if self.is_coco:  # in-package evaluator on the in-memory predictions, matches pycocotools
+                    from ultralytics.utils.cocoeval import COCOEvaluator
+
+                    assert anno_json.is_file(), f"{anno_json} file not found"
+                    val = COCOEvaluator(anno_json, img_ids=img_ids)
+                    stats[self.metrics.keys[-1]], stats[self.metrics.keys[-2]] = val.evaluate(self.jdict)[:2]
+                else:  # https://github.com/cocodataset/cocoapi/blob/master/PythonAPI/pycocoEvalDemo.ipynb
+                    for x in pred_json, anno_json:
+                        assert x.is_file(), f"{x} file not found"
+                    check_requirements("lvis>=0.5.3")
                     from lvis import LVIS, LVISEval
 
                     anno = LVIS(str(anno_json))  # init annotations api
                     pred = anno._load_json(str(pred_json))  # init predictions api (must pass string, not Path)
                     val = LVISEval(anno, pred, "bbox")
-                val.params.imgIds = [int(Path(x).stem) for x in self.dataloader.dataset.im_files]  # images to eval
-                val.evaluate()
-                val.accumulate()
-                val.summarize()
-                if self.is_lvis:
+                    val.params.imgIds = img_ids
+                    val.evaluate()
+                    val.accumulate()
+                    val.summarize()
                     val.print_results()  # explicitly call print_results
-                # update mAP50-95 and mAP50
-                stats[self.metrics.keys[-1]], stats[self.metrics.keys[-2]] = (
-                    val.stats[:2] if self.is_coco else [val.results["AP50"], val.results["AP"]]
-                )
+                    # update mAP50-95 and mAP50
+                    stats[self.metrics.keys[-1]], stats[self.metrics.keys[-2]] = val.results["AP50"], val.results["AP"]
             except Exception as e:
                 LOGGER.warning(f"{pkg} unable to run: {e}")
         return stats
@@ -10,7 +10,7 @@ import torch.nn.functional as F
 from ultralytics.models.yolo.detect import DetectionValidator
 from ultralytics.utils import LOGGER, NUM_THREADS, ops
 from ultralytics.utils.checks import check_requirements
-from ultralytics.utils.metrics import SegmentMetrics, box_iou, mask_iou
+from ultralytics.utils.metrics import SegmentMetrics, StatBuffer, box_iou, mask_iou
 from ultralytics.utils.plotting import output_to_target, plot_images
 
 
@@ -50,7 +50,7 @@ class SegmentationValidator(DetectionValidator):
             check_requirements("pycocotools>=2.0.6")
         # more accurate vs faster
         self.process = ops.process_mask_native if self.args.save_json or self.args.save_txt else ops.process_mask
-        self.stats = dict(tp_m=[], tp=[], conf=[], pred_cls=[], target_cls=[], target_img=[])
+        self.stats = {k: StatBuffer() for k in ("tp_m", "tp", "conf", "pred_cls", "target_cls", "target_img")}
 
     def get_desc(self):
         """Return a formatted description of evaluation metrics."""
@@ -1,12 +1,17 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
+import csv
+import json
 import warnings
-from itertools import cycle
+from collections import deque
+from itertools import cycle, islice
+from pathlib import Path
 
 import cv2
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+from matplotlib.colors import to_rgb
 from matplotlib.figure import Figure
 
 
@@ -30,6 +35,9 @@ class Analytics:
         view_img=False,
         save_img=True,
         max_points=50,
+        render_interval=1,
+        backend="matplotlib",
+        output=None,
     ):
         """
         Initialize the Analytics class with various chart types.
@@ -49,7 +57,18 @@ class Analytics:
             fontsize (int): Font size for chart text.
             view_img (bool): Whether to display the image.
             save_img (bool): Whether to save the image.
-            max_points (int): Specifies when to remove the oldest points in a graph for multiple lines.
+            max_points (int): Number of latest points shown by line and area charts.
+            render_interval (int): Render the chart every this many updates, the last chart is written in between.
+            backend (str): Chart renderer, 'matplotlib' or 'opencv' for fast direct drawing with OpenCV.
+            output (str | Path, optional): CSV or JSON file the raw series are written to by `save`. All points are
+                kept when set, otherwise only the last 'max_points' and none for bar and pie charts. No chart is
+                rendered when set with 'save_img' and 'view_img' False, for headless servers.
+
+        Examples:
+            >>> analytics = Analytics("line", writer=None, im0_shape=(640, 480), save_img=False, output="counts.csv")
+            >>> for frame_number, count in enumerate(counts):
+            ...     analytics.update_line(frame_number, count)
+            >>> analytics.save()
         """
 
         self.bg_color = bg_color
@@ -65,6 +84,37 @@ class Analytics:
         self.points_width = points_width
         self.line_width = line_width
         self.fontsize = fontsize
+        self.type = type
+        self.im0_shape = im0_shape
+        self.render_interval = max(int(render_interval), 1)
+        self.backend = backend
+        self.output = output
+
+        color_palette = [
+            (31, 119, 180),
+            (255, 127, 14),
+            (44, 160, 44),
+            (214, 39, 40),
+            (148, 103, 189),
+            (140, 86, 75),
+            (227, 119, 194),
+            (127, 127, 127),
+            (188, 189, 34),
+            (23, 190, 207),
+        ]
+        self.color_palette = [(r / 255, g / 255, b / 255, 1) for r, g, b in color_palette]
+        self.color_cycle = cycle(self.color_palette)
+        self.color_mapping = {}
+
+        # Raw series, x values and the y values by label of every point, bounded unless written to 'output'
+        maxlen = None if output is not None else 0 if type in {"bar", "pie"} else max_points
+        self.x = deque(maxlen=maxlen)
+        self.rows = deque(maxlen=maxlen)
+        self.labels = {}  # labels in order of appearance
+        self.last = {}  # last values of bar and pie charts
+        self.multiple = False  # line chart with one line per class
+        self.updates = 0
+        self.im0 = None  # last rendered chart
 
         # Set figure size based on image shape
         figsize = (im0_shape[0] / 100, im0_shape[1] / 100)
@@ -82,21 +132,6 @@ class Analytics:
             # Initialize bar or pie plot
             self.fig, self.ax = plt.subplots(figsize=figsize, facecolor=self.bg_color)
             self.ax.set_facecolor(self.bg_color)
-            color_palette = [
-                (31, 119, 180),
-                (255, 127, 14),
-                (44, 160, 44),
-                (214, 39, 40),
-                (148, 103, 189),
-                (140, 86, 75),
-                (227, 119, 194),
-                (127, 127, 127),
-                (188, 189, 34),
-                (23, 190, 207),
-            ]
-            self.color_palette = [(r / 255, g / 255, b / 255, 1) for r, g, b in color_palette]
-            self.color_cycle = cycle(self.color_palette)
-            self.color_mapping = {}
 
             # Ensure pie chart is circular
             self.ax.axis("equal") if type == "pie" else None
@@ -107,6 +142,26 @@ class Analytics:
         self.ax.set_ylabel(y_label, color=self.fg_color, fontsize=self.fontsize - 3)
         self.ax.tick_params(axis="both", colors=self.fg_color)
 
+    def add(self, x, values):
+        """
+        Append a point to the raw series, the oldest point is dropped when the series is bounded and full.
+
+        Args:
+            x (float): X value, the frame number or update index.
+            values (dict): Y values by label, labels missing from it get 0.
+        """
+        if self.x.maxlen == 0:
+            return
+        self.x.append(float(x))
+        self.rows.append({k: float(v) for k, v in values.items()})
+        self.labels.update(dict.fromkeys(values))
+
+    def series(self, last=None):
+        """Return the x values (N,) and the y values (N,) by label of the last 'last' points, or all points if None."""
+        n = len(self.x) if last is None else min(last, len(self.x))
+        x, rows = list(islice(reversed(self.x), n))[::-1], list(islice(reversed(self.rows), n))[::-1]
+        return np.array(x), {k: np.array([r.get(k, 0.0) for r in rows]) for k in self.labels}
+
     def update_area(self, frame_number, counts_dict):
         """
         Update the area graph with new data for multiple classes.
@@ -115,29 +170,105 @@ class Analytics:
             frame_number (int): The current frame number.
             counts_dict (dict): Dictionary with class names as keys and counts as values.
         """
+        self.add(frame_number, counts_dict)
+        self.step()
 
-        x_data = np.array([])
-        y_data_dict = {key: np.array([]) for key in counts_dict.keys()}
+    def update_line(self, frame_number, total_counts):
+        """
+        Update the line graph with new data.
 
-        if self.ax.lines:
-            x_data = self.ax.lines[0].get_xdata()
-            for line, key in zip(self.ax.lines, counts_dict.keys()):
-                y_data_dict[key] = line.get_ydata()
+        Args:
+            frame_number (int): The current frame number.
+            total_counts (int): The total counts to plot.
+        """
+        self.add(frame_number, {self.y_label: total_counts})
+        self.step()
 
-        x_data = np.append(x_data, float(frame_number))
-        max_length = len(x_data)
+    def update_multiple_lines(self, counts_dict, labels_list, frame_number):
+        """
+        Update the line graph with multiple classes.
 
-        for key in counts_dict.keys():
-            y_data_dict[key] = np.append(y_data_dict[key], float(counts_dict[key]))
-            if len(y_data_dict[key]) < max_length:
-                y_data_dict[key] = np.pad(y_data_dict[key], (0, max_length - len(y_data_dict[key])), "constant")
+        Args:
+            counts_dict (int): Dictionary include each class counts.
+            labels_list (int): list include each classes names.
+            frame_number (int): The current frame number.
+        """
+        if self.view_img:
+            warnings.warn("Display is not supported for multiple lines, output will be stored normally!")
+        self.view_img = False  # for multiple line view_img not supported yet, coming soon!
+        self.multiple = True
+        self.add(frame_number, {obj: counts_dict.get(obj, 0) for obj in labels_list})
+        self.step()
 
-        # Remove the oldest points if the number of points exceeds max_points
-        if len(x_data) > self.max_points:
-            x_data = x_data[1:]
-            for key in counts_dict.keys():
-                y_data_dict[key] = y_data_dict[key][1:]
+    def update_bar(self, count_dict):
+        """
+        Update the bar graph with new data.
 
+        Args:
+            count_dict (dict): Dictionary containing the count data to plot.
+        """
+        self.last = dict(count_dict)
+        self.add(self.updates, count_dict)
+        self.step()
+
+    def update_pie(self, classes_dict):
+        """
+        Update the pie chart with new data.
+
+        Args:
+            classes_dict (dict): Dictionary containing the class data to plot.
+        """
+        self.last = dict(classes_dict)
+        self.add(self.updates, classes_dict)
+        self.step()
+
+    def step(self):
+        """Count an update and render the chart every 'render_interval' updates, writing the last chart otherwise."""
+        self.updates += 1
+        if not (self.save_img or self.view_img):
+            return
+        if self.im0 is None or (self.updates - 1) % self.render_interval == 0:
+            self.im0 = self.render()
+        self.write_and_display(self.im0)
+
+    def render(self):
+        """Render the chart of the current series and return it as a BGR image."""
+        if self.backend == "opencv":
+            return self.render_opencv()
+        getattr(self, "plot_lines" if self.multiple else f"plot_{self.type}")()
+        self.fig.canvas.draw()
+        return cv2.cvtColor(np.array(self.fig.canvas.renderer.buffer_rgba())[:, :, :3], cv2.COLOR_RGB2BGR)
+
+    def save(self, file=None):
+        """
+        Write the raw series to a CSV or JSON file.
+
+        Args:
+            file (str | Path, optional): Output file, defaults to 'output'.
+
+        Returns:
+            (Path): The written file.
+        """
+        file = Path(file or self.output or f"{self.title}.csv")
+        if file.suffix == ".json":
+            series = {k: [r.get(k, 0.0) for r in self.rows] for k in self.labels}
+            file.write_text(json.dumps({"type": self.type, "x": list(self.x), "series": series}))
+        else:
+            with open(file, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["x", *self.labels])
+                writer.writerows([x, *(r.get(k, 0.0) for k in self.labels)] for x, r in zip(self.x, self.rows))
+        return file
+
+    def set_labels(self):
+        """Set the title and axis labels of the matplotlib chart."""
+        self.ax.set_title(self.title, color=self.fg_color, fontsize=self.fontsize)
+        self.ax.set_xlabel(self.x_label, color=self.fg_color, fontsize=self.fontsize - 3)
+        self.ax.set_ylabel(self.y_label, color=self.fg_color, fontsize=self.fontsize - 3)
+
+    def plot_area(self):
+        """Plot the area graph of the last 'max_points' points with matplotlib."""
+        x_data, y_data_dict = self.series(self.max_points)
         self.ax.clear()
 
         colors = ["#E1FF25", "#0BDBEB", "#FF64DA", "#111F68", "#042AFF"]
@@ -156,99 +287,39 @@ class Analytics:
                 label=f"{key} Data Points",
             )
 
-        self.ax.set_title(self.title, color=self.fg_color, fontsize=self.fontsize)
-        self.ax.set_xlabel(self.x_label, color=self.fg_color, fontsize=self.fontsize - 3)
-        self.ax.set_ylabel(self.y_label, color=self.fg_color, fontsize=self.fontsize - 3)
+        self.set_labels()
         legend = self.ax.legend(loc="upper left", fontsize=13, facecolor=self.bg_color, edgecolor=self.fg_color)
 
         # Set legend text color
         for text in legend.get_texts():
             text.set_color(self.fg_color)
 
-        self.canvas.draw()
-        im0 = np.array(self.canvas.renderer.buffer_rgba())
-        self.write_and_display(im0)
-
-    def update_line(self, frame_number, total_counts):
-        """
-        Update the line graph with new data.
-
-        Args:
-            frame_number (int): The current frame number.
-            total_counts (int): The total counts to plot.
-        """
-
-        # Update line graph data
-        x_data = self.line.get_xdata()
-        y_data = self.line.get_ydata()
-        x_data = np.append(x_data, float(frame_number))
-        y_data = np.append(y_data, float(total_counts))
-        self.line.set_data(x_data, y_data)
+    def plot_line(self):
+        """Plot the line graph of the last 'max_points' points with matplotlib."""
+        x_data, y_data = self.series(self.max_points)
+        self.line.set_data(x_data, y_data.get(self.y_label, []))
         self.ax.relim()
         self.ax.autoscale_view()
-        self.canvas.draw()
-        im0 = np.array(self.canvas.renderer.buffer_rgba())
-        self.write_and_display(im0)
 
-    def update_multiple_lines(self, counts_dict, labels_list, frame_number):
-        """
-        Update the line graph with multiple classes.
-
-        Args:
-            counts_dict (int): Dictionary include each class counts.
-            labels_list (int): list include each classes names.
-            frame_number (int): The current frame number.
-        """
-        warnings.warn("Display is not supported for multiple lines, output will be stored normally!")
-        for obj in labels_list:
+    def plot_lines(self):
+        """Plot one line per class of the last 'max_points' points with matplotlib."""
+        x_data, y_data_dict = self.series(self.max_points)
+        for obj, y_data in y_data_dict.items():
             if obj not in self.lines:
                 (line,) = self.ax.plot([], [], label=obj, marker="o", markersize=self.points_width)
                 self.lines[obj] = line
-
-            x_data = self.lines[obj].get_xdata()
-            y_data = self.lines[obj].get_ydata()
-
-            # Remove the initial point if the number of points exceeds max_points
-            if len(x_data) >= self.max_points:
-                x_data = np.delete(x_data, 0)
-                y_data = np.delete(y_data, 0)
-
-            x_data = np.append(x_data, float(frame_number))  # Ensure frame_number is converted to float
-            y_data = np.append(y_data, float(counts_dict.get(obj, 0)))  # Ensure total_count is converted to float
             self.lines[obj].set_data(x_data, y_data)
 
         self.ax.relim()
         self.ax.autoscale_view()
         self.ax.legend()
-        self.canvas.draw()
-
-        im0 = np.array(self.canvas.renderer.buffer_rgba())
-        self.view_img = False  # for multiple line view_img not supported yet, coming soon!
-        self.write_and_display(im0)
 
-    def write_and_display(self, im0):
-        """
-        Write and display the line graph
-        Args:
-            im0 (ndarray): Image for processing
-        """
-        im0 = cv2.cvtColor(im0[:, :, :3], cv2.COLOR_RGBA2BGR)
-        cv2.imshow(self.title, im0) if self.view_img else None
-        self.writer.write(im0) if self.save_img else None
-
-    def update_bar(self, count_dict):
-        """
-        Update the bar graph with new data.
-
-        Args:
-            count_dict (dict): Dictionary containing the count data to plot.
-        """
-
-        # Update bar graph data
+    def plot_bar(self):
+        """Plot the bar graph of the last counts with matplotlib."""
         self.ax.clear()
         self.ax.set_facecolor(self.bg_color)
-        labels = list(count_dict.keys())
-        counts = list(count_dict.values())
+        labels = list(self.last.keys())
+        counts = list(self.last.values())
 
         # Map labels to colors
         for label in labels:
@@ -268,24 +339,10 @@ class Analytics:
                 color=self.fg_color,
             )
 
-        # Display and save the updated graph
-        canvas = FigureCanvas(self.fig)
-        canvas.draw()
-        buf = canvas.buffer_rgba()
-        im0 = np.asarray(buf)
-        self.write_and_display(im0)
-
-    def update_pie(self, classes_dict):
-        """
-        Update the pie chart with new data.
-
-        Args:
-            classes_dict (dict): Dictionary containing the class data to plot.
-        """
-
-        # Update pie chart data
-        labels = list(classes_dict.keys())
-        sizes = list(classes_dict.values())
+    def plot_pie(self):
+        """Plot the pie chart of the last counts with matplotlib."""
+        labels = list(self.last.keys())
+        sizes = list(self.last.values())
         total = sum(sizes)
         percentages = [size / total * 100 for size in sizes]
         start_angle = 90
@@ -302,10 +359,76 @@ class Analytics:
         self.fig.tight_layout()
         self.fig.subplots_adjust(left=0.1, right=0.75)
 
-        # Display and save the updated chart
-        im0 = self.fig.canvas.draw()
-        im0 = np.array(self.fig.canvas.renderer.buffer_rgba())
-        self.write_and_display(im0)
+    def render_opencv(self):
+        """Draw the chart of the current series directly with OpenCV, returns a BGR image."""
+        w, h = (int(x) for x in self.im0_shape)
+
+        def bgr(color):
+            """Convert a matplotlib color to a BGR tuple."""
+            return tuple(int(v * 255) for v in to_rgb(color)[::-1])
+
+        fg, palette = bgr(self.fg_color), [tuple(int(v * 255) for v in c[2::-1]) for c in self.color_palette]
+        im = np.full((h, w, 3), bgr(self.bg_color), dtype=np.uint8)
+        fs, tf = self.fontsize / 30, max(self.fontsize // 10, 1)
+        cv2.putText(im, self.title, (w // 2 - len(self.title) * self.fontsize // 3, 30), 0, fs * 1.3, fg, tf)
+        x0, y0, x1, y1 = 60, 50, w - 20, h - 40  # plot area
+
+        if self.type == "pie":
+            total = sum(self.last.values()) or 1
+            center, radius, angle = (x0 + (x1 - x0) // 3, (y0 + y1) // 2), max(min(x1 - x0, y1 - y0) // 3, 1), -90.0
+            for i, (label, size) in enumerate(self.last.items()):
+                color, sweep = palette[i % len(palette)], 360 * size / total
+                cv2.ellipse(im, center, (radius, radius), 0, angle, angle + sweep, color, -1, cv2.LINE_AA)
+                angle += sweep
+                y = y0 + 30 * (i + 1)
+                cv2.rectangle(im, (x1 - 220, y - 12), (x1 - 204, y + 4), color, -1)
+                cv2.putText(im, f"{label} ({size / total * 100:.1f}%)", (x1 - 196, y), 0, fs, fg, tf, cv2.LINE_AA)
+            return im
+
+        cv2.line(im, (x0, y1), (x1, y1), fg, 1)  # axes
+        cv2.line(im, (x0, y0), (x0, y1), fg, 1)
+        if self.type == "bar":
+            n = max(len(self.last), 1)
+            top = max(max(self.last.values(), default=0), 1) * 1.1
+            bw = (x1 - x0) / n
+            for i, (label, count) in enumerate(self.last.items()):
+                if label not in self.color_mapping:
+                    self.color_mapping[label] = next(self.color_cycle)
+                c = tuple(int(v * 255) for v in self.color_mapping[label][2::-1])
+                p, q = (int(x0 + bw * (i + 0.1)), int(y1 - (y1 - y0) * count / top)), (int(x0 + bw * (i + 0.9)), y1)
+                cv2.rectangle(im, p, q, c, -1)
+                cv2.putText(im, str(count), (p[0], p[1] - 5), 0, fs, fg, tf, cv2.LINE_AA)
+                cv2.putText(im, str(label), (p[0], y1 + 20), 0, fs, fg, tf, cv2.LINE_AA)
+            return im
+
+        x, ys = self.series(self.max_points)
+        if not len(x):
+            return im
+        top = max(max((y.max() for y in ys.values()), default=0), 1) * 1.1
+        span = max(x[-1] - x[0], 1)
+        for i, (label, y) in enumerate(ys.items()):
+            color = palette[i % len(palette)] if self.multiple or self.type == "area" else bgr(self.line_color)
+            pts = np.stack([x0 + (x - x[0]) / span * (x1 - x0), y1 - y / top * (y1 - y0)], 1).astype(np.int32)
+            if self.type == "area":
+                overlay = im.copy()
+                cv2.fillPoly(overlay, [np.concatenate([pts, [[pts[-1, 0], y1], [pts[0, 0], y1]]])], color)
+                im = cv2.addWeighted(overlay, 0.6, im, 0.4, 0)
+            cv2.polylines(im, [pts], False, color, self.line_width, cv2.LINE_AA)
+            if len(ys) > 1:
+                cv2.putText(im, str(label), (x0 + 10, y0 + 20 * (i + 1)), 0, fs, color, tf, cv2.LINE_AA)
+        cv2.putText(im, f"{top / 1.1:g}", (5, y0 + 5), 0, fs, fg, tf, cv2.LINE_AA)  # y and x ranges
+        cv2.putText(im, f"{x[0]:g}", (x0, y1 + 20), 0, fs, fg, tf, cv2.LINE_AA)
+        cv2.putText(im, f"{x[-1]:g}", (x1 - 40, y1 + 20), 0, fs, fg, tf, cv2.LINE_AA)
+        return im
+
+    def write_and_display(self, im0):
+        """
+        Write and display the chart
+        Args:
+            im0 (ndarray): BGR image of the chart
+        """
+        cv2.imshow(self.title, im0) if self.view_img else None
+        self.writer.write(im0) if self.save_img else None
 
 
 if __name__ == "__main__":
@@ -1,12 +1,13 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
-import math
-
 import cv2
+import numpy as np
 
 from ultralytics.utils.checks import check_imshow
 from ultralytics.utils.plotting import Annotator, colors
 
+from .region import GroundPlane
+
 
 class DistanceCalculation:
     """A class to calculate distance between two objects in a real-time video stream based on their tracks."""
@@ -19,6 +20,7 @@ class DistanceCalculation:
         line_thickness=2,
         line_color=(255, 255, 0),
         centroid_color=(255, 0, 255),
+        homography=None,
     ):
         """
         Initializes the DistanceCalculation class with the given parameters.
@@ -30,6 +32,8 @@ class DistanceCalculation:
             line_thickness (int, optional): Thickness of the lines drawn on the image. Defaults to 2.
             line_color (tuple, optional): Color of the lines drawn on the image (BGR format). Defaults to (255, 255, 0).
             centroid_color (tuple, optional): Color of the centroids drawn (BGR format). Defaults to (255, 0, 255).
+            homography (np.ndarray, optional): Image to ground-plane homography (3, 3) in meters, replacing
+                'pixels_per_meter', see `GroundPlane.from_points`. Defaults to None.
         """
         # Visual & image information
         self.im0 = None
@@ -48,6 +52,7 @@ class DistanceCalculation:
         # Distance calculation information
         self.centroids = []
         self.pixel_per_meter = pixels_per_meter
+        self.plane = GroundPlane(homography, pixels_per_meter)
 
         # Mouse event information
         self.left_mouse_count = 0
@@ -113,11 +118,24 @@ class DistanceCalculation:
         Returns:
             (tuple): Distance in meters and millimeters.
         """
-        pixel_distance = math.sqrt((centroid1[0] - centroid2[0]) ** 2 + (centroid1[1] - centroid2[1]) ** 2)
-        distance_m = pixel_distance / self.pixel_per_meter
+        distance_m = float(self.plane.distance([centroid1], [centroid2])[0])
         distance_mm = distance_m * 1000
         return distance_m, distance_mm
 
+    def calculate_distances(self, boxes):
+        """
+        Calculates the distances between the centroids of all pairs of bounding boxes.
+
+        Args:
+            boxes (np.ndarray): Bounding boxes (N, 4) as x1, y1, x2, y2.
+
+        Returns:
+            (np.ndarray): Distance matrix (N, N) in meters.
+        """
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        points = self.plane((boxes[:, :2] + boxes[:, 2:]) / 2)
+        return np.linalg.norm(points[:, None] - points[None], axis=-1)
+
     def start_process(self, im0, tracks):
         """
         Processes the video frame and calculates the distance between two bounding boxes.
@@ -1,16 +1,25 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
-from collections import defaultdict
+from functools import lru_cache
 
 import cv2
 import numpy as np
 
-from ultralytics.utils.checks import check_imshow, check_requirements
+from ultralytics.utils.checks import check_imshow
 from ultralytics.utils.plotting import Annotator
 
-check_requirements("shapely>=2.0.0")
+from .region import CountingRegion
 
-from shapely.geometry import LineString, Point, Polygon
+
+@lru_cache(maxsize=256)
+def blob_kernel(w, h, circle=False):
+    """Return the read-only heatmap blob stamp (h, w) of a box as a filled circle or rectangle, cached per size."""
+    kernel = np.full((h, w), 2, dtype=np.float32)
+    if circle:
+        y, x = np.ogrid[0:h, 0:w]
+        kernel *= (x - w // 2) ** 2 + (y - h // 2) ** 2 <= (min(w, h) // 2) ** 2
+    kernel.flags.writeable = False
+    return kernel
 
 
 class Heatmap:
@@ -35,8 +44,15 @@ class Heatmap:
         line_thickness=2,
         decay_factor=0.99,
         shape="circle",
+        heatmap_scale=0.5,
     ):
-        """Initializes the heatmap class with default values for Visual, Image, track, count and heatmap parameters."""
+        """
+        Initializes the heatmap class with default values for Visual, Image, track, count and heatmap parameters.
+
+        The heatmap is accumulated on a grid 'heatmap_scale' times the image size. Decay is applied lazily through a
+        global gain, so that a frame only costs the area of its boxes, and the overlay is only rendered when returned
+        or displayed.
+        """
 
         # Visual information
         self.annotator = None
@@ -54,16 +70,18 @@ class Heatmap:
         self.view_in_counts = view_in_counts
         self.view_out_counts = view_out_counts
 
-        # Heatmap colormap and heatmap np array
+        # Heatmap colormap and heatmap np array, the heatmap values are 'heatmap * gain'
         self.colormap = colormap
         self.heatmap = None
         self.heatmap_alpha = heatmap_alpha
+        self.heatmap_scale = heatmap_scale
+        self.gain = 1.0
 
         # Predict/track information
         self.boxes = []
         self.track_ids = []
         self.clss = []
-        self.track_history = defaultdict(list)
+        self.track_history = None
 
         # Region & Line Information
         self.counting_region = None
@@ -74,7 +92,6 @@ class Heatmap:
         # Object Counting Information
         self.in_counts = 0
         self.out_counts = 0
-        self.count_ids = []
         self.class_wise_count = {}
         self.count_txt_color = count_txt_color
         self.count_bg_color = count_bg_color
@@ -92,14 +109,13 @@ class Heatmap:
         if self.count_reg_pts is not None:
             if len(self.count_reg_pts) == 2:
                 print("Line Counter Initiated.")
-                self.counting_region = LineString(self.count_reg_pts)
             elif len(self.count_reg_pts) >= 3:
                 print("Polygon Counter Initiated.")
-                self.counting_region = Polygon(self.count_reg_pts)
             else:
                 print("Invalid Region points provided, region_points must be 2 for lines or >= 3 for polygons.")
                 print("Using Line Counter Now")
-                self.counting_region = LineString(self.count_reg_pts)
+            self.counting_region = CountingRegion(self.count_reg_pts, line_dist_thresh=self.line_dist_thresh)
+            self.track_history = self.counting_region.history
 
         # Shape of heatmap, if not selected
         if self.shape not in {"circle", "rect"}:
@@ -119,22 +135,28 @@ class Heatmap:
             self.clss = tracks[0].boxes.cls.tolist()
             self.track_ids = tracks[0].boxes.id.int().tolist()
 
-    def generate_heatmap(self, im0, tracks):
+    def generate_heatmap(self, im0, tracks, render=True):
         """
         Generate heatmap based on tracking data.
 
         Args:
             im0 (nd array): Image
             tracks (list): List of tracks obtained from the object tracking process.
+            render (bool): Overlay the heatmap on the returned image, it is always rendered when displayed.
         """
         self.im0 = im0
 
         # Initialize heatmap only once
         if not self.initialized:
-            self.heatmap = np.zeros((int(self.im0.shape[0]), int(self.im0.shape[1])), dtype=np.float32)
+            h, w = (max(round(x * self.heatmap_scale), 1) for x in self.im0.shape[:2])
+            self.heatmap = np.zeros((h, w), dtype=np.float32)
             self.initialized = True
 
-        self.heatmap *= self.decay_factor  # decay factor
+        # Decay factor, applied lazily with a gain that is folded into the heatmap before it gets too small
+        self.gain *= self.decay_factor
+        if self.gain < 1e-3:
+            self.heatmap *= self.gain
+            self.gain = 1.0
 
         self.extract_results(tracks)
         self.annotator = Annotator(self.im0, self.tf, None)
@@ -146,79 +168,22 @@ class Heatmap:
                     reg_pts=self.count_reg_pts, color=self.region_color, thickness=self.region_thickness
                 )
 
-            for box, cls, track_id in zip(self.boxes, self.clss, self.track_ids):
-                # Store class info
-                if self.names[cls] not in self.class_wise_count:
-                    self.class_wise_count[self.names[cls]] = {"IN": 0, "OUT": 0}
-
-                if self.shape == "circle":
-                    center = (int((box[0] + box[2]) // 2), int((box[1] + box[3]) // 2))
-                    radius = min(int(box[2]) - int(box[0]), int(box[3]) - int(box[1])) // 2
-
-                    y, x = np.ogrid[0 : self.heatmap.shape[0], 0 : self.heatmap.shape[1]]
-                    mask = (x - center[0]) ** 2 + (y - center[1]) ** 2 <= radius**2
-
-                    self.heatmap[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])] += (
-                        2 * mask[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])]
-                    )
-
-                else:
-                    self.heatmap[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])] += 2
-
-                # Store tracking hist
-                track_line = self.track_history[track_id]
-                track_line.append((float((box[0] + box[2]) / 2), float((box[1] + box[3]) / 2)))
-                if len(track_line) > 30:
-                    track_line.pop(0)
-
-                prev_position = self.track_history[track_id][-2] if len(self.track_history[track_id]) > 1 else None
-
-                if self.count_reg_pts is not None:
-                    # Count objects in any polygon
-                    if len(self.count_reg_pts) >= 3:
-                        is_inside = self.counting_region.contains(Point(track_line[-1]))
-
-                        if prev_position is not None and is_inside and track_id not in self.count_ids:
-                            self.count_ids.append(track_id)
-
-                            if (box[0] - prev_position[0]) * (self.counting_region.centroid.x - prev_position[0]) > 0:
-                                self.in_counts += 1
-                                self.class_wise_count[self.names[cls]]["IN"] += 1
-                            else:
-                                self.out_counts += 1
-                                self.class_wise_count[self.names[cls]]["OUT"] += 1
-
-                    # Count objects using line
-                    elif len(self.count_reg_pts) == 2:
-                        if prev_position is not None and track_id not in self.count_ids:
-                            distance = Point(track_line[-1]).distance(self.counting_region)
-                            if distance < self.line_dist_thresh and track_id not in self.count_ids:
-                                self.count_ids.append(track_id)
-
-                                if (box[0] - prev_position[0]) * (
-                                    self.counting_region.centroid.x - prev_position[0]
-                                ) > 0:
-                                    self.in_counts += 1
-                                    self.class_wise_count[self.names[cls]]["IN"] += 1
-                                else:
-                                    self.out_counts += 1
-                                    self.class_wise_count[self.names[cls]]["OUT"] += 1
-
-        else:
-            for box, cls in zip(self.boxes, self.clss):
-                if self.shape == "circle":
-                    center = (int((box[0] + box[2]) // 2), int((box[1] + box[3]) // 2))
-                    radius = min(int(box[2]) - int(box[0]), int(box[3]) - int(box[1])) // 2
-
-                    y, x = np.ogrid[0 : self.heatmap.shape[0], 0 : self.heatmap.shape[1]]
-                    mask = (x - center[0]) ** 2 + (y - center[1]) ** 2 <= radius**2
-
-                    self.heatmap[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])] += (
-                        2 * mask[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])]
-                    )
-
-                else:
-                    self.heatmap[int(box[1]) : int(box[3]), int(box[0]) : int(box[2])] += 2
+            # Store class info
+            for cls in set(self.clss):
+                self.class_wise_count.setdefault(self.names[cls], {"IN": 0, "OUT": 0})
+
+            # Count all tracks at once
+            if self.count_reg_pts is not None:
+                counted_in, counted_out = self.counting_region.update(self.track_ids, self.boxes.numpy())
+                self.in_counts += int(counted_in.sum())
+                self.out_counts += int(counted_out.sum())
+                for i in np.flatnonzero(counted_in):
+                    self.class_wise_count[self.names[self.clss[i]]]["IN"] += 1
+                for i in np.flatnonzero(counted_out):
+                    self.class_wise_count[self.names[self.clss[i]]]["OUT"] += 1
+
+        for box in np.asarray(self.boxes) * self.heatmap_scale:
+            self.stamp(box)
 
         if self.count_reg_pts is not None:
             labels_dict = {}
@@ -237,16 +202,31 @@ class Heatmap:
             if labels_dict is not None:
                 self.annotator.display_analytics(self.im0, labels_dict, self.count_txt_color, self.count_bg_color, 10)
 
-        # Normalize, apply colormap to heatmap and combine with original image
-        heatmap_normalized = cv2.normalize(self.heatmap, None, 0, 255, cv2.NORM_MINMAX)
-        heatmap_colored = cv2.applyColorMap(heatmap_normalized.astype(np.uint8), self.colormap)
-        self.im0 = cv2.addWeighted(self.im0, 1 - self.heatmap_alpha, heatmap_colored, self.heatmap_alpha, 0)
+        if render or (self.env_check and self.view_img):
+            self.im0 = self.render(self.im0)
 
         if self.env_check and self.view_img:
             self.display_frames()
 
         return self.im0
 
+    def stamp(self, box):
+        """Add the blob of 'box' (x1, y1, x2, y2) in heatmap grid coordinates, compensating the lazy decay gain."""
+        x1, y1, x2, y2 = (int(x) for x in box)
+        kernel = blob_kernel(x2 - x1, y2 - y1, self.shape == "circle")
+        h, w = self.heatmap.shape
+        cx1, cy1, cx2, cy2 = max(x1, 0), max(y1, 0), min(x2, w), min(y2, h)
+        if cx2 > cx1 and cy2 > cy1:
+            self.heatmap[cy1:cy2, cx1:cx2] += kernel[cy1 - y1 : cy2 - y1, cx1 - x1 : cx2 - x1] / self.gain
+
+    def render(self, im0):
+        """Normalize, apply colormap to heatmap and combine it with image 'im0'."""
+        heatmap_normalized = cv2.normalize(self.heatmap, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+        if heatmap_normalized.shape != im0.shape[:2]:
+            heatmap_normalized = cv2.resize(heatmap_normalized, im0.shape[1::-1], interpolation=cv2.INTER_LINEAR)
+        heatmap_colored = cv2.applyColorMap(heatmap_normalized, self.colormap)
+        return cv2.addWeighted(im0, 1 - self.heatmap_alpha, heatmap_colored, self.heatmap_alpha, 0)
+
     def display_frames(self):
         """Display frame."""
         cv2.imshow("Ultralytics Heatmap", self.im0)
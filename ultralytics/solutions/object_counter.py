@@ -1,15 +1,12 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
-from collections import defaultdict
-
 import cv2
+import numpy as np
 
-from ultralytics.utils.checks import check_imshow, check_requirements
+from ultralytics.utils.checks import check_imshow
 from ultralytics.utils.plotting import Annotator, colors
 
-check_requirements("shapely>=2.0.0")
-
-from shapely.geometry import LineString, Point, Polygon
+from .region import CountingRegion
 
 
 class ObjectCounter:
@@ -79,7 +76,6 @@ class ObjectCounter:
         # Object counting Information
         self.in_counts = 0
         self.out_counts = 0
-        self.count_ids = []
         self.class_wise_count = {}
         self.count_txt_thickness = 0
         self.count_txt_color = count_txt_color
@@ -88,7 +84,6 @@ class ObjectCounter:
         self.fontsize = 0.6
 
         # Tracks info
-        self.track_history = defaultdict(list)
         self.track_thickness = track_thickness
         self.draw_tracks = draw_tracks
         self.track_color = track_color
@@ -96,17 +91,16 @@ class ObjectCounter:
         # Check if environment supports imshow
         self.env_check = check_imshow(warn=True)
 
-        # Initialize counting region
+        # Initialize counting region, with the counted track IDs and track histories
         if len(self.reg_pts) == 2:
             print("Line Counter Initiated.")
-            self.counting_region = LineString(self.reg_pts)
         elif len(self.reg_pts) >= 3:
             print("Polygon Counter Initiated.")
-            self.counting_region = Polygon(self.reg_pts)
         else:
             print("Invalid Region points provided, region_points must be 2 for lines or >= 3 for polygons.")
             print("Using Line Counter Now")
-            self.counting_region = LineString(self.reg_pts)
+        self.counting_region = CountingRegion(self.reg_pts, line_dist_thresh=self.line_dist_thresh)
+        self.track_history = self.counting_region.history
 
     def mouse_event_for_region(self, event, x, y, flags, params):
         """
@@ -133,7 +127,7 @@ class ObjectCounter:
         elif event == cv2.EVENT_MOUSEMOVE:
             if self.is_drawing and self.selected_point is not None:
                 self.reg_pts[self.selected_point] = (x, y)
-                self.counting_region = Polygon(self.reg_pts)
+                self.counting_region.set_points(self.reg_pts)
 
         elif event == cv2.EVENT_LBUTTONUP:
             self.is_drawing = False
@@ -153,59 +147,30 @@ class ObjectCounter:
             clss = tracks[0].boxes.cls.cpu().tolist()
             track_ids = tracks[0].boxes.id.int().cpu().tolist()
 
+            # Count all tracks at once
+            counted_in, counted_out = self.counting_region.update(track_ids, boxes.numpy())
+            self.in_counts += int(counted_in.sum())
+            self.out_counts += int(counted_out.sum())
+            for cls in set(clss):
+                self.class_wise_count.setdefault(self.names[cls], {"IN": 0, "OUT": 0})
+            for i in np.flatnonzero(counted_in):
+                self.class_wise_count[self.names[clss[i]]]["IN"] += 1
+            for i in np.flatnonzero(counted_out):
+                self.class_wise_count[self.names[clss[i]]]["OUT"] += 1
+
             # Extract tracks
             for box, track_id, cls in zip(boxes, track_ids, clss):
                 # Draw bounding box
                 self.annotator.box_label(box, label=f"{self.names[cls]}#{track_id}", color=colors(int(track_id), True))
 
-                # Store class info
-                if self.names[cls] not in self.class_wise_count:
-                    self.class_wise_count[self.names[cls]] = {"IN": 0, "OUT": 0}
-
-                # Draw Tracks
-                track_line = self.track_history[track_id]
-                track_line.append((float((box[0] + box[2]) / 2), float((box[1] + box[3]) / 2)))
-                if len(track_line) > 30:
-                    track_line.pop(0)
-
                 # Draw track trails
                 if self.draw_tracks:
                     self.annotator.draw_centroid_and_tracks(
-                        track_line,
+                        self.track_history[track_id],
                         color=self.track_color or colors(int(track_id), True),
                         track_thickness=self.track_thickness,
                     )
 
-                prev_position = self.track_history[track_id][-2] if len(self.track_history[track_id]) > 1 else None
-
-                # Count objects in any polygon
-                if len(self.reg_pts) >= 3:
-                    is_inside = self.counting_region.contains(Point(track_line[-1]))
-
-                    if prev_position is not None and is_inside and track_id not in self.count_ids:
-                        self.count_ids.append(track_id)
-
-                        if (box[0] - prev_position[0]) * (self.counting_region.centroid.x - prev_position[0]) > 0:
-                            self.in_counts += 1
-                            self.class_wise_count[self.names[cls]]["IN"] += 1
-                        else:
-                            self.out_counts += 1
-                            self.class_wise_count[self.names[cls]]["OUT"] += 1
-
-                # Count objects using line
-                elif len(self.reg_pts) == 2:
-                    if prev_position is not None and track_id not in self.count_ids:
-                        distance = Point(track_line[-1]).distance(self.counting_region)
-                        if distance < self.line_dist_thresh and track_id not in self.count_ids:
-                            self.count_ids.append(track_id)
-
-                            if (box[0] - prev_position[0]) * (self.counting_region.centroid.x - prev_position[0]) > 0:
-                                self.in_counts += 1
-                                self.class_wise_count[self.names[cls]]["IN"] += 1
-                            else:
-                                self.out_counts += 1
-                                self.class_wise_count[self.names[cls]]["OUT"] += 1
-
         labels_dict = {}
 
         for key, value in self.class_wise_count.items():
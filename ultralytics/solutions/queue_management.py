@@ -1,15 +1,12 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
-from collections import defaultdict
-
 import cv2
+import numpy as np
 
-from ultralytics.utils.checks import check_imshow, check_requirements
+from ultralytics.utils.checks import check_imshow
 from ultralytics.utils.plotting import Annotator, colors
 
-check_requirements("shapely>=2.0.0")
-
-from shapely.geometry import Point, Polygon
+from .region import CountingRegion
 
 
 class QueueManager:
@@ -56,8 +53,8 @@ class QueueManager:
 
         # Region & Line Information
         self.reg_pts = reg_pts if reg_pts is not None else [(20, 60), (20, 680), (1120, 680), (1120, 60)]
-        self.counting_region = (
-            Polygon(self.reg_pts) if len(self.reg_pts) >= 3 else Polygon([(20, 60), (20, 680), (1120, 680), (1120, 60)])
+        self.counting_region = CountingRegion(
+            self.reg_pts if len(self.reg_pts) >= 3 else [(20, 60), (20, 680), (1120, 680), (1120, 60)]
         )
         self.region_color = region_color
         self.region_thickness = region_thickness
@@ -78,7 +75,7 @@ class QueueManager:
         self.count_txt_color = count_txt_color
 
         # Tracks info
-        self.track_history = defaultdict(list)
+        self.track_history = self.counting_region.history
         self.track_thickness = track_thickness
         self.draw_tracks = draw_tracks
         self.track_color = track_color
@@ -97,33 +94,25 @@ class QueueManager:
             clss = tracks[0].boxes.cls.cpu().tolist()
             track_ids = tracks[0].boxes.id.int().cpu().tolist()
 
+            # Update track histories and count the tracks with a previous position inside the region
+            centers = (boxes[:, :2] + boxes[:, 2:]).numpy() / 2
+            prev = self.track_history.append(track_ids, centers)
+            if len(self.reg_pts) >= 3:
+                self.counts += int((self.counting_region.contains(centers) & ~np.isnan(prev[:, 0])).sum())
+
             # Extract tracks
             for box, track_id, cls in zip(boxes, track_ids, clss):
                 # Draw bounding box
                 self.annotator.box_label(box, label=f"{self.names[cls]}#{track_id}", color=colors(int(track_id), True))
 
-                # Update track history
-                track_line = self.track_history[track_id]
-                track_line.append((float((box[0] + box[2]) / 2), float((box[1] + box[3]) / 2)))
-                if len(track_line) > 30:
-                    track_line.pop(0)
-
                 # Draw track trails if enabled
                 if self.draw_tracks:
                     self.annotator.draw_centroid_and_tracks(
-                        track_line,
+                        self.track_history[track_id],
                         color=self.track_color or colors(int(track_id), True),
                         track_thickness=self.track_thickness,
                     )
 
-                prev_position = self.track_history[track_id][-2] if len(self.track_history[track_id]) > 1 else None
-
-                # Check if the object is inside the counting region
-                if len(self.reg_pts) >= 3:
-                    is_inside = self.counting_region.contains(Point(track_line[-1]))
-                    if prev_position is not None and is_inside:
-                        self.counts += 1
-
         # Display queue counts
         label = f"Queue Counts : {str(self.counts)}"
         if label is not None:
@@ -0,0 +1,264 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+
+import cv2
+import numpy as np
+
+
+class TrackHistory:
+    """
+    Ring buffers of the last positions and timestamps of every track, held in slots mapped from track IDs.
+
+    Positions of all tracks of a frame are appended in one step, each track owns a row (slot) of a (S, maxlen, 2) array
+    holding its last 'maxlen' positions, which replaces per-track lists trimmed with `pop(0)`. Track IDs map to slots
+    through a dict, slots of tracks not updated for 'max_age' appends are freed and reused, so memory follows the number
+    of recent tracks rather than the largest track ID.
+
+    Attributes:
+        maxlen (int): Number of positions kept per track.
+        max_age (int): Number of appends without an update after which a track is forgotten.
+        slots (dict): Slot of every kept track ID.
+        points (np.ndarray): Ring buffers (S, maxlen, 2) of positions.
+        times (np.ndarray): Ring buffers (S, maxlen) of the timestamps of the positions in seconds.
+        length (np.ndarray): Number of positions appended per slot (S,), including those overwritten.
+        done (np.ndarray): Per-slot flags (S,) for users of the history, i.e. counted or measured tracks, cleared when a
+            slot is reused.
+        ids (np.ndarray): Track ID of every slot (S,), -1 for free slots.
+        seen (np.ndarray): Append step of the last update of every slot (S,).
+        step (int): Number of appends.
+
+    Examples:
+        >>> history = TrackHistory(maxlen=30)
+        >>> prev = history.append(ids, centers, t)  # previous positions (N, 2), NaN for new tracks
+        >>> trail = history[ids[0]]  # positions of one track, oldest first
+        >>> first, last, dt = history.span(ids, window=5)  # displacement over the last 5 positions
+    """
+
+    def __init__(self, maxlen=30, max_age=300):
+        """Initialize empty ring buffers keeping 'maxlen' positions per track for 'max_age' appends without update."""
+        self.maxlen = maxlen
+        self.max_age = max_age
+        self.slots = {}
+        self.points = np.zeros((0, maxlen, 2), dtype=np.float32)
+        self.times = np.zeros((0, maxlen))
+        self.length = np.zeros(0, dtype=int)
+        self.done = np.zeros(0, dtype=bool)
+        self.ids = np.zeros(0, dtype=int)
+        self.seen = np.zeros(0, dtype=int)
+        self.free = []
+        self.step = 0
+
+    def grow(self, n):
+        """Grow the buffers by at least 'n' free slots, doubling the capacity."""
+        size = len(self.ids)
+        n = max(size + n, 2 * size) - size
+        self.points = np.concatenate([self.points, np.zeros((n, self.maxlen, 2), np.float32)])
+        self.times = np.concatenate([self.times, np.zeros((n, self.maxlen))])
+        self.length = np.concatenate([self.length, np.zeros(n, dtype=int)])
+        self.done = np.concatenate([self.done, np.zeros(n, dtype=bool)])
+        self.ids = np.concatenate([self.ids, np.full(n, -1)])
+        self.seen = np.concatenate([self.seen, np.zeros(n, dtype=int)])
+        self.free.extend(range(size + n - 1, size - 1, -1))  # pop() returns the lowest slot first
+
+    def expire(self):
+        """Free the slots of tracks not updated for 'max_age' appends."""
+        stale = np.flatnonzero((self.ids >= 0) & (self.seen <= self.step - self.max_age))
+        for i in stale.tolist():
+            del self.slots[int(self.ids[i])]
+        self.length[stale], self.done[stale], self.ids[stale] = 0, False, -1
+        self.free.extend(stale[::-1].tolist())
+
+    def index(self, ids, add=False):
+        """Return the slots (N,) of the track 'ids' (N,), assigning free slots to new IDs if 'add', else -1."""
+        ids = np.asarray(ids, dtype=int).reshape(-1)
+        if add:
+            new = [i for i in dict.fromkeys(ids.tolist()) if i not in self.slots]
+            if len(new) > len(self.free):
+                self.grow(len(new) - len(self.free))
+            for i in new:
+                self.slots[i] = self.free.pop()
+                self.ids[self.slots[i]] = i
+        return np.array([self.slots.get(i, -1) for i in ids.tolist()], dtype=int)
+
+    def append(self, ids, points, t=0.0):
+        """Append 'points' (N, 2) at time 't' to the tracks 'ids' (N,), returns the previous positions, NaN if new."""
+        self.step += 1
+        self.expire()
+        slots = self.index(ids, add=True)
+        n = self.length[slots]
+        prev = self.points[slots, (n - 1) % self.maxlen].copy()
+        prev[n == 0] = np.nan
+        self.points[slots, n % self.maxlen] = points
+        self.times[slots, n % self.maxlen] = t
+        self.length[slots] = n + 1
+        self.seen[slots] = self.step
+        return prev
+
+    def span(self, ids, window=2):
+        """
+        Return the oldest and newest of the last 'window' positions of the tracks 'ids' and the time between them.
+
+        Args:
+            ids (np.ndarray): Track IDs (N,) in the history.
+            window (int): Number of positions spanned, clipped to the kept positions of each track.
+
+        Returns:
+            first (np.ndarray): Oldest positions (N, 2) of the window.
+            last (np.ndarray): Newest positions (N, 2).
+            dt (np.ndarray): Time (N,) between them, 0 for tracks with a single position.
+        """
+        slots = self.index(ids)
+        n = self.length[slots]
+        i, j = (n - 1) % self.maxlen, (n - np.minimum(n, min(window, self.maxlen))) % self.maxlen
+        return self.points[slots, j], self.points[slots, i], self.times[slots, i] - self.times[slots, j]
+
+    def __getitem__(self, i):
+        """Return the kept positions (M, 2) of track ID 'i', oldest first."""
+        slot = self.slots.get(int(i))
+        if slot is None:
+            return np.zeros((0, 2), dtype=np.float32)
+        n = self.length[slot]
+        return self.points[slot, (np.arange(max(n - self.maxlen, 0), n)) % self.maxlen]
+
+    def __len__(self):
+        """Return the number of kept tracks."""
+        return len(self.slots)
+
+
+class CountingRegion:
+    """
+    Counting line or polygon testing the positions of all tracks of a frame at once.
+
+    The region edges are precomputed once, point-in-polygon tests (even-odd rule, boundary excluded) and
+    point-to-line distances are computed for all points with NumPy instead of one shapely call per track. Counted tracks
+    are flagged in their track history slots, so that each track is counted at most once.
+
+    Attributes:
+        pts (np.ndarray): Region points (M, 2), two points for a line, three or more for a polygon.
+        is_line (bool): Whether the region is a line.
+        edges (tuple): Start and end points (E, 2) of the region edges.
+        centroid (np.ndarray): Centroid (2,) of the polygon area or line midpoint.
+        line_dist_thresh (float): Distance below which a track crosses a line.
+        history (TrackHistory): Positions of all tracks.
+        counted (np.ndarray): Whether the track of each history slot has been counted.
+
+    Methods:
+        set_points: Set the region points and precompute its edges.
+        contains: Test whether points are strictly inside the polygon.
+        distance: Compute distances of points to the region boundary.
+        update: Append the track positions of a frame and return the tracks counted in and out.
+
+    Examples:
+        >>> region = CountingRegion([(20, 400), (1260, 400)])
+        >>> counted_in, counted_out = region.update(ids, xyxy)
+    """
+
+    def __init__(self, pts, line_dist_thresh=15, maxlen=30):
+        """Initialize the region from 'pts', with a line crossing distance 'line_dist_thresh' and 'maxlen' positions."""
+        self.line_dist_thresh = line_dist_thresh
+        self.history = TrackHistory(maxlen)
+        self.set_points(pts)
+
+    @property
+    def counted(self):
+        """Whether the track of each history slot has been counted."""
+        return self.history.done
+
+    def set_points(self, pts):
+        """Set the region points 'pts' and precompute its edges and centroid."""
+        self.pts = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+        self.is_line = len(self.pts) < 3
+        if self.is_line:
+            self.edges = self.pts[:1], self.pts[1:2]
+            self.centroid = self.pts.mean(0)
+        else:
+            a, b = self.edges = self.pts, np.roll(self.pts, -1, axis=0)
+            cross = a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1]  # shoelace formula
+            area = cross.sum() / 2
+            self.centroid = ((a + b) * cross[:, None]).sum(0) / (6 * area) if area else self.pts.mean(0)
+
+    def contains(self, points):
+        """Return whether 'points' (N, 2) are strictly inside the polygon (N,), False for all points of a line."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.is_line:
+            return np.zeros(len(points), dtype=bool)
+        (a, b), x, y = self.edges, points[:, :1], points[:, 1:]
+        straddle = (a[:, 1] > y) != (b[:, 1] > y)  # (N, E) edges crossing the horizontal line through each point
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xi = a[:, 0] + (y - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+        inside = (straddle & (x < xi)).sum(1) % 2 == 1
+        return inside & (self.distance(points) > 0)
+
+    def distance(self, points):
+        """Return the distances (N,) of 'points' (N, 2) to the line or polygon boundary."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        a, b = self.edges
+        d = b - a  # (E, 2)
+        p = points[:, None] - a  # (N, E, 2)
+        t = np.clip((p * d).sum(-1) / np.maximum((d * d).sum(-1), 1e-12), 0, 1)
+        return np.linalg.norm(p - t[..., None] * d, axis=-1).min(1)
+
+    def update(self, ids, xyxy):
+        """
+        Append the box centers of the tracks of a frame and count the tracks entering the region.
+
+        A track is counted once, on the first frame it has a previous position and its center is inside the polygon or
+        within 'line_dist_thresh' of the line. It is counted in if its box moves towards the region centroid along x.
+
+        Args:
+            ids (np.ndarray): Track IDs (N,).
+            xyxy (np.ndarray): Boxes (N, 4) as x1, y1, x2, y2.
+
+        Returns:
+            counted_in (np.ndarray): Mask (N,) of the tracks counted in on this frame.
+            counted_out (np.ndarray): Mask (N,) of the tracks counted out on this frame.
+        """
+        ids, xyxy = np.asarray(ids, dtype=int), np.asarray(xyxy, dtype=np.float64).reshape(-1, 4)
+        prev = self.history.append(ids, (xyxy[:, :2] + xyxy[:, 2:]) / 2)
+        slots = self.history.index(ids)
+        centers = self.history.points[slots, (self.history.length[slots] - 1) % self.history.maxlen]
+        hit = ~np.isnan(prev[:, 0]) & ~self.history.done[slots]
+        if self.is_line:
+            hit[hit] = self.distance(centers[hit]) < self.line_dist_thresh
+        else:
+            hit[hit] = self.contains(centers[hit])
+        self.history.done[slots[hit]] = True
+        towards = (xyxy[:, 0] - prev[:, 0]) * (self.centroid[0] - prev[:, 0]) > 0
+        return hit & towards, hit & ~towards
+
+
+class GroundPlane:
+    """
+    Maps image points to metric ground-plane coordinates, with a homography or a fixed image scale.
+
+    Attributes:
+        homography (np.ndarray | None): Image to ground-plane homography (3, 3) in meters.
+        pixels_per_meter (float): Image scale used without a homography.
+
+    Examples:
+        >>> image_pts = [(0, 720), (1280, 720), (900, 300), (380, 300)]  # corners of a 7 x 30 m lane
+        >>> plane = GroundPlane.from_points(image_pts, [(0, 0), (7, 0), (7, 30), (0, 30)])
+        >>> meters = plane.distance(p1, p2)
+    """
+
+    def __init__(self, homography=None, pixels_per_meter=1.0):
+        """Initialize with an image to ground-plane 'homography' (3, 3) or a fixed 'pixels_per_meter' image scale."""
+        self.homography = None if homography is None else np.asarray(homography, dtype=np.float64).reshape(3, 3)
+        self.pixels_per_meter = pixels_per_meter
+
+    @classmethod
+    def from_points(cls, image_pts, world_pts):
+        """Create a ground plane from four or more image points (N, 2) and their ground positions in meters (N, 2)."""
+        H, _ = cv2.findHomography(np.asarray(image_pts, np.float64), np.asarray(world_pts, np.float64))
+        return cls(H)
+
+    def __call__(self, points):
+        """Return the ground-plane positions (N, 2) in meters of the image 'points' (N, 2)."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.homography is None:
+            return points / self.pixels_per_meter
+        xyw = points @ self.homography[:, :2].T + self.homography[:, 2]
+        return xyw[:, :2] / xyw[:, 2:]
+
+    def distance(self, p1, p2):
+        """Return the ground-plane distances (N,) in meters between the image points 'p1' (N, 2) and 'p2' (N, 2)."""
+        return np.linalg.norm(self(p1) - self(p2), axis=1)
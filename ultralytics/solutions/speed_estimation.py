@@ -1,6 +1,5 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
-from collections import defaultdict
 from time import time
 
 import cv2
@@ -9,11 +8,25 @@ import numpy as np
 from ultralytics.utils.checks import check_imshow
 from ultralytics.utils.plotting import Annotator, colors
 
+from .region import GroundPlane, TrackHistory
+
 
 class SpeedEstimator:
     """A class to estimate the speed of objects in a real-time video stream based on their tracks."""
 
-    def __init__(self, names, reg_pts=None, view_img=False, line_thickness=2, region_thickness=5, spdl_dist_thresh=10):
+    def __init__(
+        self,
+        names,
+        reg_pts=None,
+        view_img=False,
+        line_thickness=2,
+        region_thickness=5,
+        spdl_dist_thresh=10,
+        fps=None,
+        homography=None,
+        pixels_per_meter=10,
+        speed_window=5,
+    ):
         """
         Initializes the SpeedEstimator with the given parameters.
 
@@ -24,6 +37,12 @@ class SpeedEstimator:
             line_thickness (int, optional): Thickness of the lines for drawing boxes and tracks. Defaults to 2.
             region_thickness (int, optional): Thickness of the region lines. Defaults to 5.
             spdl_dist_thresh (int, optional): Distance threshold for speed calculation. Defaults to 10.
+            fps (float, optional): Frame rate of the video, frames are timestamped by their index instead of the wall
+                clock, for videos processed faster or slower than real time. Defaults to None.
+            homography (np.ndarray, optional): Image to ground-plane homography (3, 3) in meters, see
+                `GroundPlane.from_points`. Defaults to None.
+            pixels_per_meter (float, optional): Image scale used without a homography. Defaults to 10.
+            speed_window (int, optional): Number of track positions the speed is averaged over. Defaults to 5.
         """
         # Visual & image information
         self.im0 = None
@@ -41,15 +60,15 @@ class SpeedEstimator:
         self.trk_ids = None
         self.trk_pts = None
         self.line_thickness = line_thickness
-        self.trk_history = defaultdict(list)
+        self.trk_history = TrackHistory()
 
         # Speed estimation information
-        self.current_time = 0
+        self.fps = fps
+        self.frame = 0
+        self.plane = GroundPlane(homography, pixels_per_meter)
+        self.speed_window = speed_window
         self.dist_data = {}
-        self.trk_idslist = []
         self.spdl_dist_thresh = spdl_dist_thresh
-        self.trk_previous_times = {}
-        self.trk_previous_points = {}
 
         # Check if the environment supports imshow
         self.env_check = check_imshow(warn=True)
@@ -65,26 +84,22 @@ class SpeedEstimator:
         self.clss = tracks[0].boxes.cls.cpu().tolist()
         self.trk_ids = tracks[0].boxes.id.int().cpu().tolist()
 
-    def store_track_info(self, track_id, box):
+    def timestamp(self):
+        """Returns the timestamp in seconds of the next frame, its index over 'fps' or the wall clock, and counts it."""
+        t = self.frame / self.fps if self.fps else time()
+        self.frame += 1
+        return t
+
+    def store_tracks_info(self, t=None):
         """
-        Stores track data.
+        Stores the box centers of all tracks of the frame.
 
         Args:
-            track_id (int): Object track id.
-            box (list): Object bounding box data.
-
-        Returns:
-            (list): Updated tracking history for the given track_id.
+            t (float, optional): Frame timestamp in seconds, defaults to the timestamp of the next frame.
         """
-        track = self.trk_history[track_id]
-        bbox_center = (float((box[0] + box[2]) / 2), float((box[1] + box[3]) / 2))
-        track.append(bbox_center)
-
-        if len(track) > 30:
-            track.pop(0)
-
-        self.trk_pts = np.hstack(track).astype(np.int32).reshape((-1, 1, 2))
-        return track
+        if t is None:
+            t = self.timestamp()
+        self.trk_history.append(self.trk_ids, (self.boxes[:, :2] + self.boxes[:, 2:]).numpy() / 2, t)
 
     def plot_box_and_track(self, track_id, box, cls, track):
         """
@@ -94,44 +109,43 @@ class SpeedEstimator:
             track_id (int): Object track id.
             box (list): Object bounding box data.
             cls (str): Object class name.
-            track (list): Tracking history for drawing tracks path.
+            track (np.ndarray): Tracking history (N, 2) for drawing tracks path.
         """
         speed_label = f"{int(self.dist_data[track_id])} km/h" if track_id in self.dist_data else self.names[int(cls)]
         bbox_color = colors(int(track_id)) if track_id in self.dist_data else (255, 0, 255)
 
+        self.trk_pts = track.astype(np.int32).reshape((-1, 1, 2))
         self.annotator.box_label(box, speed_label, bbox_color)
         cv2.polylines(self.im0, [self.trk_pts], isClosed=False, color=(0, 255, 0), thickness=1)
         cv2.circle(self.im0, (int(track[-1][0]), int(track[-1][1])), 5, bbox_color, -1)
 
-    def calculate_speed(self, trk_id, track):
+    def speeds(self, ids):
         """
-        Calculates the speed of an object.
+        Returns the ground-plane speeds of tracks, averaged over their last 'speed_window' positions.
 
         Args:
-            trk_id (int): Object track id.
-            track (list): Tracking history for drawing tracks path.
+            ids (np.ndarray): Track IDs (N,).
+
+        Returns:
+            (np.ndarray): Speeds (N,) in km/h, NaN for tracks with a single position.
         """
-        if not self.reg_pts[0][0] < track[-1][0] < self.reg_pts[1][0]:
-            return
-        if self.reg_pts[1][1] - self.spdl_dist_thresh < track[-1][1] < self.reg_pts[1][1] + self.spdl_dist_thresh:
-            direction = "known"
-        elif self.reg_pts[0][1] - self.spdl_dist_thresh < track[-1][1] < self.reg_pts[0][1] + self.spdl_dist_thresh:
-            direction = "known"
-        else:
-            direction = "unknown"
-
-        if self.trk_previous_times.get(trk_id) != 0 and direction != "unknown" and trk_id not in self.trk_idslist:
-            self.trk_idslist.append(trk_id)
-
-            time_difference = time() - self.trk_previous_times[trk_id]
-            if time_difference > 0:
-                dist_difference = np.abs(track[-1][1] - self.trk_previous_points[trk_id][1])
-                speed = dist_difference / time_difference
+        first, last, dt = self.trk_history.span(ids, self.speed_window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(dt > 0, self.plane.distance(first, last) / dt * 3.6, np.nan)
+
+    def calculate_speeds(self):
+        """Measures the speed of the tracks of the frame that reach one of the region lines, once per track."""
+        ids = np.asarray(self.trk_ids, dtype=int)
+        slots = self.trk_history.index(ids)  # the history flags tracks with a measured speed as done
+        (x0, y0), (x1, y1) = self.reg_pts[0], self.reg_pts[1]
+        x, y = self.trk_history.span(ids, 1)[1].T
+        near = (np.abs(y - y1) < self.spdl_dist_thresh) | (np.abs(y - y0) < self.spdl_dist_thresh)
+        hit = (x0 < x) & (x < x1) & near & (self.trk_history.length[slots] > 1) & ~self.trk_history.done[slots]
+        self.trk_history.done[slots[hit]] = True
+        for trk_id, speed in zip(ids[hit].tolist(), self.speeds(ids[hit]).tolist()):
+            if speed == speed:  # not NaN, the timestamps differ
                 self.dist_data[trk_id] = speed
 
-        self.trk_previous_times[trk_id] = time()
-        self.trk_previous_points[trk_id] = track[-1]
-
     def estimate_speed(self, im0, tracks, region_color=(255, 0, 0)):
         """
         Estimates the speed of objects based on tracking data.
@@ -145,6 +159,7 @@ class SpeedEstimator:
             (ndarray): The image with annotated boxes and tracks.
         """
         self.im0 = im0
+        t = self.timestamp()  # also for frames without tracks, so that the frame clock keeps running
         if tracks[0].boxes.id is None:
             if self.view_img and self.env_check:
                 self.display_frames()
@@ -154,14 +169,10 @@ class SpeedEstimator:
         self.annotator = Annotator(self.im0, line_width=self.line_thickness)
         self.annotator.draw_region(reg_pts=self.reg_pts, color=region_color, thickness=self.region_thickness)
 
+        self.store_tracks_info(t)
+        self.calculate_speeds()
         for box, trk_id, cls in zip(self.boxes, self.trk_ids, self.clss):
-            track = self.store_track_info(trk_id, box)
-
-            if trk_id not in self.trk_previous_times:
-                self.trk_previous_times[trk_id] = 0
-
-            self.plot_box_and_track(trk_id, box, cls, track)
-            self.calculate_speed(trk_id, track)
+            self.plot_box_and_track(trk_id, box, cls, self.trk_history[trk_id])
 
         if self.view_img and self.env_check:
             self.display_frames()
@@ -103,3 +103,95 @@ class BaseTrack:
     def reset_id():
         """Reset the global track ID counter."""
         BaseTrack._count = 0
+
+
+class TrackStore:
+    """
+    Struct of arrays holding the state of all tracks of a tracker in preallocated contiguous arrays.
+
+    Every track occupies one slot, i.e. one row of each array. Slots of removed tracks return to a free list and are
+    reused by new tracks, arrays grow by doubling when all slots are in use.
+
+    Attributes:
+        capacity (int): Number of slots.
+        mean (np.ndarray): Kalman filter state means (capacity, 8).
+        covariance (np.ndarray): Kalman filter state covariances (capacity, 8, 8).
+        track_id (np.ndarray): Track IDs.
+        state (np.ndarray): Track states, see `TrackState`.
+        is_activated (np.ndarray): Whether tracks are confirmed.
+        score (np.ndarray): Confidence scores of the last matched detections.
+        cls (np.ndarray): Class labels of the last matched detections.
+        idx (np.ndarray): Indices of the last matched detections in their frame results.
+        angle (np.ndarray): Rotation angles of oriented boxes, NaN for axis-aligned boxes.
+        frame_id (np.ndarray): Frame IDs of the last updates.
+        start_frame (np.ndarray): Frame IDs of the activations.
+        tracklet_len (np.ndarray): Number of consecutive updates since the last (re-)activation.
+        order (np.ndarray): Insertion order of tracks in their tracked or lost list.
+        timed_out (np.ndarray): Whether tracks timed out while lost, re-found tracks are removed when lost again.
+        smooth_feat (np.ndarray | None): Smoothed ReID features (capacity, D), allocated with the first features.
+        used (np.ndarray): Whether slots hold a track.
+        free (list): Free slots, the lowest slot is reused first.
+
+    Methods:
+        alloc: Return free slots for new tracks.
+        release: Return the slots of removed tracks to the free list.
+        slots: Return the slots of tracks in the given states, in list order.
+    """
+
+    fields = {
+        "track_id": np.int64,
+        "state": np.int64,
+        "is_activated": bool,
+        "score": np.float64,
+        "cls": np.float64,
+        "idx": np.float64,
+        "angle": np.float64,
+        "frame_id": np.int64,
+        "start_frame": np.int64,
+        "tracklet_len": np.int64,
+        "order": np.int64,
+        "timed_out": bool,
+        "used": bool,
+    }
+
+    def __init__(self, capacity=64, ndim=8):
+        """Initialize an empty store with 'capacity' slots for states of 'ndim' dimensions."""
+        self.capacity = 0
+        self.mean = np.zeros((0, ndim))
+        self.covariance = np.zeros((0, ndim, ndim))
+        for k, dtype in self.fields.items():
+            setattr(self, k, np.zeros(0, dtype=dtype))
+        self.smooth_feat = None
+        self.free = []
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        """Grow all arrays to 'capacity' slots, adding the new slots to the free list."""
+        for k in ("mean", "covariance", "smooth_feat", *self.fields):
+            x = getattr(self, k)
+            if x is not None:
+                y = np.zeros((capacity, *x.shape[1:]), dtype=x.dtype)
+                y[: self.capacity] = x
+                setattr(self, k, y)
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))  # pop() returns the lowest slot first
+        self.capacity = capacity
+
+    def alloc(self, n):
+        """Return 'n' free slots for new tracks, growing the store if needed."""
+        if n > len(self.free):
+            self.grow(max(2 * self.capacity, self.capacity + n))
+        slots = np.array([self.free.pop() for _ in range(n)], dtype=int)
+        self.used[slots] = True
+        return slots
+
+    def release(self, slots):
+        """Mark the tracks at 'slots' removed and return their slots to the free list."""
+        self.state[slots] = TrackState.Removed
+        self.used[slots] = False
+        self.free.extend(slots.tolist())
+        self.free.sort(reverse=True)
+
+    def slots(self, *states):
+        """Return the slots of all tracks in one of 'states', sorted by their list order."""
+        slots = np.flatnonzero(self.used & np.isin(self.state, states))
+        return slots[np.argsort(self.order[slots], kind="stable")]
@@ -3,9 +3,13 @@
 from collections import deque
 
 import numpy as np
+import torch
+import torchvision
+
+from ultralytics.utils.torch_utils import select_device
 
 from .basetrack import TrackState
-from .byte_tracker import BYTETracker, STrack
+from .byte_tracker import BYTETracker, Detections, STrack
 from .utils import matching
 from .utils.gmc import GMC
 from .utils.kalman_filter import KalmanFilterXYWH
@@ -15,6 +19,9 @@ class BOTrack(STrack):
     """
     An extended version of the STrack class for YOLOv8, adding object tracking features.
 
+    Deprecated: `BOTSORT` keeps track state and smoothed features in its `TrackStore`, this standalone class is kept
+    for external code and will be removed in the future.
+
     Attributes:
         shared_kalman (KalmanFilterXYWH): A shared Kalman filter for all instances of BOTrack.
         smooth_feat (np.ndarray): Smoothed feature vector.
@@ -122,6 +129,46 @@ class BOTrack(STrack):
         return ret
 
 
+class ReID:
+    """
+    Appearance feature extractor for BOTSORT, embedding all detections of a frame in a single forward pass.
+
+    The frame is uploaded once, all detection boxes are cropped and resized into one (N, 3, h, w) batch with
+    `torchvision.ops.roi_align` and embedded by the model, which is any callable mapping that batch to (N, D) features.
+    A path to YOLO classification weights uses the pooled output of the last backbone layer as the embedding.
+
+    Attributes:
+        model (callable): Embedding model, (N, 3, h, w) RGB crops in range 0-1 to (N, D) features.
+        imgsz (tuple): Crop size (h, w).
+        device (torch.device): Device of the model.
+
+    Examples:
+        >>> reid = ReID("yolov8n-cls.pt")
+        >>> features = reid(frame, xyxy)  # (N, D) normalized features
+    """
+
+    def __init__(self, model="yolov8n-cls.pt", imgsz=(128, 64), device=None):
+        """Initialize with a model callable or YOLO classification weights, crop size 'imgsz' (h, w) and 'device'."""
+        self.device = select_device("" if device is None else device, verbose=False)
+        if isinstance(model, str):
+            from ultralytics.nn.tasks import attempt_load_one_weight
+
+            net = attempt_load_one_weight(model, device=self.device, fuse=True)[0].float().eval()
+            self.model = lambda x: torch.stack(net.predict(x, embed=[len(net.model) - 2]))
+        else:
+            self.model = model
+        self.imgsz = tuple(imgsz)
+
+    @torch.no_grad()
+    def __call__(self, img, xyxy):
+        """Return normalized features (N, D) of the boxes 'xyxy' (N, 4) in the BGR frame 'img'."""
+        im = torch.from_numpy(np.ascontiguousarray(img[..., ::-1])).to(self.device).permute(2, 0, 1)[None].float() / 255
+        boxes = torch.as_tensor(np.asarray(xyxy, dtype=np.float32), device=self.device)
+        crops = torchvision.ops.roi_align(im, [boxes], output_size=self.imgsz, aligned=True)
+        feat = torch.nn.functional.normalize(self.model(crops).float(), dim=1)
+        return feat.cpu().numpy()
+
+
 class BOTSORT(BYTETracker):
     """
     An extended version of the BYTETracker class for YOLOv8, designed for object tracking with ReID and GMC algorithm.
@@ -129,15 +176,18 @@ class BOTSORT(BYTETracker):
     Attributes:
         proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
         appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
-        encoder (object): Object to handle ReID embeddings, set to None if ReID is not enabled.
+        encoder (ReID): Appearance feature extractor, set to None if ReID is not enabled.
         gmc (GMC): An instance of the GMC algorithm for data association.
         args (object): Parsed command-line arguments containing tracking parameters.
+        alpha (float): Smoothing factor for the exponential moving average of track features.
 
     Methods:
         get_kalmanfilter(): Returns an instance of KalmanFilterXYWH for object tracking.
         init_track(dets, scores, cls, img): Initialize track with detections, scores, and classes.
         get_dists(tracks, detections): Get distances between tracks and detections using IoU and (optionally) ReID.
         multi_predict(tracks): Predict and track multiple objects with YOLOv8 model.
+        extract_features(detections, dists): Embed the detections that need appearance features.
+        set_features(tracks, detections): Update smoothed track features with the features of matched detections.
 
     Usage:
         bot_sort = BOTSORT(args, frame_rate)
@@ -146,6 +196,8 @@ class BOTSORT(BYTETracker):
 
     Note:
         The class is designed to work with the YOLOv8 object detection model and supports ReID only if enabled via args.
+        Appearance features are only extracted for detections whose IoU match is ambiguous, a detection overlapping
+        exactly one track that overlaps no other detection is matched to it whatever the appearance cost.
     """
 
     def __init__(self, args, frame_rate=30):
@@ -155,44 +207,119 @@ class BOTSORT(BYTETracker):
         self.proximity_thresh = args.proximity_thresh
         self.appearance_thresh = args.appearance_thresh
 
-        if args.with_reid:
-            # Haven't supported BoT-SORT(reid) yet
-            self.encoder = None
-        self.gmc = GMC(method=args.gmc_method)
+        self.encoder = ReID(args.get("reid_model", "yolov8n-cls.pt")) if args.with_reid else None
+        self.img = None
+        self.gmc = GMC(
+            method=args.gmc_method,
+            min_points=args.get("gmc_min_points", 0.5),
+            skip_thresh=args.get("gmc_skip", 0.0),
+        )
+        self.alpha = 0.9
 
     def get_kalmanfilter(self):
         """Returns an instance of KalmanFilterXYWH for object tracking."""
         return KalmanFilterXYWH()
 
     def init_track(self, dets, scores, cls, img=None):
-        """Initialize track with detections, scores, and classes."""
-        if len(dets) == 0:
-            return []
-        if self.args.with_reid and self.encoder is not None:
-            features_keep = self.encoder.inference(img, dets)
-            return [BOTrack(xyxy, s, c, f) for (xyxy, s, c, f) in zip(dets, scores, cls, features_keep)]  # detections
-        else:
-            return [BOTrack(xyxy, s, c) for (xyxy, s, c) in zip(dets, scores, cls)]  # detections
+        """Initialize track with detections, scores, and classes, appearance features are extracted in `get_dists`."""
+        self.img = img
+        return Detections(dets, scores, cls)
 
     def get_dists(self, tracks, detections):
         """Get distances between tracks and detections using IoU and (optionally) ReID embeddings."""
-        dists = matching.iou_distance(tracks, detections)
+        dists = matching.iou_distance(self.boxes(tracks), detections.boxes)
         dists_mask = dists > self.proximity_thresh
 
         # TODO: mot20
         # if not self.args.mot20:
-        dists = matching.fuse_score(dists, detections)
-
-        if self.args.with_reid and self.encoder is not None:
-            emb_dists = matching.embedding_distance(tracks, detections) / 2.0
+        dists = matching.fuse_score(dists, detections.score)
+
+        if self.encoder is not None and self.img is not None and len(detections):
+            if detections.feat is None:
+                self.extract_features(detections, dists)
+            feat = self.store.smooth_feat
+            feat = np.zeros((len(tracks), detections.feat.shape[1])) if feat is None else feat[tracks]
+            emb_dists = matching.embedding_distance(feat, detections.feat) / 2.0
             emb_dists[emb_dists > self.appearance_thresh] = 1.0
             emb_dists[dists_mask] = 1.0
             dists = np.minimum(dists, emb_dists)
         return dists
 
+    def extract_features(self, detections, dists):
+        """
+        Embed the detections that need appearance features in one batch, skipping unambiguous IoU matches.
+
+        A detection overlapping exactly one track that overlaps no other detection, with a fused cost within
+        `match_thresh`, is a single pair in the assignment and is matched whatever its appearance cost, its feature is
+        left zero and does not update the smoothed track feature.
+
+        Args:
+            detections (Detections): Detections of the first association, `feat` is set to their features (N, D).
+            dists (np.ndarray): Fused IoU cost matrix of the tracks and detections.
+        """
+        need = np.arange(len(detections))
+        if len(dists):
+            overlap = dists < 1
+            row, col = overlap.sum(1), overlap.sum(0)
+            need = np.flatnonzero((col != 1) | (row[overlap.argmax(0)] != 1) | (dists.min(0) > self.args.match_thresh))
+        if len(need) == 0 and self.store.smooth_feat is not None:
+            detections.feat = np.zeros((len(detections), self.store.smooth_feat.shape[1]), dtype=np.float32)
+            return
+        xyxy = detections.tlwh[need].copy()  # axis-aligned crops, also for oriented boxes
+        xyxy[:, 2:] += xyxy[:, :2]
+        feat = self.encoder(self.img, xyxy)
+        detections.feat = np.zeros((len(detections), feat.shape[1]), dtype=np.float32)
+        detections.feat[need] = feat
+
     def multi_predict(self, tracks):
-        """Predict and track multiple objects with YOLOv8 model."""
-        BOTrack.multi_predict(tracks)
+        """Predict and track multiple objects with YOLOv8 model, zeroing the size velocities of lost tracks."""
+        if len(tracks) == 0:
+            return
+        s = self.store
+        mean = s.mean[tracks]
+        mean[s.state[tracks] != TrackState.Tracked, 6:8] = 0
+        s.mean[tracks], s.covariance[tracks] = self.kalman_filter.multi_predict(mean, s.covariance[tracks])
+
+    def activate(self, detections):
+        """Start new tracks from 'detections', initializing their smoothed features."""
+        slots = super().activate(detections)
+        self.set_features(slots, detections, smooth=False)
+        return slots
+
+    def update_tracks(self, tracks, detections):
+        """Update the tracks at slots 'tracks' with their matched 'detections' and smooth their features."""
+        self.set_features(tracks, detections)
+        return super().update_tracks(tracks, detections)
+
+    def set_features(self, tracks, detections, smooth=True):
+        """Update smoothed features of the tracks at slots 'tracks' with the normalized 'detections' features."""
+        if detections.feat is None or len(tracks) == 0:
+            return
+        s = self.store
+        if s.smooth_feat is None:
+            s.smooth_feat = np.zeros((s.capacity, detections.feat.shape[1]), dtype=np.float32)
+        k = detections.feat.any(1)  # detections with extracted features
+        tracks, feat = tracks[k], detections.feat[k]
+        if smooth:
+            feat = self.alpha * s.smooth_feat[tracks] + (1 - self.alpha) * feat
+        s.smooth_feat[tracks] = feat / np.linalg.norm(feat, axis=1, keepdims=True)
+
+    def tlwh(self, mean):
+        """Convert Kalman filter states 'mean' (N, 8) to boxes (N, 4) as top left x, top left y, width and height."""
+        ret = mean[:, :4].copy()
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    def convert_coords(self, tlwh):
+        """Converts Top-Left-Width-Height bounding boxes (N, 4) to X-Y-Width-Height format."""
+        return self.tlwh_to_xywh(tlwh)
+
+    @staticmethod
+    def tlwh_to_xywh(tlwh):
+        """Convert bounding boxes (N, 4) to format `(center x, center y, width, height)`."""
+        ret = np.array(tlwh)
+        ret[:, :2] += ret[:, 2:] / 2
+        return ret
 
     def reset(self):
         """Reset tracker."""
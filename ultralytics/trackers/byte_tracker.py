@@ -4,17 +4,148 @@ import numpy as np
 
 from ..utils import LOGGER
 from ..utils.ops import xywh2ltwh
-from .basetrack import BaseTrack, TrackState
+from .basetrack import BaseTrack, TrackState, TrackStore
 from .utils import matching
 from .utils.kalman_filter import KalmanFilterXYAH
 
 
+class Detections:
+    """
+    Struct of arrays holding the detections of one frame that are associated with tracks.
+
+    Attributes:
+        tlwh (np.ndarray): Boxes (N, 4) as top left x, top left y, width and height.
+        angle (np.ndarray | None): Rotation angles (N,) of oriented boxes, None for axis-aligned boxes.
+        score (np.ndarray): Confidence scores (N,).
+        cls (np.ndarray): Class labels (N,).
+        idx (np.ndarray): Indices (N,) of the detections in the frame results.
+        feat (np.ndarray | None): Normalized ReID features (N, D), None without ReID.
+    """
+
+    def __init__(self, xywh, score, cls, feat=None):
+        """Initialize from boxes 'xywh' (N, 5) or oriented boxes (N, 6), both followed by the detection index."""
+        # xywh+idx or xywha+idx
+        assert xywh.shape[1] in {5, 6}, f"expected 5 or 6 values but got {xywh.shape[1]}"
+        self.tlwh = np.asarray(xywh2ltwh(xywh[:, :4]), dtype=np.float32)
+        self.angle = xywh[:, 4] if xywh.shape[1] == 6 else None
+        self.score = np.asarray(score)
+        self.cls = np.asarray(cls)
+        self.idx = xywh[:, -1]
+        self.feat = None if feat is None else np.asarray(feat) / np.linalg.norm(feat, axis=1, keepdims=True)
+
+    def __len__(self):
+        """Return the number of detections."""
+        return len(self.tlwh)
+
+    def __getitem__(self, i):
+        """Return the detections selected by index array or mask 'i'."""
+        d = object.__new__(Detections)
+        d.tlwh, d.score, d.cls, d.idx = self.tlwh[i], self.score[i], self.cls[i], self.idx[i]
+        d.angle = None if self.angle is None else self.angle[i]
+        d.feat = None if self.feat is None else self.feat[i]
+        return d
+
+    @property
+    def boxes(self):
+        """Return boxes for IoU matching, (N, 4) as x1, y1, x2, y2 or (N, 5) as x, y, w, h, angle if oriented."""
+        ret = self.tlwh.copy()
+        if self.angle is None:
+            ret[:, 2:] += ret[:, :2]
+            return ret
+        ret[:, :2] += ret[:, 2:] / 2
+        return np.concatenate([ret, self.angle[:, None]], axis=1)
+
+
+class TrackView:
+    """
+    View of a single track held in the `TrackStore` of a tracker, as listed by `BYTETracker.tracked_stracks`.
+
+    The view reads the current track state from the store, it is only valid until the track is removed and its slot is
+    reused by a new track.
+
+    Attributes:
+        tracker (BYTETracker): Tracker holding the track.
+        slot (int): Slot of the track in the tracker store.
+        mean (np.ndarray): Mean state estimate vector.
+        covariance (np.ndarray): Covariance of state estimate.
+        track_id (int): Track ID.
+        state (int): Track state, see `TrackState`.
+        is_activated (bool): Whether the track is confirmed.
+        score (float): Confidence score of the last matched detection.
+        cls (float): Class label of the last matched detection.
+        idx (int): Index of the last matched detection in its frame results.
+        angle (float | None): Rotation angle of an oriented box.
+        frame_id (int): Frame ID of the last update.
+        start_frame (int): Frame ID of the activation.
+        tracklet_len (int): Number of consecutive updates since the last (re-)activation.
+    """
+
+    def __init__(self, tracker, slot):
+        """Initialize a view of the track at 'slot' in the store of 'tracker'."""
+        self.tracker = tracker
+        self.slot = int(slot)
+
+    def __getattr__(self, name):
+        """Read per-track fields from the tracker store."""
+        if name in TrackStore.fields or name in {"mean", "covariance"}:
+            return getattr(self.tracker.store, name)[self.slot]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def angle(self):
+        """Rotation angle of an oriented box, None for axis-aligned boxes."""
+        angle = self.tracker.store.angle[self.slot]
+        return None if np.isnan(angle) else angle
+
+    @property
+    def end_frame(self):
+        """Return the last frame ID of the track."""
+        return self.frame_id
+
+    @property
+    def tlwh(self):
+        """Get current position in bounding box format (top left x, top left y, width, height)."""
+        return self.tracker.tlwh(self.mean[None])[0]
+
+    @property
+    def xyxy(self):
+        """Convert bounding box to format (min x, min y, max x, max y), i.e., (top left, bottom right)."""
+        ret = self.tlwh
+        ret[2:] += ret[:2]
+        return ret
+
+    @property
+    def xywh(self):
+        """Get current position in bounding box format (center x, center y, width, height)."""
+        ret = self.tlwh
+        ret[:2] += ret[2:] / 2
+        return ret
+
+    @property
+    def xywha(self):
+        """Get current position in bounding box format (center x, center y, width, height, angle)."""
+        if self.angle is None:
+            LOGGER.warning("WARNING ⚠️ `angle` attr not found, returning `xywh` instead.")
+            return self.xywh
+        return np.concatenate([self.xywh, [self.angle]])
+
+    @property
+    def result(self):
+        """Get current tracking results."""
+        return self.tracker.results(np.array([self.slot]))[0].tolist()
+
+    def __repr__(self):
+        """Return a string representation of the track with its ID and start and end frames."""
+        return f"OT_{self.track_id}_({self.start_frame}-{self.end_frame})"
+
+
 class STrack(BaseTrack):
     """
     Single object tracking representation that uses Kalman filtering for state estimation.
 
-    This class is responsible for storing all the information regarding individual tracklets and performs state updates
-    and predictions based on Kalman filter.
+    Deprecated: `BYTETracker` and `BOTSORT` no longer use STrack objects, they keep the state of all tracks in a
+    `TrackStore` and list their tracks as read-only `TrackView`s. This standalone class is kept for external code that
+    builds and updates tracks itself and will be removed in the future.
 
     Attributes:
         shared_kalman (KalmanFilterXYAH): Shared Kalman filter that is used across all STrack instances for prediction.
@@ -42,10 +173,17 @@ class STrack(BaseTrack):
     """
 
     shared_kalman = KalmanFilterXYAH()
+    _warned = False  # deprecation warning issued
 
     def __init__(self, xywh, score, cls):
         """Initialize new STrack instance."""
         super().__init__()
+        if not STrack._warned:
+            LOGGER.warning(
+                "WARNING ⚠️ 'STrack' and 'BOTrack' are deprecated and will be removed in the future. Trackers keep "
+                "track state in a 'TrackStore' and list their tracks as read-only 'TrackView's."
+            )
+            STrack._warned = True
         # xywh+idx or xywha+idx
         assert len(xywh) in {5, 6}, f"expected 5 or 6 values but got {len(xywh)}"
         self._tlwh = np.asarray(xywh2ltwh(xywh[:4]), dtype=np.float32)
@@ -214,35 +352,37 @@ class BYTETracker:
     BYTETracker: A tracking algorithm built on top of YOLOv8 for object detection and tracking.
 
     The class is responsible for initializing, updating, and managing the tracks for detected objects in a video
-    sequence. It maintains the state of tracked, lost, and removed tracks over frames, utilizes Kalman filtering for
-    predicting the new object locations, and performs data association.
+    sequence. All track state is held in the struct of arrays `store`, tracks are addressed by their slots, so Kalman
+    filter prediction and correction, camera motion compensation and the tracked, lost and removed bookkeeping run as
+    array operations over all tracks.
 
     Attributes:
-        tracked_stracks (list[STrack]): List of successfully activated tracks.
-        lost_stracks (list[STrack]): List of lost tracks.
-        removed_stracks (list[STrack]): List of removed tracks.
+        store (TrackStore): Arrays holding the state of all tracked and lost tracks.
+        id_count (int): Track ID counter of this tracker, so that the IDs of a stream do not depend on other streams.
         frame_id (int): The current frame ID.
         args (namespace): Command-line arguments.
         max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
         kalman_filter (object): Kalman Filter object.
+        tracked_stracks (list[TrackView]): Views of the tracked tracks, in list order.
+        lost_stracks (list[TrackView]): Views of the lost tracks, in list order.
 
     Methods:
         update(results, img=None): Updates object tracker with new detections.
         get_kalmanfilter(): Returns a Kalman filter object for tracking bounding boxes.
-        init_track(dets, scores, cls, img=None): Initialize object tracking with detections.
+        init_track(dets, scores, cls, img=None): Initialize detections for association with tracks.
         get_dists(tracks, detections): Calculates the distance between tracks and detections.
         multi_predict(tracks): Predicts the location of tracks.
-        reset_id(): Resets the ID counter of STrack.
-        joint_stracks(tlista, tlistb): Combines two lists of stracks.
-        sub_stracks(tlista, tlistb): Filters out the stracks present in the second list from the first list.
-        remove_duplicate_stracks(stracksa, stracksb): Removes duplicate stracks based on IoU.
+        multi_gmc(tracks, H): Compensates track states for camera motion with a homography matrix.
+        activate(detections): Start new tracks from detections.
+        update_tracks(tracks, detections): Update or re-activate matched tracks.
+        reset_id(): Resets the ID counter of tracks.
+        remove_duplicate_stracks(tracks_a, tracks_b): Removes duplicate tracks based on IoU.
     """
 
     def __init__(self, args, frame_rate=30):
         """Initialize a YOLOv8 object to track objects with given arguments and frame rate."""
-        self.tracked_stracks = []  # type: list[STrack]
-        self.lost_stracks = []  # type: list[STrack]
-        self.removed_stracks = []  # type: list[STrack]
+        self.store = TrackStore()
+        self.order = 0  # insertion counter keeping the tracked and lost lists in order
 
         self.frame_id = 0
         self.args = args
@@ -250,13 +390,20 @@ class BYTETracker:
         self.kalman_filter = self.get_kalmanfilter()
         self.reset_id()
 
+    @property
+    def tracked_stracks(self):
+        """Views of the tracked tracks, in list order."""
+        return [TrackView(self, i) for i in self.store.slots(TrackState.Tracked)]
+
+    @property
+    def lost_stracks(self):
+        """Views of the lost tracks, in list order."""
+        return [TrackView(self, i) for i in self.store.slots(TrackState.Lost, TrackState.Removed)]
+
     def update(self, results, img=None):
         """Updates object tracker with new detections and returns tracked object bounding boxes."""
         self.frame_id += 1
-        activated_stracks = []
-        refind_stracks = []
-        lost_stracks = []
-        removed_stracks = []
+        s = self.store
 
         scores = results.conf
         bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
@@ -277,168 +424,191 @@ class BYTETracker:
         cls_second = cls[inds_second]
 
         detections = self.init_track(dets, scores_keep, cls_keep, img)
-        # Add newly detected tracklets to tracked_stracks
-        unconfirmed = []
-        tracked_stracks = []  # type: list[STrack]
-        for track in self.tracked_stracks:
-            if not track.is_activated:
-                unconfirmed.append(track)
-            else:
-                tracked_stracks.append(track)
+        # Split unconfirmed tracks, usually tracks with only one beginning frame, from the confirmed tracked ones
+        tracked = s.slots(TrackState.Tracked)
+        unconfirmed = tracked[~s.is_activated[tracked]]
+        lost = s.slots(TrackState.Lost, TrackState.Removed)  # including tracks timed out on the previous frame
         # Step 2: First association, with high score detection boxes
-        strack_pool = self.joint_stracks(tracked_stracks, self.lost_stracks)
+        strack_pool = np.concatenate([tracked[s.is_activated[tracked]], lost])
         # Predict the current location with KF
         self.multi_predict(strack_pool)
         if hasattr(self, "gmc") and img is not None:
             warp = self.gmc.apply(img, dets)
-            STrack.multi_gmc(strack_pool, warp)
-            STrack.multi_gmc(unconfirmed, warp)
+            self.multi_gmc(np.concatenate([strack_pool, unconfirmed]), warp)
 
         dists = self.get_dists(strack_pool, detections)
-        matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
-
-        for itracked, idet in matches:
-            track = strack_pool[itracked]
-            det = detections[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        matches, u_track, u_detection = self.assign(dists, thresh=self.args.match_thresh)
+        refind = self.update_tracks(strack_pool[matches[:, 0]], detections[matches[:, 1]])
+        refind_stracks = strack_pool[matches[:, 0]][refind]
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(dets_second, scores_second, cls_second, img)
-        r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
+        r_tracked_stracks = strack_pool[u_track][s.state[strack_pool[u_track]] == TrackState.Tracked]
         # TODO
-        dists = matching.iou_distance(r_tracked_stracks, detections_second)
-        matches, u_track, u_detection_second = matching.linear_assignment(dists, thresh=0.5)
-        for itracked, idet in matches:
-            track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
-
-        for it in u_track:
-            track = r_tracked_stracks[it]
-            if track.state != TrackState.Lost:
-                track.mark_lost()
-                lost_stracks.append(track)
+        dists = matching.iou_distance(self.boxes(r_tracked_stracks), detections_second.boxes)
+        matches, u_track, _ = self.assign(dists, thresh=0.5)
+        refind = self.update_tracks(r_tracked_stracks[matches[:, 0]], detections_second[matches[:, 1]])
+        refind_stracks = np.concatenate([refind_stracks, r_tracked_stracks[matches[:, 0]][refind]])
+
+        lost_stracks = r_tracked_stracks[u_track]
+        s.state[lost_stracks] = TrackState.Lost
         # Deal with unconfirmed tracks, usually tracks with only one beginning frame
-        detections = [detections[i] for i in u_detection]
+        detections = detections[u_detection]
         dists = self.get_dists(unconfirmed, detections)
-        matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
-        for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
-            activated_stracks.append(unconfirmed[itracked])
-        for it in u_unconfirmed:
-            track = unconfirmed[it]
-            track.mark_removed()
-            removed_stracks.append(track)
+        matches, u_unconfirmed, u_detection = self.assign(dists, thresh=0.7)
+        self.update_tracks(unconfirmed[matches[:, 0]], detections[matches[:, 1]])
+        removed_stracks = [unconfirmed[u_unconfirmed]]
         # Step 4: Init new stracks
-        for inew in u_detection:
-            track = detections[inew]
-            if track.score < self.args.new_track_thresh:
-                continue
-            track.activate(self.kalman_filter, self.frame_id)
-            activated_stracks.append(track)
-        # Step 5: Update state
-        for track in self.lost_stracks:
-            if self.frame_id - track.end_frame > self.max_time_lost:
-                track.mark_removed()
-                removed_stracks.append(track)
-
-        self.tracked_stracks = [t for t in self.tracked_stracks if t.state == TrackState.Tracked]
-        self.tracked_stracks = self.joint_stracks(self.tracked_stracks, activated_stracks)
-        self.tracked_stracks = self.joint_stracks(self.tracked_stracks, refind_stracks)
-        self.lost_stracks = self.sub_stracks(self.lost_stracks, self.tracked_stracks)
-        self.lost_stracks.extend(lost_stracks)
-        self.lost_stracks = self.sub_stracks(self.lost_stracks, self.removed_stracks)
-        self.tracked_stracks, self.lost_stracks = self.remove_duplicate_stracks(self.tracked_stracks, self.lost_stracks)
-        self.removed_stracks.extend(removed_stracks)
-        if len(self.removed_stracks) > 1000:
-            self.removed_stracks = self.removed_stracks[-999:]  # clip remove stracks to 1000 maximum
-
-        return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
+        detections = detections[u_detection]
+        new_stracks = self.activate(detections[detections.score >= self.args.new_track_thresh])
+        # Step 5: Update state, timed-out lost tracks stay in the lost list for one more frame and can still be
+        # re-found, re-found tracks that timed out before are removed as soon as they are lost again
+        removed_stracks += [lost[s.state[lost] == TrackState.Removed], lost_stracks[s.timed_out[lost_stracks]]]
+        lost = lost[s.state[lost] == TrackState.Lost]
+        timed_out = lost[self.frame_id - s.frame_id[lost] > self.max_time_lost]
+        s.state[timed_out], s.timed_out[timed_out] = TrackState.Removed, True
+
+        # New and refound tracks are appended to the tracked list, newly lost tracks to the lost list
+        for slots in new_stracks, refind_stracks, lost_stracks:
+            s.order[slots] = self.order + np.arange(len(slots))
+            self.order += len(slots)
+        s.release(np.concatenate(removed_stracks))
+        self.remove_duplicate_stracks(s.slots(TrackState.Tracked), s.slots(TrackState.Lost, TrackState.Removed))
+
+        tracked = s.slots(TrackState.Tracked)
+        return self.results(tracked[s.is_activated[tracked]])
 
     def get_kalmanfilter(self):
         """Returns a Kalman filter object for tracking bounding boxes."""
         return KalmanFilterXYAH()
 
     def init_track(self, dets, scores, cls, img=None):
-        """Initialize object tracking with detections and scores using STrack algorithm."""
-        return [STrack(xyxy, s, c) for (xyxy, s, c) in zip(dets, scores, cls)] if len(dets) else []  # detections
+        """Initialize detections for association with tracks from boxes, scores and classes."""
+        return Detections(dets, scores, cls)
 
     def get_dists(self, tracks, detections):
         """Calculates the distance between tracks and detections using IoU and fuses scores."""
-        dists = matching.iou_distance(tracks, detections)
+        dists = matching.iou_distance(self.boxes(tracks), detections.boxes)
         # TODO: mot20
         # if not self.args.mot20:
-        dists = matching.fuse_score(dists, detections)
+        dists = matching.fuse_score(dists, detections.score)
         return dists
 
+    @staticmethod
+    def assign(dists, thresh):
+        """Solve the linear assignment of a track to detection cost matrix, returning index arrays."""
+        matches, u_a, u_b = matching.linear_assignment(dists, thresh=thresh)
+        return np.asarray(matches, dtype=int).reshape(-1, 2), np.asarray(u_a, dtype=int), np.asarray(u_b, dtype=int)
+
     def multi_predict(self, tracks):
-        """Returns the predicted tracks using the YOLOv8 network."""
-        STrack.multi_predict(tracks)
+        """Predict the states of the tracks at slots 'tracks' with the Kalman filter, vectorized over all tracks."""
+        if len(tracks) == 0:
+            return
+        s = self.store
+        mean = s.mean[tracks]
+        mean[s.state[tracks] != TrackState.Tracked, 7] = 0
+        s.mean[tracks], s.covariance[tracks] = self.kalman_filter.multi_predict(mean, s.covariance[tracks])
+
+    def multi_gmc(self, tracks, H=np.eye(2, 3)):
+        """Update positions and covariances of the tracks at slots 'tracks' using a homography matrix."""
+        if len(tracks) == 0:
+            return
+        s = self.store
+        R8x8 = np.kron(np.eye(4, dtype=float), H[:2, :2])
+        mean = s.mean[tracks] @ R8x8.T
+        mean[:, :2] += H[:2, 2]
+        s.mean[tracks] = mean
+        s.covariance[tracks] = R8x8 @ s.covariance[tracks] @ R8x8.T
+
+    def activate(self, detections):
+        """Start new tracks from 'detections', returning their slots."""
+        s, n = self.store, len(detections)
+        slots = s.alloc(n)
+        s.track_id[slots] = self.id_count + np.arange(1, n + 1)
+        self.id_count += n
+        for i, measurement in zip(slots, self.convert_coords(detections.tlwh)):
+            s.mean[i], s.covariance[i] = self.kalman_filter.initiate(measurement)
+        s.tracklet_len[slots] = 0
+        s.state[slots] = TrackState.Tracked
+        s.timed_out[slots] = False
+        s.is_activated[slots] = self.frame_id == 1
+        s.frame_id[slots] = s.start_frame[slots] = self.frame_id
+        self.set_detections(slots, detections)
+        return slots
+
+    def update_tracks(self, tracks, detections):
+        """Update the tracks at slots 'tracks' with their matched 'detections', returns a mask of re-activated ones."""
+        s = self.store
+        refind = s.state[tracks] != TrackState.Tracked
+        mean, covariance = s.mean[tracks], s.covariance[tracks]
+        s.mean[tracks], s.covariance[tracks] = self.kalman_filter.multi_update(
+            mean, covariance, self.convert_coords(detections.tlwh)
+        )
+        s.tracklet_len[tracks] = np.where(refind, 0, s.tracklet_len[tracks] + 1)
+        s.state[tracks] = TrackState.Tracked
+        s.is_activated[tracks] = True
+        s.frame_id[tracks] = self.frame_id
+        self.set_detections(tracks, detections)
+        return refind
+
+    def set_detections(self, tracks, detections):
+        """Copy score, class, index and angle of the matched 'detections' to the tracks at slots 'tracks'."""
+        s = self.store
+        s.score[tracks], s.cls[tracks], s.idx[tracks] = detections.score, detections.cls, detections.idx
+        s.angle[tracks] = np.nan if detections.angle is None else detections.angle
+
+    def tlwh(self, mean):
+        """Convert Kalman filter states 'mean' (N, 8) to boxes (N, 4) as top left x, top left y, width and height."""
+        ret = mean[:, :4].copy()
+        ret[:, 2] *= ret[:, 3]
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    def convert_coords(self, tlwh):
+        """Convert boxes (N, 4) from top-left-width-height format to Kalman filter measurements."""
+        return self.tlwh_to_xyah(tlwh)
 
     @staticmethod
-    def reset_id():
-        """Resets the ID counter of STrack."""
-        STrack.reset_id()
+    def tlwh_to_xyah(tlwh):
+        """Convert boxes (N, 4) to format (center x, center y, aspect ratio, height), where aspect ratio is width /
+        height.
+        """
+        ret = np.array(tlwh)
+        ret[:, :2] += ret[:, 2:] / 2
+        ret[:, 2] /= ret[:, 3]
+        return ret
+
+    def boxes(self, tracks):
+        """Return boxes of the tracks at slots 'tracks' for IoU matching, as xyxy or as xywh and angle if oriented."""
+        ret = self.tlwh(self.store.mean[tracks])
+        angle = self.store.angle[tracks]
+        if len(tracks) == 0 or np.isnan(angle[0]):
+            ret[:, 2:] += ret[:, :2]
+            return ret
+        ret[:, :2] += ret[:, 2:] / 2
+        return np.concatenate([ret, angle[:, None]], axis=1)
+
+    def results(self, tracks):
+        """Return tracking results of the tracks at slots 'tracks' as boxes followed by ID, score, class and index."""
+        s = self.store
+        fields = np.stack([s.track_id[tracks], s.score[tracks], s.cls[tracks], s.idx[tracks]], axis=1)
+        return np.concatenate([self.boxes(tracks), fields], axis=1).astype(np.float32)
+
+    def reset_id(self):
+        """Resets the track ID counter."""
+        self.id_count = 0
 
     def reset(self):
         """Reset tracker."""
-        self.tracked_stracks = []  # type: list[STrack]
-        self.lost_stracks = []  # type: list[STrack]
-        self.removed_stracks = []  # type: list[STrack]
+        self.store = TrackStore()
+        self.order = 0
         self.frame_id = 0
         self.kalman_filter = self.get_kalmanfilter()
         self.reset_id()
 
-    @staticmethod
-    def joint_stracks(tlista, tlistb):
-        """Combine two lists of stracks into a single one."""
-        exists = {}
-        res = []
-        for t in tlista:
-            exists[t.track_id] = 1
-            res.append(t)
-        for t in tlistb:
-            tid = t.track_id
-            if not exists.get(tid, 0):
-                exists[tid] = 1
-                res.append(t)
-        return res
-
-    @staticmethod
-    def sub_stracks(tlista, tlistb):
-        """DEPRECATED CODE in https://github.com/ultralytics/ultralytics/pull/1890/
-        stracks = {t.track_id: t for t in tlista}
-        for t in tlistb:
-            tid = t.track_id
-            if stracks.get(tid, 0):
-                del stracks[tid]
-        return list(stracks.values())
-        """
-        track_ids_b = {t.track_id for t in tlistb}
-        return [t for t in tlista if t.track_id not in track_ids_b]
-
-    @staticmethod
-    def remove_duplicate_stracks(stracksa, stracksb):
-        """Remove duplicate stracks with non-maximum IoU distance."""
-        pdist = matching.iou_distance(stracksa, stracksb)
-        pairs = np.where(pdist < 0.15)
-        dupa, dupb = [], []
-        for p, q in zip(*pairs):
-            timep = stracksa[p].frame_id - stracksa[p].start_frame
-            timeq = stracksb[q].frame_id - stracksb[q].start_frame
-            if timep > timeq:
-                dupb.append(q)
-            else:
-                dupa.append(p)
-        resa = [t for i, t in enumerate(stracksa) if i not in dupa]
-        resb = [t for i, t in enumerate(stracksb) if i not in dupb]
-        return resa, resb
+    def remove_duplicate_stracks(self, tracks_a, tracks_b):
+        """Remove the younger track of each pair of tracks from 'tracks_a' and 'tracks_b' with IoU distance < 0.15."""
+        s = self.store
+        p, q = np.nonzero(matching.iou_distance(self.boxes(tracks_a), self.boxes(tracks_b)) < 0.15)
+        age_a = s.frame_id[tracks_a[p]] - s.start_frame[tracks_a[p]]
+        age_b = s.frame_id[tracks_b[q]] - s.start_frame[tracks_b[q]]
+        s.release(np.unique(np.concatenate([tracks_b[q[age_a > age_b]], tracks_a[p[age_a <= age_b]]])))
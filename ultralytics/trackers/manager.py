@@ -0,0 +1,104 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class TrackerManager:
+    """
+    Runs the trackers of multiple streams on a pool of worker threads.
+
+    Every stream is assigned to one worker thread and its jobs run in submission order, so the frames of a stream are
+    tracked strictly in order while different streams are tracked in parallel. Tracking is mostly NumPy and OpenCV
+    work (Kalman filter, assignment, GMC), which releases the GIL, so threads scale without copying frames or tracker
+    state to other processes.
+
+    Attributes:
+        trackers (list): One BYTETracker or BOTSORT instance per stream.
+        workers (int): Number of worker threads.
+        queues (list): One job queue per worker thread.
+        threads (list): Worker threads.
+        latency (np.ndarray): Time from submission to result of the last update of each stream in milliseconds.
+        total (np.ndarray): Accumulated update latency of each stream in milliseconds.
+        frames (np.ndarray): Number of updates of each stream.
+
+    Methods:
+        submit: Queue a tracker update of a stream, returning a Future of its tracks.
+        update: Submit detections of all streams of a batch and return the tracks in stream order.
+        reset: Queue a tracker reset of a stream.
+        summary: Return a string with the mean and worst stream latency.
+        close: Stop the worker threads.
+
+    Examples:
+        >>> manager = TrackerManager([BYTETracker(cfg) for _ in range(32)], workers=8)
+        >>> futures = [manager.submit(i, det, im) for i, (det, im) in enumerate(zip(dets, ims))]
+        >>> tracks = [f.result() for f in futures]
+    """
+
+    def __init__(self, trackers, workers=4):
+        """Initialize the manager for 'trackers' and start at most 'workers' threads."""
+        self.trackers = trackers
+        self.workers = max(min(workers, len(trackers)), 1)
+        self.queues = [queue.Queue() for _ in range(self.workers)]
+        self.threads = [threading.Thread(target=self._run, args=(q,), daemon=True) for q in self.queues]
+        self.latency = np.zeros(len(trackers))
+        self.total = np.zeros(len(trackers))
+        self.frames = np.zeros(len(trackers), dtype=int)
+        for t in self.threads:
+            t.start()
+
+    def _run(self, q):
+        """Run queued jobs until a None sentinel is received."""
+        while True:
+            job = q.get()
+            if job is None:
+                break
+            i, fn, args, future, t, timed = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except Exception as e:
+                    future.set_exception(e)
+                if timed:
+                    self.latency[i] = (time.perf_counter() - t) * 1e3
+                    self.total[i] += self.latency[i]
+                    self.frames[i] += 1
+
+    def _submit(self, i, fn, args, timed=False):
+        """Queue 'fn(*args)' on the worker thread of stream 'i' and return its Future, timing it if 'timed'."""
+        future = Future()
+        self.queues[i % self.workers].put((i, fn, args, future, time.perf_counter(), timed))
+        return future
+
+    def submit(self, i, det, img=None):
+        """Queue the update of the tracker of stream 'i' with detections 'det' and frame 'img', returns a Future."""
+        return self._submit(i, self.trackers[i].update, (det, img), timed=True)
+
+    def update(self, dets, imgs=None):
+        """Update the trackers of all streams with one batch of detections and frames, returns tracks per stream."""
+        imgs = [None] * len(dets) if imgs is None else imgs
+        futures = [self.submit(i, det, img) for i, (det, img) in enumerate(zip(dets, imgs))]
+        return [f.result() for f in futures]
+
+    def reset(self, i):
+        """Queue the reset of the tracker of stream 'i' after its pending updates, returns a Future."""
+        return self._submit(i, self.trackers[i].reset, ())
+
+    def summary(self):
+        """Return a string with the mean and worst stream update latency."""
+        mean = self.total / np.maximum(self.frames, 1)
+        return (
+            f"Trackers: {len(self.trackers)} streams on {self.workers} threads, {mean.mean():.1f}ms mean latency, "
+            f"{mean.max():.1f}ms slowest stream {mean.argmax()}"
+        )
+
+    def close(self):
+        """Finish the queued jobs and stop the worker threads."""
+        for q in self.queues:
+            q.put(None)
+        for t in self.threads:
+            t.join()
@@ -1,15 +1,18 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
+import os
 from functools import partial
 from pathlib import Path
 
+import numpy as np
 import torch
 
-from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils import LOGGER, IterableSimpleNamespace, yaml_load
 from ultralytics.utils.checks import check_yaml
 
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
+from .manager import TrackerManager
 
 # A mapping of tracker types to corresponding tracker classes
 TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
@@ -43,12 +46,20 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
             break
     predictor.trackers = trackers
     predictor.vid_path = [None] * predictor.dataset.bs  # for determining when to reset tracker on new video
+    if getattr(predictor, "tracker_manager", None) is not None:
+        predictor.tracker_manager.close()
+    # Track multiple streams in parallel on worker threads
+    workers = min(len(trackers), os.cpu_count() or 1, 8)
+    predictor.tracker_manager = TrackerManager(trackers, workers) if len(trackers) > 1 else None
 
 
 def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None:
     """
     Postprocess detected boxes and update with object tracking.
 
+    Detections of the whole batch are copied to the host at once. With multiple streams the tracker updates run in
+    parallel on the worker threads of `predictor.tracker_manager`.
+
     Args:
         predictor (object): The predictor object containing the predictions.
         persist (bool, optional): Whether to persist the trackers if they already exist. Defaults to False.
@@ -57,26 +68,55 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
 
     is_obb = predictor.args.task == "obb"
     is_stream = predictor.dataset.mode == "stream"
+    manager = getattr(predictor, "tracker_manager", None)
+    dets = [predictor.results[i].obb if is_obb else predictor.results[i].boxes for i in range(len(im0s))]
+    data = np.split(torch.cat([d.data for d in dets]).cpu().numpy(), np.cumsum([len(d) for d in dets])[:-1])
+    dets = [type(d)(x, d.orig_shape) for d, x in zip(dets, data)]  # one device to host copy per batch
+
+    tracks = [None] * len(im0s)
     for i in range(len(im0s)):
-        tracker = predictor.trackers[i if is_stream else 0]
+        j = i if is_stream else 0
+        tracker = predictor.trackers[j]
         vid_path = predictor.save_dir / Path(path[i]).name
-        if not persist and predictor.vid_path[i if is_stream else 0] != vid_path:
-            tracker.reset()
-            predictor.vid_path[i if is_stream else 0] = vid_path
+        if not persist and predictor.vid_path[j] != vid_path:
+            if manager:
+                manager.reset(j)  # queued after the pending updates of the stream
+            else:
+                tracker.reset()
+            predictor.vid_path[j] = vid_path
+
+        if len(dets[i]) == 0:
+            continue
+        tracks[i] = manager.submit(j, dets[i], im0s[i]) if manager else tracker.update(dets[i], im0s[i])
 
-        det = (predictor.results[i].obb if is_obb else predictor.results[i].boxes).cpu().numpy()
-        if len(det) == 0:
+    for i in range(len(im0s)):
+        if tracks[i] is None:
             continue
-        tracks = tracker.update(det, im0s[i])
-        if len(tracks) == 0:
+        tracks[i] = tracks[i].result() if manager else tracks[i]
+        if len(tracks[i]) == 0:
             continue
-        idx = tracks[:, -1].astype(int)
+        idx = tracks[i][:, -1].astype(int)
         predictor.results[i] = predictor.results[i][idx]
 
-        update_args = {"obb" if is_obb else "boxes": torch.as_tensor(tracks[:, :-1])}
+        update_args = {"obb" if is_obb else "boxes": torch.as_tensor(tracks[i][:, :-1])}
         predictor.results[i].update(**update_args)
 
 
+def on_predict_end(predictor: object) -> None:
+    """
+    Log the stream latency of the tracker manager and the global motion compensation time per frame of the trackers.
+
+    Args:
+        predictor (object): The predictor object holding the trackers.
+    """
+    if predictor.args.verbose:
+        if getattr(predictor, "tracker_manager", None) is not None:
+            LOGGER.info(predictor.tracker_manager.summary())
+        for tracker in getattr(predictor, "trackers", ()):
+            if getattr(tracker, "gmc", None) is not None and tracker.gmc.frames:
+                LOGGER.info(tracker.gmc.summary())
+
+
 def register_tracker(model: object, persist: bool) -> None:
     """
     Register tracking callbacks to the model for object tracking during prediction.
@@ -87,3 +127,4 @@ def register_tracker(model: object, persist: bool) -> None:
     """
     model.add_callback("on_predict_start", partial(on_predict_start, persist=persist))
     model.add_callback("on_predict_postprocess_end", partial(on_predict_postprocess_end, persist=persist))
+    model.add_callback("on_predict_end", on_predict_end)
@@ -1,6 +1,7 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
 import copy
+import time
 
 import cv2
 import numpy as np
@@ -15,13 +16,27 @@ class GMC:
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
     SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
 
+    Sparse Optical Flow tracks the keypoints of the previous frame from frame to frame, keypoints are only re-detected
+    when fewer than `min_points` of them are still tracked. Motion estimation can be
+    skipped on frames that barely differ from the last frame it was estimated on, see `skip_thresh`.
+
     Attributes:
         method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
-        prevFrame (np.ndarray): Stores the previous frame for tracking.
+        min_points (float): Fraction of the detected Sparse Optical Flow keypoints that must still be tracked before
+            keypoints are re-detected.
+        skip_thresh (float): Mean absolute gray level difference to the reference frame below which motion estimation
+            is skipped, 0.0 to never skip.
+        prevFrame (np.ndarray): Stores the reference frame for tracking, the last frame motion was estimated on.
+        prevThumbnail (np.ndarray): Stores a small version of the reference frame to measure frame differences.
         prevKeyPoints (list): Stores the keypoints from the previous frame.
         prevDescriptors (np.ndarray): Stores the descriptors from the previous frame.
         initializedFirstFrame (bool): Flag to indicate if the first frame has been processed.
+        dt (float): Time of the last `apply` call in milliseconds.
+        t (float): Accumulated time of all `apply` calls in milliseconds.
+        frames (int): Number of processed frames.
+        skipped (int): Number of frames with skipped motion estimation.
+        detections (int): Number of Sparse Optical Flow keypoint detections.
 
     Methods:
         __init__(self, method='sparseOptFlow', downscale=2): Initializes a GMC object with the specified method
@@ -31,20 +46,30 @@ class GMC:
         applyEcc(self, raw_frame, detections=None): Applies the ECC algorithm to a raw frame.
         applyFeatures(self, raw_frame, detections=None): Applies feature-based methods like ORB or SIFT to a raw frame.
         applySparseOptFlow(self, raw_frame, detections=None): Applies the Sparse Optical Flow method to a raw frame.
+        detectKeyPoints(self, frame): Detects Sparse Optical Flow keypoints in a grayscale frame.
+        summary(self): Returns a string with the average time per frame and skipped frames.
     """
 
-    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2) -> None:
+    def __init__(
+        self, method: str = "sparseOptFlow", downscale: int = 2, min_points: float = 0.5, skip_thresh: float = 0.0
+    ) -> None:
         """
         Initialize a video tracker with specified parameters.
 
         Args:
             method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
             downscale (int): Downscale factor for processing frames.
+            min_points (float): Re-detect Sparse Optical Flow keypoints when fewer than this fraction of them are still
+                tracked, 1.0 to detect them on every frame.
+            skip_thresh (float): Skip motion estimation on frames whose mean absolute gray level difference to the
+                last frame motion was estimated on is below this value, 0.0 to never skip.
         """
         super().__init__()
 
         self.method = method
         self.downscale = max(1, downscale)
+        self.min_points = min_points
+        self.skip_thresh = skip_thresh
 
         if self.method == "orb":
             self.detector = cv2.FastFeatureDetector_create(20)
@@ -73,9 +98,13 @@ class GMC:
             raise ValueError(f"Error: Unknown GMC method:{method}")
 
         self.prevFrame = None
+        self.prevThumbnail = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.numKeyPoints = 0
         self.initializedFirstFrame = False
+        self.dt = self.t = 0.0
+        self.frames = self.skipped = self.detections = 0
 
     def apply(self, raw_frame: np.array, detections: list = None) -> np.array:
         """
@@ -94,14 +123,19 @@ class GMC:
             array([[1, 2, 3],
                    [4, 5, 6]])
         """
+        t0 = time.perf_counter()
         if self.method in {"orb", "sift"}:
-            return self.applyFeatures(raw_frame, detections)
+            H = self.applyFeatures(raw_frame, detections)
         elif self.method == "ecc":
-            return self.applyEcc(raw_frame)
+            H = self.applyEcc(raw_frame)
         elif self.method == "sparseOptFlow":
-            return self.applySparseOptFlow(raw_frame)
+            H = self.applySparseOptFlow(raw_frame)
         else:
-            return np.eye(2, 3)
+            H = np.eye(2, 3)
+        self.dt = (time.perf_counter() - t0) * 1e3
+        self.t += self.dt
+        self.frames += 1
+        return H
 
     def applyEcc(self, raw_frame: np.array) -> np.array:
         """
@@ -314,50 +348,76 @@ class GMC:
         # Downscale image
         if self.downscale > 1.0:
             frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
-
-        # Find the keypoints
-        keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+        thumbnail = cv2.resize(frame, (max(frame.shape[1] // 8, 1), max(frame.shape[0] // 8, 1)), cv2.INTER_AREA)
 
         # Handle first frame
         if not self.initializedFirstFrame or self.prevKeyPoints is None:
-            self.prevFrame = frame.copy()
-            self.prevKeyPoints = copy.copy(keypoints)
+            self.prevFrame, self.prevThumbnail = frame, thumbnail
+            self.prevKeyPoints = self.detectKeyPoints(frame)
             self.initializedFirstFrame = True
             return H
 
+        # Skip motion estimation on frames with low motion, the reference frame and keypoints are kept so motion
+        # accumulates until it crosses the threshold and is then estimated from the reference frame in one step
+        if self.skip_thresh and cv2.absdiff(thumbnail, self.prevThumbnail).mean() < self.skip_thresh:
+            self.skipped += 1
+            return H
+
         # Find correspondences
         matchedKeypoints, status, _ = cv2.calcOpticalFlowPyrLK(self.prevFrame, frame, self.prevKeyPoints, None)
 
         # Leave good correspondences only
-        prevPoints = []
-        currPoints = []
-
-        for i in range(len(status)):
-            if status[i]:
-                prevPoints.append(self.prevKeyPoints[i])
-                currPoints.append(matchedKeypoints[i])
-
-        prevPoints = np.array(prevPoints)
-        currPoints = np.array(currPoints)
+        status = status.ravel().astype(bool)
+        prevPoints = self.prevKeyPoints[status]
+        currPoints = matchedKeypoints[status]
 
         # Find rigid matrix
-        if (prevPoints.shape[0] > 4) and (prevPoints.shape[0] == prevPoints.shape[0]):
+        if prevPoints.shape[0] > 4:
             H, _ = cv2.estimateAffinePartial2D(prevPoints, currPoints, cv2.RANSAC)
-
-            if self.downscale > 1.0:
+            if H is None:
+                H = np.eye(2, 3)
+            elif self.downscale > 1.0:
                 H[0, 2] *= self.downscale
                 H[1, 2] *= self.downscale
         else:
             LOGGER.warning("WARNING: not enough matching points")
 
-        self.prevFrame = frame.copy()
-        self.prevKeyPoints = copy.copy(keypoints)
+        # Keep tracking the keypoints, re-detect them when too many were lost
+        self.prevFrame, self.prevThumbnail = frame, thumbnail
+        if len(currPoints) < self.min_points * self.numKeyPoints or len(currPoints) <= 4:
+            self.prevKeyPoints = self.detectKeyPoints(frame)
+        else:
+            self.prevKeyPoints = currPoints
 
         return H
 
+    def detectKeyPoints(self, frame: np.array) -> np.array:
+        """
+        Detect Sparse Optical Flow keypoints in a grayscale frame.
+
+        Args:
+            frame (np.ndarray): The downscaled grayscale frame.
+
+        Returns:
+            (np.ndarray): Keypoints (N, 1, 2), or None if no keypoints were found.
+        """
+        keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+        self.numKeyPoints = 0 if keypoints is None else len(keypoints)
+        self.detections += 1
+        return keypoints
+
+    def summary(self) -> str:
+        """Return a string with the average time per frame, skipped frames and keypoint detections."""
+        s = f"GMC {self.method}: {self.t / max(self.frames, 1):.1f}ms per frame"
+        if self.method == "sparseOptFlow":
+            s += f", {self.skipped}/{self.frames} frames skipped, keypoints detected on {self.detections} frames"
+        return s
+
     def reset_params(self) -> None:
         """Reset parameters."""
         self.prevFrame = None
+        self.prevThumbnail = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
+        self.numKeyPoints = 0
         self.initializedFirstFrame = False
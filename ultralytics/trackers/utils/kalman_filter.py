@@ -1,8 +1,12 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
+import time
+
 import numpy as np
 import scipy.linalg
 
+from ultralytics.utils import LOGGER
+
 
 class KalmanFilterXYAH:
     """
@@ -148,6 +152,29 @@ class KalmanFilterXYAH:
 
         return mean, covariance
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+        """
+        std = [
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 3],
+            1e-1 * np.ones_like(mean[:, 3]),
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, axis=1))[:, :, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray) -> tuple:
         """
         Run Kalman filter correction step.
@@ -173,6 +200,35 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray) -> tuple:
+        """
+        Run Kalman filter correction step (Vectorized version).
+
+        The Cholesky factors of all projected covariances are computed and solved in single batched operations instead
+        of one `scipy.linalg.cho_factor` and `cho_solve` per track.
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the predicted states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the predicted states.
+            measurement (ndarray): The Nx4 dimensional measurement matrix in the measurement space of the filter.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the measurement-corrected state distributions.
+        """
+        if len(mean) == 0:
+            return mean, covariance
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        chol_factor = np.linalg.cholesky(projected_cov)  # lower triangular, projected_cov = L @ L.T
+        b = (covariance @ self._update_mat.T).transpose(0, 2, 1)
+        kalman_gain = np.linalg.solve(chol_factor.transpose(0, 2, 1), np.linalg.solve(chol_factor, b))
+        kalman_gain = kalman_gain.transpose(0, 2, 1)
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum("nij,nj->ni", kalman_gain, innovation)
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose(0, 2, 1)
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -344,6 +400,29 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
 
         return mean, covariance
 
+    def multi_project(self, mean, covariance) -> tuple:
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+        """
+        std = [
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, axis=1))[:, :, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def update(self, mean, covariance, measurement) -> tuple:
         """
         Run Kalman filter correction step.
@@ -358,3 +437,39 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
             (tuple[ndarray, ndarray]): Returns the measurement-corrected state distribution.
         """
         return super().update(mean, covariance, measurement)
+
+
+def profile_kalman(n=(100, 1000), steps=20, seed=0):
+    """
+    Kalman filter correction step profiler, comparing the per-track `update` loop with the batched `multi_update`.
+
+    Example:
+        ```python
+        from ultralytics.trackers.utils.kalman_filter import profile_kalman
+
+        profile_kalman(n=(100, 1000))
+        ```
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+    LOGGER.info(f"{'Kalman filter':>16s}{'tracks':>10s}{'loop (ms)':>12s}{'batched (ms)':>14s}")
+    for kf in KalmanFilterXYAH(), KalmanFilterXYWH():
+        for k in n:
+            xyah = np.c_[rng.uniform(0, 640, (k, 2)), rng.uniform(0.5, 2, k), rng.uniform(10, 100, k)]
+            if isinstance(kf, KalmanFilterXYWH):
+                xyah[:, 2] *= xyah[:, 3]  # aspect ratio to width
+            mean, cov = map(np.asarray, zip(*[kf.initiate(x) for x in xyah]))
+            mean, cov = kf.multi_predict(mean, cov)
+            measurement = kf.multi_project(mean, cov)[0] + rng.normal(0, 1, (k, 4))
+
+            t = [time.perf_counter()]
+            for _ in range(steps):
+                [kf.update(m, c, z) for m, c, z in zip(mean, cov, measurement)]
+            t.append(time.perf_counter())
+            for _ in range(steps):
+                kf.multi_update(mean, cov, measurement)
+            t.append(time.perf_counter())
+            loop, batched = np.diff(t) * 1000 / steps
+            results[(type(kf).__name__, k)] = loop, batched
+            LOGGER.info(f"{type(kf).__name__:>16s}{k:10}{loop:12.4g}{batched:14.4g}")
+    return results
@@ -2,6 +2,8 @@
 
 import numpy as np
 import scipy
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
@@ -17,7 +19,7 @@ except (ImportError, AssertionError, AttributeError):
     import lap
 
 
-def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True) -> tuple:
+def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = True, gated: bool = True) -> tuple:
     """
     Perform linear assignment using scipy or lap.lapjv.
 
@@ -25,6 +27,8 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
         cost_matrix (np.ndarray): The matrix containing cost values for assignments.
         thresh (float): Threshold for considering an assignment valid.
         use_lap (bool, optional): Whether to use lap.lapjv. Defaults to True.
+        gated (bool, optional): Whether to split large lap.lapjv problems into independent components of the pairs
+            within 'thresh', see `gated_lapjv`. Defaults to True.
 
     Returns:
         Tuple with:
@@ -39,7 +43,10 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     if use_lap:
         # Use lap.lapjv
         # https://github.com/gatagat/lap
-        _, x, y = lap.lapjv(cost_matrix, extend_cost=True, cost_limit=thresh)
+        if gated and cost_matrix.size >= 4096:
+            x, y = gated_lapjv(cost_matrix, thresh)
+        else:
+            _, x, y = lap.lapjv(cost_matrix, extend_cost=True, cost_limit=thresh)
         matches = [[ix, mx] for ix, mx in enumerate(x) if mx >= 0]
         unmatched_a = np.where(x < 0)[0]
         unmatched_b = np.where(y < 0)[0]
@@ -58,19 +65,59 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
+def gated_lapjv(cost_matrix: np.ndarray, thresh: float) -> tuple:
+    """
+    Solve a thresholded linear assignment as independent lap.lapjv problems over the connected components of the pairs
+    with cost <= 'thresh'.
+
+    A pair with cost above 'thresh' is never assigned by lap.lapjv with `cost_limit=thresh`, as leaving both unassigned
+    is cheaper, so components connected only by such pairs are independent and the combined result equals the dense
+    solution. Components of a single pair are assigned directly.
+
+    Args:
+        cost_matrix (np.ndarray): The matrix containing cost values for assignments.
+        thresh (float): Threshold for considering an assignment valid.
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray]): Assigned column of each row and assigned row of each column, -1 if unassigned.
+    """
+    na, nb = cost_matrix.shape
+    x, y = np.full(na, -1, dtype=int), np.full(nb, -1, dtype=int)
+    i, j = np.nonzero(cost_matrix <= thresh)
+    if len(i) == 0:
+        return x, y
+    graph = coo_matrix((np.ones(len(i), dtype=bool), (i, na + j)), shape=(na + nb, na + nb))
+    _, labels = connected_components(graph, directed=False)
+    comp = labels[i]  # component of each pair
+
+    # Components of a single pair
+    single = np.bincount(comp, minlength=na + nb)[comp] == 1
+    x[i[single]], y[j[single]] = j[single], i[single]
+
+    # Larger components, grouped by sorting their pairs
+    order = np.argsort(comp[~single], kind="stable")
+    ci, cj, cc = i[~single][order], j[~single][order], comp[~single][order]
+    for k in np.split(np.arange(len(cc)), np.flatnonzero(np.diff(cc)) + 1) if len(cc) else ():
+        rows, cols = np.unique(ci[k]), np.unique(cj[k])
+        _, xk, yk = lap.lapjv(cost_matrix[np.ix_(rows, cols)], extend_cost=True, cost_limit=thresh)
+        x[rows[xk >= 0]] = cols[xk[xk >= 0]]
+        y[cols[yk >= 0]] = rows[yk[yk >= 0]]
+    return x, y
+
+
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     """
     Compute cost based on Intersection over Union (IoU) between tracks.
 
     Args:
-        atracks (list[STrack] | list[np.ndarray]): List of tracks 'a' or bounding boxes.
-        btracks (list[STrack] | list[np.ndarray]): List of tracks 'b' or bounding boxes.
+        atracks (list[STrack] | np.ndarray): List of tracks 'a' or bounding boxes.
+        btracks (list[STrack] | np.ndarray): List of tracks 'b' or bounding boxes.
 
     Returns:
         (np.ndarray): Cost matrix computed based on IoU.
     """
 
-    if atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
+    if len(atracks) and isinstance(atracks[0], np.ndarray) or len(btracks) and isinstance(btracks[0], np.ndarray):
         atlbrs = atracks
         btlbrs = btracks
     else:
@@ -84,6 +131,11 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
                 np.ascontiguousarray(atlbrs, dtype=np.float32),
                 np.ascontiguousarray(btlbrs, dtype=np.float32),
             ).numpy()
+        elif len(atlbrs) * len(btlbrs) >= 4096:
+            ious = sparse_iou(
+                np.ascontiguousarray(atlbrs, dtype=np.float32),
+                np.ascontiguousarray(btlbrs, dtype=np.float32),
+            )
         else:
             ious = bbox_ioa(
                 np.ascontiguousarray(atlbrs, dtype=np.float32),
@@ -93,13 +145,65 @@ def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     return 1 - ious  # cost matrix
 
 
+def overlap_pairs(box1: np.ndarray, box2: np.ndarray) -> tuple:
+    """
+    Find all pairs of overlapping boxes with a sorted-interval sweep along x instead of testing every pair.
+
+    Args:
+        box1 (np.ndarray): Boxes (n, 4) in x1y1x2y2 format.
+        box2 (np.ndarray): Boxes (m, 4) in x1y1x2y2 format.
+
+    Returns:
+        (tuple[np.ndarray, np.ndarray]): Indices into 'box1' and 'box2' of the pairs with a positive intersection area.
+    """
+    b1, b2 = box1.astype(np.float64), box2.astype(np.float64)
+    order = np.argsort(b2[:, 0], kind="stable")
+    x1 = b2[order, 0]
+    max_w = max((b2[:, 2] - b2[:, 0]).max(), 0)
+    # x intervals overlap if b2.x1 < b1.x2 and b2.x2 > b1.x1, where b2.x2 <= b2.x1 + max_w
+    lo = np.searchsorted(x1, b1[:, 0] - max_w, side="left")
+    n = np.maximum(np.searchsorted(x1, b1[:, 2], side="left") - lo, 0)
+    i = np.repeat(np.arange(len(b1)), n)
+    j = order[np.arange(n.sum()) - np.repeat(np.cumsum(n) - n - lo, n)]
+    k = (np.minimum(box1[i, 2], box2[j, 2]) > np.maximum(box1[i, 0], box2[j, 0])) & (
+        np.minimum(box1[i, 3], box2[j, 3]) > np.maximum(box1[i, 1], box2[j, 1])
+    )
+    return i[k], j[k]
+
+
+def sparse_iou(box1: np.ndarray, box2: np.ndarray, eps: float = 1e-7) -> np.ndarray:
+    """
+    Calculate the IoU matrix of two sets of boxes, computing only pairs found by `overlap_pairs` as all others are 0.
+
+    The values equal `bbox_ioa(box1, box2, iou=True)`, crowded scenes with few overlaps per box avoid the dense pairwise
+    computation.
+
+    Args:
+        box1 (np.ndarray): Boxes (n, 4) in x1y1x2y2 format.
+        box2 (np.ndarray): Boxes (m, 4) in x1y1x2y2 format.
+        eps (float, optional): A small value to avoid division by zero. Defaults to 1e-7.
+
+    Returns:
+        (np.ndarray): IoU matrix (n, m).
+    """
+    i, j = overlap_pairs(box1, box2)
+    a, b = box1[i], box2[j]
+    inter_area = (np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])).clip(0) * (
+        np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    ).clip(0)
+    area = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1]) + (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1]) - inter_area
+    ious = np.zeros((len(box1), len(box2)), dtype=np.result_type(box1, box2))
+    ious[i, j] = inter_area / (area + eps)
+    return ious
+
+
 def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -> np.ndarray:
     """
     Compute distance between tracks and detections based on embeddings.
 
     Args:
-        tracks (list[STrack]): List of tracks.
-        detections (list[BaseTrack]): List of detections.
+        tracks (list[STrack] | np.ndarray): List of tracks or their smoothed features.
+        detections (list[BaseTrack] | np.ndarray): List of detections or their features.
         metric (str, optional): Metric for distance computation. Defaults to 'cosine'.
 
     Returns:
@@ -109,12 +213,20 @@ def embedding_distance(tracks: list, detections: list, metric: str = "cosine") -
     cost_matrix = np.zeros((len(tracks), len(detections)), dtype=np.float32)
     if cost_matrix.size == 0:
         return cost_matrix
-    det_features = np.asarray([track.curr_feat for track in detections], dtype=np.float32)
-    # for i, track in enumerate(tracks):
-    # cost_matrix[i, :] = np.maximum(0.0, cdist(track.smooth_feat.reshape(1,-1), det_features, metric))
-    track_features = np.asarray([track.smooth_feat for track in tracks], dtype=np.float32)
-    cost_matrix = np.maximum(0.0, cdist(track_features, det_features, metric))  # Normalized features
-    return cost_matrix
+    if isinstance(detections, np.ndarray):
+        det_features = np.array(detections, dtype=np.float32)
+    else:
+        det_features = np.asarray([track.curr_feat for track in detections], dtype=np.float32)
+    if isinstance(tracks, np.ndarray):
+        track_features = np.array(tracks, dtype=np.float32)
+    else:
+        track_features = np.asarray([track.smooth_feat for track in tracks], dtype=np.float32)
+    if metric != "cosine":
+        return np.maximum(0.0, cdist(track_features, det_features, metric))
+    # Cosine distance as one matrix product, zero features (not extracted) have distance 1 to everything
+    track_features /= np.maximum(np.linalg.norm(track_features, axis=1, keepdims=True), 1e-12)
+    det_features /= np.maximum(np.linalg.norm(det_features, axis=1, keepdims=True), 1e-12)
+    return np.maximum(0.0, 1.0 - track_features @ det_features.T)
 
 
 def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
@@ -123,7 +235,7 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
 
     Args:
         cost_matrix (np.ndarray): The matrix containing cost values for assignments.
-        detections (list[BaseTrack]): List of detections with scores.
+        detections (list[BaseTrack] | np.ndarray): List of detections with scores, or the scores.
 
     Returns:
         (np.ndarray): Fused similarity matrix.
@@ -132,7 +244,6 @@ def fuse_score(cost_matrix: np.ndarray, detections: list) -> np.ndarray:
     if cost_matrix.size == 0:
         return cost_matrix
     iou_sim = 1 - cost_matrix
-    det_scores = np.array([det.score for det in detections])
-    det_scores = np.expand_dims(det_scores, axis=0).repeat(cost_matrix.shape[0], axis=0)
-    fuse_sim = iou_sim * det_scores
+    det_scores = detections if isinstance(detections, np.ndarray) else np.array([det.score for det in detections])
+    fuse_sim = iou_sim * det_scores[None]
     return 1 - fuse_sim  # fuse_cost
@@ -0,0 +1,236 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+"""
+COCO bounding box evaluation in NumPy, reproducing the numbers of pycocotools COCOeval without the dependency.
+
+Usage:
+    from ultralytics.utils.cocoeval import COCOEvaluator
+
+    evaluator = COCOEvaluator("instances_val2017.json")
+    stats = evaluator.evaluate(predictions)  # list of {"image_id", "category_id", "bbox", "score"} dicts
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from ultralytics.utils import LOGGER, NUM_THREADS
+
+IOU_THRESHOLDS = np.linspace(0.5, 0.95, 10)
+RECALL_THRESHOLDS = np.linspace(0.0, 1.00, 101)
+AREA_RANGES = {"all": (0, 1e5**2), "small": (0, 32**2), "medium": (32**2, 96**2), "large": (96**2, 1e5**2)}
+MAX_DETS = (1, 10, 100)
+
+
+def bbox_iou_xywh(dt, gt, iscrowd):
+    """
+    Calculate the IoU of detections and ground truth boxes in (x, y, w, h) format as pycocotools does.
+
+    Args:
+        dt (np.ndarray): Detection boxes of shape (N, 4).
+        gt (np.ndarray): Ground truth boxes of shape (M, 4).
+        iscrowd (np.ndarray): Crowd flags of shape (M,), the IoU with a crowd box is intersection over detection area.
+
+    Returns:
+        (np.ndarray): An NxM array of IoU values.
+    """
+    lt = np.maximum(dt[:, None, :2], gt[None, :, :2])
+    rb = np.minimum(dt[:, None, :2] + dt[:, None, 2:], gt[None, :, :2] + gt[None, :, 2:])
+    inter = (rb - lt).clip(0).prod(2)
+    dt_area, gt_area = dt[:, 2:].prod(1)[:, None], gt[:, 2:].prod(1)[None]
+    union = np.where(iscrowd[None], dt_area, dt_area + gt_area - inter)
+    return np.divide(inter, union, out=np.zeros_like(inter), where=inter > 0)
+
+
+def evaluate_image(gt, gt_area, gt_crowd, dt, dt_score, max_det=MAX_DETS[-1]):
+    """
+    Match the detections of one image and category to its ground truths for every IoU threshold and area range.
+
+    Detections are matched greedily in score order, each to the unmatched ground truth of highest IoU, preferring
+    ground truths that are not ignored (crowd or outside the area range), exactly like COCOeval.evaluateImg().
+
+    Args:
+        gt (np.ndarray): Ground truth boxes of shape (M, 4) in xywh.
+        gt_area (np.ndarray): Ground truth annotation areas of shape (M,).
+        gt_crowd (np.ndarray): Ground truth crowd flags of shape (M,).
+        dt (np.ndarray): Detection boxes of shape (N, 4) in xywh.
+        dt_score (np.ndarray): Detection scores of shape (N,).
+        max_det (int): Maximum number of detections evaluated per image.
+
+    Returns:
+        (tuple): Scores (n,) of the kept detections in descending order, and for each area range the matched (T, n)
+            and ignored (T, n) detection flags and the ignored (M,) ground truth flags.
+    """
+    order = np.argsort(-dt_score, kind="mergesort")[:max_det]
+    dt, dt_score = dt[order], dt_score[order]
+    dt_area = dt[:, 2:].prod(1)
+    thresholds = np.minimum(IOU_THRESHOLDS, 1 - 1e-10)[:, None]
+    nt, nd = len(thresholds), len(dt)
+    iou = bbox_iou_xywh(dt, gt, gt_crowd)
+    candidates = np.nonzero((iou >= thresholds[0]).any(1))[0]  # detections that can match at any threshold
+    results, matches = [], {}
+    for lo, hi in AREA_RANGES.values():
+        gt_ignore = gt_crowd | (gt_area < lo) | (gt_area > hi)
+        g = np.argsort(gt_ignore, kind="mergesort")  # ignored ground truths last
+        ignore, key = gt_ignore[g], gt_ignore.tobytes()
+        if key not in matches:  # area ranges that ignore the same ground truths share the matching
+            dt_match, dt_ignore = np.zeros((nt, nd), dtype=bool), np.zeros((nt, nd), dtype=bool)
+            gt_match, crowd, iou_g = np.zeros((nt, len(g)), dtype=bool), gt_crowd[g], iou[:, g]
+            for d in candidates:
+                valid = (~gt_match | crowd) & (iou_g[d] >= thresholds)  # TxM
+                m = np.full(nt, -1)
+                for c in valid & ~ignore, valid & ignore:  # ignored ground truths only if no other matches
+                    best = len(g) - 1 - np.where(c, iou_g[d], -1.0)[:, ::-1].argmax(1)  # last of equal IoUs
+                    m = np.where((m < 0) & c.any(1), best, m)
+                t = np.nonzero(m >= 0)[0]
+                dt_match[t, d], dt_ignore[t, d] = True, ignore[m[t]]
+                gt_match[t, m[t]] = True
+            matches[key] = dt_match, dt_ignore
+        dt_match, dt_ignore = matches[key]
+        dt_ignore = dt_ignore | (~dt_match & ((dt_area < lo) | (dt_area > hi)))  # unmatched and outside the range
+        results.append((dt_match, dt_ignore, ignore))
+    return dt_score, results
+
+
+def _evaluate_images(args):
+    """Evaluate a chunk of (image, category) pairs, for process pool workers."""
+    return [evaluate_image(*x) for x in args]
+
+
+class COCOEvaluator:
+    """
+    COCO bounding box evaluator implemented with vectorized NumPy, matching pycocotools COCOeval for iouType 'bbox'.
+
+    Predictions are consumed from memory, (image, category) pairs are evaluated in parallel in a process pool and the
+    results are accumulated into the 12 standard COCO summary metrics.
+
+    Attributes:
+        img_ids (list): Sorted ids of the evaluated images.
+        cat_ids (list): Sorted ids of all annotated categories.
+        gts (dict): Ground truth boxes, areas and crowd flags per (image id, category id).
+        precision (np.ndarray): Precision of shape (T, R, K, A, M) after evaluate(), -1 where there is no ground truth.
+        recall (np.ndarray): Recall of shape (T, K, A, M) after evaluate(), -1 where there is no ground truth.
+        stats (np.ndarray): The 12 summary metrics after evaluate().
+    """
+
+    def __init__(self, anno, img_ids=None):
+        """
+        Initialize the evaluator with COCO ground truth annotations.
+
+        Args:
+            anno (str | Path | dict): Path to a COCO instances JSON file, or its loaded contents.
+            img_ids (list, optional): Ids of the images to evaluate. Defaults to all annotated images.
+        """
+        if isinstance(anno, (str, Path)):
+            with open(anno) as f:
+                anno = json.load(f)
+        self.img_ids = sorted(set(img_ids if img_ids is not None else (x["id"] for x in anno["images"])))
+        self.cat_ids = sorted(x["id"] for x in anno["categories"])
+        images, cats = set(self.img_ids), set(self.cat_ids)
+        gts = {}
+        for a in anno["annotations"]:
+            if a["image_id"] in images and a["category_id"] in cats:
+                gts.setdefault((a["image_id"], a["category_id"]), []).append(
+                    (*a["bbox"], a["area"], bool(a.get("iscrowd", 0)))
+                )
+        self.gts = {k: np.array(v, dtype=np.float64).reshape(-1, 6) for k, v in gts.items()}
+        self.precision = self.recall = self.stats = None
+
+    def evaluate(self, predictions, workers=NUM_THREADS):
+        """
+        Evaluate predictions and return the 12 COCO summary metrics.
+
+        Args:
+            predictions (list): Predictions as {"image_id", "category_id", "bbox" (xywh), "score"} dicts, i.e. the
+                jdict of DetectionValidator.
+            workers (int): Number of worker processes, 0 or 1 to evaluate in the calling process.
+
+        Returns:
+            (np.ndarray): AP@[.5:.95], AP@.5, AP@.75, AP small, medium and large, AR@1, AR@10, AR@100 and AR small,
+                medium and large, as the stats of pycocotools COCOeval.summarize().
+        """
+        dts = {}
+        for p in predictions:
+            dts.setdefault((p["image_id"], p["category_id"]), []).append((*p["bbox"], p["score"]))
+        img_index, cats = {x: i for i, x in enumerate(self.img_ids)}, set(self.cat_ids)
+        keys = (k for k in self.gts.keys() | dts.keys() if k[0] in img_index and k[1] in cats)
+        keys = sorted(keys, key=lambda k: (k[1], img_index[k[0]]))  # by category, then image
+        empty = np.zeros((0, 6))
+        tasks = []
+        for k in keys:
+            gt, dt = self.gts.get(k, empty), np.array(dts.get(k, []), dtype=np.float64).reshape(-1, 5)
+            tasks.append((gt[:, :4], gt[:, 4], gt[:, 5].astype(bool), dt[:, :4], dt[:, 4]))
+
+        chunks = [tasks[i : i + 64] for i in range(0, len(tasks), 64)]
+        if workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+                results = [r for chunk in pool.map(_evaluate_images, chunks) for r in chunk]
+        else:
+            results = _evaluate_images(tasks)
+        self.accumulate(keys, results)
+        self.stats = self.summarize()
+        return self.stats
+
+    def accumulate(self, keys, results):
+        """Accumulate per-image results into precision and recall per IoU threshold, category, area and max dets."""
+        nt, nr, nk, na, nm = len(IOU_THRESHOLDS), len(RECALL_THRESHOLDS), len(self.cat_ids), len(AREA_RANGES), 3
+        self.precision, self.recall = -np.ones((nt, nr, nk, na, nm)), -np.ones((nt, nk, na, nm))
+        by_cat = {}
+        for (_, c), r in zip(keys, results):
+            by_cat.setdefault(c, []).append(r)
+        for k, c in enumerate(self.cat_ids):
+            rs = by_cat.get(c, [])
+            for a in range(na):
+                gt_ignore = np.concatenate([r[1][a][2] for r in rs]) if rs else np.zeros(0, dtype=bool)
+                npig = np.count_nonzero(~gt_ignore)
+                if npig == 0:
+                    continue
+                for mi, max_det in enumerate(MAX_DETS):
+                    scores = np.concatenate([r[0][:max_det] for r in rs])
+                    i = np.argsort(-scores, kind="mergesort")
+                    match = np.concatenate([r[1][a][0][:, :max_det] for r in rs], 1)[:, i]
+                    ignore = np.concatenate([r[1][a][1][:, :max_det] for r in rs], 1)[:, i]
+                    tp = np.cumsum(match & ~ignore, 1, dtype=np.float64)
+                    fp = np.cumsum(~match & ~ignore, 1, dtype=np.float64)
+                    self.recall[:, k, a, mi] = self.precision[:, :, k, a, mi] = 0
+                    if tp.shape[1] == 0:
+                        continue
+                    recall = tp / npig
+                    precision = tp / (fp + tp + np.spacing(1))
+                    precision = np.maximum.accumulate(precision[:, ::-1], 1)[:, ::-1]  # precision envelope
+                    self.recall[:, k, a, mi] = recall[:, -1]
+                    for t in range(nt):
+                        j = np.searchsorted(recall[t], RECALL_THRESHOLDS, side="left")
+                        valid = j < len(recall[t])
+                        self.precision[t, : valid.sum(), k, a, mi] = precision[t, j[valid]]
+
+    def summarize(self, verbose=True):
+        """Compute and optionally log the 12 COCO summary metrics in the format of pycocotools."""
+        areas = list(AREA_RANGES)
+        stats = []
+        for ap, iou, area, max_det in (
+            (1, None, "all", 100),
+            (1, 0.5, "all", 100),
+            (1, 0.75, "all", 100),
+            (1, None, "small", 100),
+            (1, None, "medium", 100),
+            (1, None, "large", 100),
+            (0, None, "all", 1),
+            (0, None, "all", 10),
+            (0, None, "all", 100),
+            (0, None, "small", 100),
+            (0, None, "medium", 100),
+            (0, None, "large", 100),
+        ):
+            a, m = areas.index(area), MAX_DETS.index(max_det)
+            s = self.precision[..., a, m] if ap else self.recall[..., a, m]
+            if iou is not None:
+                s = s[np.where(np.isclose(IOU_THRESHOLDS, iou))[0]]
+            stats.append(np.mean(s[s > -1]) if (s > -1).any() else -1.0)
+            if verbose:
+                name, short = ("Average Precision", "(AP)") if ap else ("Average Recall", "(AR)")
+                thr = f"{IOU_THRESHOLDS[0]:0.2f}:{IOU_THRESHOLDS[-1]:0.2f}" if iou is None else f"{iou:0.2f}"
+                desc = f"@[ IoU={thr:<9} | area={area:>6s} | maxDets={max_det:>3d} ]"
+                LOGGER.info(f" {name:<18} {short} {desc} = {stats[-1]:0.3f}")
+        return np.array(stats)
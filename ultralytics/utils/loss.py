@@ -175,6 +175,14 @@ class v8DetectionLoss:
         self.assigner = TaskAlignedAssigner(topk=tal_topk, num_classes=self.nc, alpha=0.5, beta=6.0)
         self.bbox_loss = BboxLoss(m.reg_max).to(device)
         self.proj = torch.arange(m.reg_max, dtype=torch.float, device=device)
+        self.anchor_cache = {}  # anchors per feature map shapes, reused when training alternates image sizes
+
+    def anchors(self, feats):
+        """Return anchor points and stride tensor for the feature maps 'feats', cached per resolution and dtype."""
+        key = (tuple(x.shape[2:] for x in feats), feats[0].dtype, feats[0].device)
+        if key not in self.anchor_cache:
+            self.anchor_cache[key] = make_anchors(feats, self.stride, 0.5)
+        return self.anchor_cache[key]
 
     def preprocess(self, targets, batch_size, scale_tensor):
         """Preprocesses the target counts and matches with the input batch size to output a tensor."""
@@ -217,7 +225,7 @@ class v8DetectionLoss:
         dtype = pred_scores.dtype
         batch_size = pred_scores.shape[0]
         imgsz = torch.tensor(feats[0].shape[2:], device=self.device, dtype=dtype) * self.stride[0]  # image size (h,w)
-        anchor_points, stride_tensor = make_anchors(feats, self.stride, 0.5)
+        anchor_points, stride_tensor = self.anchors(feats)
 
         # Targets
         targets = torch.cat((batch["batch_idx"].view(-1, 1), batch["cls"].view(-1, 1), batch["bboxes"]), 1)
@@ -425,7 +433,7 @@ class v8SegmentationLoss(v8DetectionLoss):
 
         dtype = pred_scores.dtype
         imgsz = torch.tensor(feats[0].shape[2:], device=self.device, dtype=dtype) * self.stride[0]  # image size (h,w)
-        anchor_points, stride_tensor = make_anchors(feats, self.stride, 0.5)
+        anchor_points, stride_tensor = self.anchors(feats)
 
         # Targets
         try:
@@ -612,7 +620,7 @@ class v8PoseLoss(v8DetectionLoss):
 
         dtype = pred_scores.dtype
         imgsz = torch.tensor(feats[0].shape[2:], device=self.device, dtype=dtype) * self.stride[0]  # image size (h,w)
-        anchor_points, stride_tensor = make_anchors(feats, self.stride, 0.5)
+        anchor_points, stride_tensor = self.anchors(feats)
 
         # Targets
         batch_size = pred_scores.shape[0]
@@ -795,7 +803,7 @@ class v8OBBLoss(v8DetectionLoss):
 
         dtype = pred_scores.dtype
         imgsz = torch.tensor(feats[0].shape[2:], device=self.device, dtype=dtype) * self.stride[0]  # image size (h,w)
-        anchor_points, stride_tensor = make_anchors(feats, self.stride, 0.5)
+        anchor_points, stride_tensor = self.anchors(feats)
 
         # targets
         try:
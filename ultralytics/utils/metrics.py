@@ -15,6 +15,7 @@ OKS_SIGMA = (
     np.array([0.26, 0.25, 0.25, 0.35, 0.35, 0.79, 0.79, 0.72, 0.72, 0.62, 0.62, 1.07, 1.07, 0.87, 0.87, 0.89, 0.89])
     / 10.0
 )
+trapezoid = np.trapezoid if hasattr(np, "trapezoid") else np.trapz  # np.trapz was removed in NumPy 2.4
 
 
 def bbox_ioa(box1, box2, iou=False, eps=1e-7):
@@ -56,21 +57,21 @@ def box_iou(box1, box2, eps=1e-7):
     Based on https://github.com/pytorch/vision/blob/master/torchvision/ops/boxes.py
 
     Args:
-        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes.
-        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes.
+        box1 (torch.Tensor): A tensor of shape (N, 4) representing N bounding boxes, or (B, N, 4) for a batch.
+        box2 (torch.Tensor): A tensor of shape (M, 4) representing M bounding boxes, or (B, M, 4) for a batch.
         eps (float, optional): A small value to avoid division by zero. Defaults to 1e-7.
 
     Returns:
-        (torch.Tensor): An NxM tensor containing the pairwise IoU values for every element in box1 and box2.
+        (torch.Tensor): An NxM (or BxNxM) tensor containing the pairwise IoU values for every element in box1 and box2.
     """
 
     # NOTE: Need .float() to get accurate iou values
     # inter(N,M) = (rb(N,M,2) - lt(N,M,2)).clamp(0).prod(2)
-    (a1, a2), (b1, b2) = box1.float().unsqueeze(1).chunk(2, 2), box2.float().unsqueeze(0).chunk(2, 2)
-    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(2)
+    (a1, a2), (b1, b2) = box1.float().unsqueeze(-2).chunk(2, -1), box2.float().unsqueeze(-3).chunk(2, -1)
+    inter = (torch.min(a2, b2) - torch.max(a1, b1)).clamp_(0).prod(-1)
 
     # IoU = inter / (area1 + area2 - inter)
-    return inter / ((a2 - a1).prod(2) + (b2 - b1).prod(2) - inter + eps)
+    return inter / ((a2 - a1).prod(-1) + (b2 - b1).prod(-1) - inter + eps)
 
 
 def bbox_iou(box1, box2, xywh=True, GIoU=False, DIoU=False, CIoU=False, eps=1e-7):
@@ -282,6 +283,55 @@ def smooth_BCE(eps=0.1):
     return 1.0 - 0.5 * eps, 0.5 * eps
 
 
+class StatBuffer:
+    """
+    A preallocated tensor that validation statistics are appended to, grown geometrically when full.
+
+    Rows are copied into place as they arrive instead of being collected as many small tensors and concatenated at the
+    end, and the row offset of every image is recorded so that per-image statistics can still be recovered.
+
+    Attributes:
+        data (torch.Tensor | None): The storage, allocated on the first append like the appended rows.
+        n (int): Number of rows in use.
+        offsets (list): Row offset of every appended image, starting with 0.
+    """
+
+    def __init__(self, capacity=1024):
+        """Initialize an empty buffer that allocates room for at least `capacity` rows on the first append."""
+        self.capacity = capacity
+        self.data = None
+        self.n = 0
+        self.offsets = [0]
+
+    def __len__(self):
+        """Return the number of appended images."""
+        return len(self.offsets) - 1
+
+    def append(self, x, counts=None):
+        """
+        Append the rows of one image, or of several consecutive images.
+
+        Args:
+            x (torch.Tensor): The rows to append, of shape (n, ...).
+            counts (list, optional): Number of rows of each image in `x`, if `x` holds several images.
+        """
+        n = self.n + len(x)
+        dtype = x.dtype if self.data is None else torch.promote_types(self.data.dtype, x.dtype)
+        if self.data is None or n > len(self.data) or dtype != self.data.dtype:
+            size = max(n, self.capacity if self.data is None else 2 * len(self.data))
+            data = x.new_empty((size, *x.shape[1:]), dtype=dtype)
+            if self.data is not None:
+                data[: self.n] = self.data[: self.n]
+            self.data = data
+        self.data[self.n : n] = x
+        self.n = n
+        self.offsets.extend((self.offsets[-1] + np.cumsum(counts, dtype=int)).tolist() if counts is not None else [n])
+
+    def tensor(self):
+        """Return a view of the rows in use."""
+        return torch.zeros(0) if self.data is None else self.data[: self.n]
+
+
 class ConfusionMatrix:
     """
     A class for calculating and updating a confusion matrix for object detection and classification tasks.
@@ -519,7 +569,7 @@ def compute_ap(recall, precision):
     method = "interp"  # methods: 'continuous', 'interp'
     if method == "interp":
         x = np.linspace(0, 1, 101)  # 101-point interp (COCO)
-        ap = np.trapz(np.interp(x, mrec, mpre), x)  # integrate
+        ap = trapezoid(np.interp(x, mrec, mpre), x)  # integrate
     else:  # 'continuous'
         i = np.where(mrec[1:] != mrec[:-1])[0]  # points where x-axis (recall) changes
         ap = np.sum((mrec[i + 1] - mrec[i]) * mpre[i + 1])  # area under curve
@@ -528,7 +578,7 @@ def compute_ap(recall, precision):
 
 
 def ap_per_class(
-    tp, conf, pred_cls, target_cls, plot=False, on_plot=None, save_dir=Path(), names=(), eps=1e-16, prefix=""
+    tp, conf, pred_cls, target_cls, plot=False, on_plot=None, save_dir=Path(), names=(), eps=1e-16, prefix="", n=None
 ):
     """
     Computes the average precision per class for object detection evaluation.
@@ -544,6 +594,8 @@ def ap_per_class(
         names (tuple, optional): Tuple of class names to plot PR curves. Defaults to an empty tuple.
         eps (float, optional): A small value to avoid division by zero. Defaults to 1e-16.
         prefix (str, optional): A prefix string for saving the plot files. Defaults to an empty string.
+        n (np.ndarray, optional): Number of detections each row stands for, with `tp` holding true positive counts,
+            i.e. the histogram bins of APHistogram.stats(). Defaults to one detection per row.
 
     Returns:
         (tuple): A tuple of six arrays and one array of unique classes, where:
@@ -564,6 +616,7 @@ def ap_per_class(
     # Sort by objectness
     i = np.argsort(-conf)
     tp, conf, pred_cls = tp[i], conf[i], pred_cls[i]
+    n = np.ones(len(i), dtype=int) if n is None else n[i]
 
     # Find unique classes
     unique_classes, nt = np.unique(target_cls, return_counts=True)
@@ -582,7 +635,7 @@ def ap_per_class(
             continue
 
         # Accumulate FPs and TPs
-        fpc = (1 - tp[i]).cumsum(0)
+        fpc = (n[i, None] - tp[i]).cumsum(0)
         tpc = tp[i].cumsum(0)
 
         # Recall
@@ -618,6 +671,45 @@ def ap_per_class(
     return tp, fp, p, r, f1, ap, unique_classes.astype(int), p_curve, r_curve, f1_curve, x, prec_values
 
 
+class APHistogram:
+    """
+    Streaming per-class confidence histograms of predictions and true positives, for mAP without storing predictions.
+
+    Predictions are counted into `bins` equal-width confidence bins per class as batches arrive, so memory and the final
+    ap_per_class() call scale with classes x bins instead of with the number of predictions of the dataset. Predictions
+    in one bin are treated as tied: AP is exact when no bin holds both true and false positives of a class, otherwise
+    the error of a class is bounded by the recall of such bins times the precision spread inside them, which shrinks as
+    `bins` grows.
+
+    Attributes:
+        bins (int): Number of confidence bins.
+        n (torch.Tensor): Prediction counts of shape (nc, bins).
+        tp (torch.Tensor): True positive counts of shape (nc, bins, niou).
+    """
+
+    def __init__(self, nc, niou=10, bins=1000, device=None):
+        """Initialize empty histograms for `nc` classes and `niou` IoU thresholds."""
+        self.bins = bins
+        self.n = torch.zeros((nc, bins), dtype=torch.int32, device=device)
+        self.tp = torch.zeros((nc, bins, niou), dtype=torch.int32, device=device)
+
+    def update(self, tp, conf, pred_cls):
+        """Count predictions with correct matrix `tp` of shape (N, niou) and confidences and classes of shape (N,)."""
+        i = pred_cls.long() * self.bins + (conf.float() * self.bins).long().clamp_(0, self.bins - 1)
+        self.n.view(-1).index_add_(0, i, torch.ones_like(i, dtype=self.n.dtype))
+        self.tp.view(-1, self.tp.shape[2]).index_add_(0, i, tp.to(self.tp.dtype))
+
+    def stats(self):
+        """Return the non-empty bins as ap_per_class() tp, conf, pred_cls and n arrays, with conf the lower bin edge."""
+        c, b = torch.nonzero(self.n, as_tuple=True)
+        return {
+            "tp": self.tp[c, b].cpu().numpy(),
+            "conf": (b.float() / self.bins).cpu().numpy(),
+            "pred_cls": c.float().cpu().numpy(),
+            "n": self.n[c, b].cpu().numpy(),
+        }
+
+
 class Metric(SimpleClass):
     """
     Class for computing evaluation metrics for YOLOv8 model.
@@ -832,8 +924,8 @@ class DetMetrics(SimpleClass):
         self.speed = {"preprocess": 0.0, "inference": 0.0, "loss": 0.0, "postprocess": 0.0}
         self.task = "detect"
 
-    def process(self, tp, conf, pred_cls, target_cls):
-        """Process predicted results for object detection and update metrics."""
+    def process(self, tp, conf, pred_cls, target_cls, n=None):
+        """Process predicted results for object detection and update metrics, `n` counts binned predictions."""
         results = ap_per_class(
             tp,
             conf,
@@ -843,6 +935,7 @@ class DetMetrics(SimpleClass):
             save_dir=self.save_dir,
             names=self.names,
             on_plot=self.on_plot,
+            n=n,
         )[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
@@ -1230,8 +1323,8 @@ class OBBMetrics(SimpleClass):
         self.box = Metric()
         self.speed = {"preprocess": 0.0, "inference": 0.0, "loss": 0.0, "postprocess": 0.0}
 
-    def process(self, tp, conf, pred_cls, target_cls):
-        """Process predicted results for object detection and update metrics."""
+    def process(self, tp, conf, pred_cls, target_cls, n=None):
+        """Process predicted results for object detection and update metrics, `n` counts binned predictions."""
         results = ap_per_class(
             tp,
             conf,
@@ -1241,6 +1334,7 @@ class OBBMetrics(SimpleClass):
             save_dir=self.save_dir,
             names=self.names,
             on_plot=self.on_plot,
+            n=n,
         )[2:]
         self.box.nc = len(self.names)
         self.box.update(results)
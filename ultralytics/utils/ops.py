@@ -123,6 +123,33 @@ def scale_boxes(img1_shape, boxes, img0_shape, ratio_pad=None, padding=True, xyw
     return clip_boxes(boxes, img0_shape)
 
 
+def tile_offsets(shape, tile=640, overlap=0.2):
+    """
+    Compute the top-left corners of overlapping square tiles covering an image.
+
+    Tiles are spaced by tile * (1 - overlap) and the last row and column are shifted to end on the image border, so
+    every tile has the same size of min(tile, h) x min(tile, w).
+
+    Args:
+        shape (tuple): The shape of the image, in the format of (height, width).
+        tile (int): The tile size in pixels. Defaults to 640
+        overlap (float): The overlap between neighbouring tiles as a fraction of the tile size, between 0.0 and 0.9.
+            Defaults to 0.2
+
+    Returns:
+        (list[tuple]): The (x, y) top-left corner of each tile, in row-major order.
+    """
+    assert 0 <= overlap <= 0.9, f"Invalid tile overlap {overlap}, valid values are between 0.0 and 0.9"
+    step = max(round(tile * (1 - overlap)), 1)
+    starts = []
+    for n in shape[:2]:
+        s = list(range(0, max(n - tile, 0) + 1, step))
+        if s[-1] + tile < n:
+            s.append(n - tile)  # last tile ends on the image border
+        starts.append(s)
+    return [(x, y) for y in starts[0] for x in starts[1]]
+
+
 def make_divisible(x, divisor):
     """
     Returns the nearest number that is divisible by the given divisor.
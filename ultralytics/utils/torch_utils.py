@@ -1,9 +1,11 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
 import gc
+import io
 import math
 import os
 import random
+import threading
 import time
 from contextlib import contextmanager
 from copy import deepcopy
@@ -464,30 +466,56 @@ class ModelEMA:
 
     For EMA details see https://www.tensorflow.org/api_docs/python/tf/train/ExponentialMovingAverage
 
+    Floating point tensors of the EMA and the model are collected into lists grouped by device and dtype once, and
+    updated with multi-tensor `torch._foreach_*` ops instead of per-tensor Python ops. With `every` > 1 the average is
+    only applied every `every` updates using the product of the skipped decays, which is exact while the model is
+    unchanged and lags the per-step EMA by at most `every - 1` steps.
+
     To disable EMA set the `enabled` attribute to `False`.
     """
 
-    def __init__(self, model, decay=0.9999, tau=2000, updates=0):
+    def __init__(self, model, decay=0.9999, tau=2000, updates=0, every=1):
         """Initialize EMA for 'model' with given arguments."""
         self.ema = deepcopy(de_parallel(model)).eval()  # FP32 EMA
         self.updates = updates  # number of EMA updates
         self.decay = lambda x: decay * (1 - math.exp(-x / tau))  # decay exponential ramp (to help early epochs)
+        self.every = max(int(every), 1)  # apply the average every 'every' updates
+        self.pending = 1.0  # product of decays since the last applied update
+        self.groups = []  # list of (EMA tensors, model tensors) grouped by device and dtype
+        self.groups_key = None
         for p in self.ema.parameters():
             p.requires_grad_(False)
         self.enabled = True
 
+    def _groups(self, model):
+        """Return cached tensor groups, rebuilt when the model or a storage changes, e.g. after `half()` or `to()`."""
+        params = (next(model.parameters(), None), next(self.ema.parameters(), None))
+        key = (id(model), *(None if p is None else p.data_ptr() for p in params))
+        if key != self.groups_key:
+            msd = model.state_dict()  # model state_dict
+            groups = {}
+            for k, v in self.ema.state_dict().items():
+                if v.dtype.is_floating_point:  # true for FP16 and FP32
+                    g = groups.setdefault((v.device, v.dtype, msd[k].dtype), ([], []))
+                    g[0].append(v)
+                    g[1].append(msd[k].detach())
+            self.groups, self.groups_key = list(groups.values()), key
+        return self.groups
+
     def update(self, model):
         """Update EMA parameters."""
         if self.enabled:
             self.updates += 1
-            d = self.decay(self.updates)
+            self.pending *= self.decay(self.updates)
+            if self.updates % self.every:
+                return
+            d, self.pending = self.pending, 1.0
 
-            msd = de_parallel(model).state_dict()  # model state_dict
-            for k, v in self.ema.state_dict().items():
-                if v.dtype.is_floating_point:  # true for FP16 and FP32
-                    v *= d
-                    v += (1 - d) * msd[k].detach()
-                    # assert v.dtype == msd[k].dtype == torch.float32, f'{k}: EMA {v.dtype},  model {msd[k].dtype}'
+            for e, m in self._groups(de_parallel(model)):
+                if e[0].dtype != m[0].dtype:
+                    m = [x.to(e[0].dtype) for x in m]
+                torch._foreach_mul_(e, d)
+                torch._foreach_add_(e, m, alpha=1 - d)
 
     def update_attr(self, model, include=(), exclude=("process_group", "reducer")):
         """Updates attributes and saves stripped model with optimizer removed."""
@@ -553,6 +581,7 @@ def strip_optimizer(f: Union[str, Path] = "best.pt", s: str = "") -> None:
     # x['model'].args = x['train_args']
 
     # Save
+    Path(s or f).unlink(missing_ok=True)  # break hardlinks between checkpoints, i.e. best.pt linked to last.pt
     torch.save({**updates, **x}, s or f, use_dill=False)  # combine dicts (prefer to the right)
     mb = os.path.getsize(s or f) / 1e6  # file size
     LOGGER.info(f"Optimizer stripped from {f},{f' saved as {s},' if s else ''} {mb:.1f}MB")
@@ -632,6 +661,48 @@ def profile(input, ops, n=10, device=None):
     return results
 
 
+def profile_ema(model, n=100, every=(1, 4), device=None):
+    """
+    Ultralytics ModelEMA step-time profiler, comparing the per-tensor state_dict update with foreach updates.
+
+    Example:
+        ```python
+        from ultralytics import YOLO
+        from ultralytics.utils.torch_utils import profile_ema
+
+        profile_ema(YOLO('yolov8n.yaml').model, n=100, every=(1, 4))
+        ```
+    """
+    if not isinstance(device, torch.device):
+        device = select_device(device)
+    model = deepcopy(de_parallel(model)).to(device).float()
+
+    def reference(ema, model):
+        """Per-tensor EMA update over freshly built state_dicts, as a baseline."""
+        ema.updates += 1
+        d = ema.decay(ema.updates)
+        msd = model.state_dict()
+        for k, v in ema.ema.state_dict().items():
+            if v.dtype.is_floating_point:
+                v *= d
+                v += (1 - d) * msd[k].detach()
+
+    results = {}
+    LOGGER.info(f"{'EMA update':>24s}{'tensors':>12s}{'step (ms)':>12s}")
+    for name, k in [("state_dict", 1)] + [(f"foreach every={k}", k) for k in every]:
+        ema = ModelEMA(model, every=k)
+        fn, args = (reference, (ema, model)) if name == "state_dict" else (ema.update, (model,))
+        for _ in range(max(k, 3)):  # warmup, builds cached tensor groups
+            fn(*args)
+        t0 = time_sync()
+        for _ in range(n):
+            fn(*args)
+        results[name] = (time_sync() - t0) * 1000 / n  # ms per step
+        nt = sum(len(e) for e, _ in ema._groups(model))
+        LOGGER.info(f"{name:>24s}{nt:12}{results[name]:12.4g}")
+    return results
+
+
 class EarlyStopping:
     """Early stopping class that stops training when a specified number of epochs have passed without improvement."""
 
@@ -643,17 +714,21 @@ class EarlyStopping:
             patience (int, optional): Number of epochs to wait after fitness stops improving before stopping.
         """
         self.best_fitness = 0.0  # i.e. mAP
+        self.best_subset = 0.0  # best fitness on validation subset epochs, not comparable to full validation
         self.best_epoch = 0
         self.patience = patience or float("inf")  # epochs to wait after fitness stops improving to stop
         self.possible_stop = False  # possible stop may occur next epoch
 
-    def __call__(self, epoch, fitness):
+    def __call__(self, epoch, fitness, tolerance=0.0, subset=False):
         """
         Check whether to stop training.
 
         Args:
             epoch (int): Current epoch of training
             fitness (float): Fitness value of current epoch
+            tolerance (float): Noise tolerance, fitness within this of the best counts as no worse
+            subset (bool): Whether fitness was measured on a validation subset, which is compared against the best
+                subset fitness only so that noisy subset scores never raise the bar for full validation epochs
 
         Returns:
             (bool): True if training should stop, False otherwise
@@ -661,9 +736,13 @@ class EarlyStopping:
         if fitness is None:  # check if fitness=None (happens when val=False)
             return False
 
-        if fitness >= self.best_fitness:  # >= 0 to allow for early zero-fitness stage of training
+        best = self.best_subset if subset else self.best_fitness
+        if fitness >= best - tolerance:  # >= 0 to allow for early zero-fitness stage of training
             self.best_epoch = epoch
-            self.best_fitness = fitness
+            if subset:
+                self.best_subset = max(fitness, self.best_subset)
+            else:
+                self.best_fitness = max(fitness, self.best_fitness)
         delta = epoch - self.best_epoch  # epochs without improvement
         self.possible_stop = delta >= (self.patience - 1)  # possible stop may occur next epoch
         stop = delta >= self.patience  # stop training if patience exceeded
@@ -676,3 +755,252 @@ class EarlyStopping:
                 f"i.e. `patience=300` or use `patience=0` to disable EarlyStopping."
             )
         return stop
+
+
+class TrainMeter:
+    """
+    Training loop meter that accumulates loss items on device and only synchronizes with the host every `sync_every`
+    steps or when explicitly requested, e.g. at epoch end.
+
+    Attributes:
+        sync_every (int): Number of steps between host synchronizations.
+        tloss (torch.Tensor): Mean loss items of the current epoch as of the last sync, on CPU.
+        syncs (int): Number of host synchronizations in the current epoch.
+        metrics (dict): Structured throughput metrics as of the last sync, i.e. 'train/images_per_s',
+            'train/data_time' and 'train/compute_time' (seconds in the epoch), 'train/data_fraction' and 'train/syncs'.
+
+    Note:
+        Steps are timed on the host without synchronizing, so with asynchronous CUDA execution compute time is only
+        attributed correctly across a sync window, while data time is the time spent blocked waiting for a batch.
+    """
+
+    def __init__(self, sync_every=10):
+        """Initialize the meter, syncing every 'sync_every' steps."""
+        self.sync_every = max(int(sync_every), 1)
+        self.reset()
+
+    def reset(self):
+        """Reset accumulators at the start of an epoch."""
+        self.loss_sum = None
+        self.steps = 0
+        self.images = 0
+        self.synced_steps = 0
+        self.syncs = 0
+        self.data_time = 0.0
+        self.compute_time = 0.0
+        self.tloss = None
+        self.metrics = {}
+        self.t0 = self.t = self.t_data = time.perf_counter()  # epoch start, last step end, last batch ready
+
+    def data_ready(self):
+        """Mark that a batch was received, accounting the time since the last step as data wait."""
+        self.t_data = time.perf_counter()
+        self.data_time += self.t_data - self.t
+
+    def update(self, loss_items, images):
+        """Accumulate the loss items of a step on device and count its 'images' without synchronizing."""
+        loss_items = loss_items.detach()
+        self.loss_sum = loss_items.clone() if self.loss_sum is None else self.loss_sum.add_(loss_items)
+        self.steps += 1
+        self.images += images
+
+    def step(self):
+        """Mark the end of a step, accounting the time since its batch was received as compute."""
+        self.t = time.perf_counter()
+        self.compute_time += self.t - self.t_data
+
+    def due(self):
+        """Return True if a sync is due after the current step."""
+        return self.steps - self.synced_steps >= self.sync_every
+
+    def sync(self):
+        """Copy the mean loss items to the host and update throughput metrics, returns the mean loss items."""
+        if self.steps and self.steps != self.synced_steps:
+            self.tloss = (self.loss_sum / self.steps).cpu()  # single device to host transfer
+            self.synced_steps = self.steps
+            self.syncs += 1
+            elapsed = max(self.t - self.t0, 1e-9)
+            self.metrics = {
+                "train/images_per_s": self.images / elapsed,
+                "train/data_time": self.data_time,
+                "train/compute_time": self.compute_time,
+                "train/data_fraction": self.data_time / elapsed,
+                "train/syncs": self.syncs,
+            }
+        return self.tloss
+
+
+class TrainTimeline:
+    """
+    Per-iteration timer of training loop stages, used to find whether the dataloader or the model is the bottleneck.
+
+    Each call to `mark(stage)` synchronizes CUDA and adds the time since the previous mark to that stage of the current
+    iteration, a new iteration starts with the 'data' stage, i.e. the time blocked waiting for the next batch. Stage
+    times of an epoch are saved to 'timeline/epoch{n}.csv' in milliseconds and summarized with suggestions.
+
+    Attributes:
+        enabled (bool): Whether to time stages, `mark()` is a no-op otherwise.
+        save_dir (Path): Directory to save timeline files to.
+        rows (list): Stage times in seconds of each iteration of the current epoch.
+
+    Note:
+        Synchronizing after every stage adds overhead on CUDA devices, so only enable it to diagnose throughput.
+    """
+
+    stages = ("data", "preprocess", "forward", "backward", "optimizer", "other")
+
+    def __init__(self, save_dir, enabled=True):
+        """Initialize the timeline, saving epoch timelines to 'save_dir/timeline'."""
+        self.enabled = enabled
+        self.save_dir = Path(save_dir) / "timeline"
+        self.rows = []
+        self.t = 0.0
+
+    def start(self):
+        """Start timing an epoch, call right before iterating the dataloader."""
+        self.rows = []
+        self.t = time_sync() if self.enabled else 0.0
+
+    def mark(self, stage):
+        """Add the time since the previous mark to 'stage', starting a new iteration on 'data'."""
+        if not self.enabled:
+            return
+        t = time_sync()
+        if stage == "data" or not self.rows:
+            self.rows.append([0.0] * len(self.stages))
+        self.rows[-1][self.stages.index(stage)] += t - self.t
+        self.t = t
+
+    def report(self, epoch, args=None):
+        """Save the epoch timeline and log mean stage times with the bottleneck and suggestions, returns the means."""
+        if not self.enabled or not self.rows:
+            return {}
+        x = np.array(self.rows) * 1000  # ms
+        self.save_dir.mkdir(parents=True, exist_ok=True)
+        file = self.save_dir / f"epoch{epoch + 1}.csv"
+        np.savetxt(file, x, fmt="%.2f", delimiter=",", header=",".join(self.stages), comments="")
+        mean = dict(zip(self.stages, x[1:].mean(0) if len(x) > 1 else x[0]))  # skip first iteration, i.e. warmup
+        total = sum(mean.values()) or 1e-9
+        prefix = colorstr("Timeline: ")
+        times = ", ".join(f"{k} {v:.1f}ms ({v / total:.0%})" for k, v in mean.items())
+        LOGGER.info(f"{prefix}epoch {epoch + 1} mean per iteration {times}, saved to {file}")
+        bottleneck, tips = self.suggest(mean, args)
+        LOGGER.info(f"{prefix}{bottleneck} bound" + (", try " + "; ".join(tips) if tips else ""))
+        return mean
+
+    @staticmethod
+    def suggest(mean, args=None):
+        """Return the bottleneck of mean stage times and a list of suggestions, based on training 'args'."""
+        total = sum(mean.values()) or 1e-9
+        share = {k: v / total for k, v in mean.items()}
+        tips = []
+        if share["data"] > 0.3:
+            if args is not None:
+                if args.workers < (os.cpu_count() or 1):
+                    tips.append(f"more dataloader 'workers' (now {args.workers}, {os.cpu_count()} CPUs)")
+                if not args.cache:
+                    tips.append("'cache=ram' or 'cache=disk' to skip image decoding")
+                tips.append(f"a smaller 'imgsz' (now {args.imgsz}) or less augmentation, i.e. 'mosaic=0'")
+            return "dataloader", tips
+        if share["preprocess"] > 0.15:
+            tips.append("pinned memory (PIN_MEMORY=True) for faster host to device copies")
+            if args is not None:
+                tips.append(f"a smaller 'imgsz' (now {args.imgsz})")
+            return "host to device copy", tips
+        if share["optimizer"] > 0.25:
+            if args is not None:
+                tips.append(f"a larger 'nbs' (now {args.nbs}) to accumulate gradients over more batches")
+            return "optimizer", tips
+        if args is not None and not args.amp:
+            tips.append("'amp=True' for mixed precision")
+        return "compute", tips
+
+
+class CheckpointWriter:
+    """
+    Writes training checkpoints, optionally serializing and writing them on a background thread.
+
+    A checkpoint is serialized once and written to its first file with an atomic rename, further files (i.e. 'best.pt'
+    when it equals 'last.pt') are hardlinked to it instead of being written again. In background mode `save()` only
+    snapshots CUDA tensors to pinned CPU memory with non-blocking copies and returns, a thread waits for the copies,
+    then serializes and writes. Only one checkpoint is in flight, so `save()` first waits for the previous write.
+
+    Attributes:
+        background (bool): Whether to serialize and write checkpoints on a background thread.
+        thread (threading.Thread): Thread writing the checkpoint in flight, if any.
+        errors (list): Exceptions raised on the background thread, re-raised by the next `wait()`.
+
+    Note:
+        Atomic renames keep readers from seeing partially written files, but until `wait()` returns the files may
+        still hold the previous checkpoint.
+    """
+
+    def __init__(self, background=True):
+        """Initialize the writer, writing on a background thread if 'background' is True."""
+        self.background = background
+        self.thread = None
+        self.errors = []
+
+    def save(self, ckpt, files):
+        """Save the checkpoint dictionary 'ckpt' to all 'files', in the background if enabled."""
+        self.wait()
+        if not self.background:
+            return self.write(ckpt, files)
+        ckpt = self.snapshot(ckpt)
+        event = None
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
+            event = torch.cuda.Event()
+            event.record()  # marks completion of the non-blocking copies
+        self.thread = threading.Thread(target=self._run, args=(ckpt, files, event))
+        self.thread.start()
+
+    def wait(self):
+        """Wait for the checkpoint in flight to be written, re-raising an error of the background thread."""
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def _run(self, ckpt, files, event=None):
+        """Write 'ckpt' on the background thread once the snapshot copies of 'event' completed."""
+        try:
+            if event is not None:
+                event.synchronize()
+            self.write(ckpt, files)
+        except Exception as e:
+            self.errors.append(e)
+
+    @staticmethod
+    def snapshot(x):
+        """Return 'x' (a module, tensor or nested dict, list or tuple) with CUDA tensors copied to pinned CPU memory."""
+        if isinstance(x, nn.Module):
+            return x._apply(CheckpointWriter.snapshot)  # in place, 'x' must be a copy owned by the checkpoint
+        if isinstance(x, torch.Tensor):
+            if not x.is_cuda:
+                return x
+            return torch.empty(x.shape, dtype=x.dtype, pin_memory=True).copy_(x, non_blocking=True)
+        if isinstance(x, dict):
+            return {k: CheckpointWriter.snapshot(v) for k, v in x.items()}
+        if isinstance(x, (list, tuple)):
+            return type(x)(CheckpointWriter.snapshot(v) for v in x)
+        return x
+
+    @staticmethod
+    def write(ckpt, files):
+        """Serialize 'ckpt' once, write it to the first of 'files' and hardlink the others to it."""
+        buffer = io.BytesIO()
+        torch.save(ckpt, buffer)
+        data = buffer.getvalue()
+        first, *others = map(Path, files)
+        tmp = first.with_name(f".{first.name}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, first)  # atomic, replacing keeps files previously linked to 'first' unchanged
+        for f in others:
+            tmp = f.with_name(f".{f.name}.tmp")
+            tmp.unlink(missing_ok=True)
+            try:
+                os.link(first, tmp)  # same content as the first file, no need to write it again
+            except OSError:  # filesystem without hardlinks
+                tmp.write_bytes(data)
+            os.replace(tmp, f)